@@ -0,0 +1,26 @@
+from rest_framework import serializers
+
+BATCH_MAX_REQUESTS = 20
+
+
+class BatchEntrySerializer(serializers.Serializer):
+    """
+    Serializer for one sub-request of a batch.
+    """
+    method = serializers.ChoiceField(
+        choices=['GET', 'POST', 'PUT', 'PATCH', 'DELETE'])
+    url = serializers.CharField(max_length=2000)
+    body = serializers.JSONField(required=False)
+
+    def to_internal_value(self, data):
+        if isinstance(data, dict) and isinstance(data.get('method'), str):
+            data = {**data, 'method': data['method'].upper()}
+        return super().to_internal_value(data)
+
+
+class BatchSerializer(serializers.Serializer):
+    """
+    Serializer for a batch of sub-requests.
+    """
+    requests = BatchEntrySerializer(
+        many=True, allow_empty=False, max_length=BATCH_MAX_REQUESTS)
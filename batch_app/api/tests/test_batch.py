@@ -0,0 +1,159 @@
+from django.contrib.auth import get_user_model
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient, APITestCase
+
+from offers_app.models import Offer, OfferDetail
+from users_app.models import Profile
+
+User = get_user_model()
+
+
+def create_offer_details(user):
+    offer = Offer.objects.create(
+        title="Test Offer",
+        image=None,
+        description="Test offer description",
+        user=user
+    )
+    return [
+        OfferDetail.objects.create(
+            offer=offer, title=offer_type, revisions=1, delivery_time_in_days=3,
+            price=price, features=[], offer_type=offer_type)
+        for offer_type, price in [('basic', 50), ('standard', 100), ('premium', 150)]
+    ]
+
+
+class BatchTests(APITestCase):
+    """
+    Test suite for the batch endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up the test case.
+        """
+        self.url = reverse('batch')
+        self.business_user = User.objects.create_user(
+            username="business",
+            email="business@mail.de",
+            password="password123",
+            type="business"
+        )
+        Profile.objects.create(user=self.business_user)
+        self.customer_user = User.objects.create_user(
+            username="customer",
+            email="customer@mail.de",
+            password="password123",
+            type="customer"
+        )
+        Profile.objects.create(user=self.customer_user)
+        self.details = create_offer_details(self.business_user)
+
+    def test_batch_returns_responses_in_order(self):
+        """
+        Test that the responses of all sub-requests are returned in request order.
+        """
+        self.client.force_authenticate(user=self.customer_user)
+        requests = [{'method': 'GET', 'url': '/api/base-info/'}]
+        requests += [{'method': 'get', 'url': f'/api/offerdetails/{detail.id}/'}
+                     for detail in self.details]
+        requests.append(
+            {'method': 'GET', 'url': f'/api/profile/{self.business_user.id}/?fields=user,username'})
+        response = self.client.post(self.url, {'requests': requests}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        responses = response.data['responses']
+        self.assertEqual([entry['status'] for entry in responses], [200] * 5)
+        self.assertEqual(responses[0]['body']['offer_count'], 1)
+        self.assertEqual([entry['body']['id'] for entry in responses[1:4]],
+                         [detail.id for detail in self.details])
+        self.assertEqual(responses[4]['body'], {
+            'user': self.business_user.id, 'username': 'business'})
+
+    def test_batch_uses_shared_authentication(self):
+        """
+        Test that sub-requests run as the user of the batch request.
+        """
+        token = Token.objects.create(user=self.customer_user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        requests = [
+            {'method': 'POST', 'url': '/api/orders/',
+             'body': {'offer_detail_id': self.details[0].id}},
+            {'method': 'GET', 'url': '/api/orders/'},
+        ]
+        response = self.client.post(self.url, {'requests': requests}, format='json')
+        responses = response.data['responses']
+        self.assertEqual(responses[0]['status'], status.HTTP_201_CREATED)
+        self.assertEqual(responses[1]['status'], status.HTTP_200_OK)
+        self.assertEqual(len(responses[1]['body']), 1)
+        self.assertEqual(responses[1]['body'][0]['customer_user'],
+                         self.customer_user.id)
+
+    def test_batch_checks_permissions_per_request(self):
+        """
+        Test that anonymous sub-requests of protected endpoints are rejected.
+        """
+        requests = [
+            {'method': 'GET', 'url': '/api/base-info/'},
+            {'method': 'GET', 'url': f'/api/offerdetails/{self.details[0].id}/'},
+        ]
+        response = self.client.post(self.url, {'requests': requests}, format='json')
+        self.assertEqual([entry['status'] for entry in response.data['responses']],
+                         [status.HTTP_200_OK, status.HTTP_401_UNAUTHORIZED])
+
+    def test_batch_unknown_and_forbidden_urls(self):
+        """
+        Test that unknown, non-API, nested batch and streaming URLs are rejected per entry.
+        """
+        self.client.force_authenticate(user=self.customer_user)
+        requests = [
+            {'method': 'GET', 'url': '/api/unknown/'},
+            {'method': 'GET', 'url': '/admin/'},
+            {'method': 'POST', 'url': '/api/batch/', 'body': {'requests': []}},
+            {'method': 'GET', 'url': '/api/orders/stream/'},
+        ]
+        response = self.client.post(self.url, {'requests': requests}, format='json')
+        self.assertEqual([entry['status'] for entry in response.data['responses']],
+                         [404, 400, 400, 400])
+        self.assertEqual(response.data['responses'][3]['body'],
+                         {'detail': 'Streaming endpoints cannot be batched.'})
+
+    def test_batch_invalid_payload(self):
+        """
+        Test that empty batches and unsupported methods are rejected.
+        """
+        for requests in [[], [{'method': 'TRACE', 'url': '/api/base-info/'}]]:
+            response = self.client.post(
+                self.url, {'requests': requests}, format='json')
+            self.assertEqual(response.status_code,
+                             status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(BATCH_MAX_WORKERS=4)
+class BatchConcurrencyTests(TransactionTestCase):
+    """
+    Test suite for running the GET requests of a batch concurrently.
+    """
+
+    def test_concurrent_reads(self):
+        """
+        Test that concurrently executed reads return their responses in order.
+        """
+        business_user = User.objects.create_user(
+            username="business",
+            email="business@mail.de",
+            password="password123",
+            type="business"
+        )
+        details = create_offer_details(business_user)
+        client = APIClient()
+        client.force_authenticate(user=business_user)
+        requests = [{'method': 'GET', 'url': f'/api/offerdetails/{detail.id}/'}
+                    for detail in details * 2]
+        response = client.post(reverse('batch'), {'requests': requests}, format='json')
+        responses = response.data['responses']
+        self.assertEqual([entry['status'] for entry in responses], [200] * 6)
+        self.assertEqual([entry['body']['id'] for entry in responses],
+                         [detail.id for detail in details * 2])
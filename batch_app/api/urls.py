@@ -0,0 +1,7 @@
+from django.urls import path
+
+from batch_app.api import views
+
+urlpatterns = [
+    path('batch/', views.BatchView.as_view(), name='batch'),
+]
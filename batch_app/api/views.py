@@ -0,0 +1,22 @@
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from batch_app.api.serializers import BatchSerializer
+from batch_app.dispatch import run_batch
+
+
+class BatchView(APIView):
+    """
+    View to run several API requests in one round trip.
+
+    Every sub-request is authenticated as the batch request and checks its own
+    permissions. The responses are returned in the order of the requests.
+    """
+    permission_classes = [AllowAny]
+
+    def post(self, request, format=None):
+        serializer = BatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        responses = run_batch(request, serializer.validated_data['requests'])
+        return Response({'responses': responses})
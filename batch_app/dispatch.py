@@ -0,0 +1,127 @@
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import connection, connections
+from django.urls import Resolver404, resolve, reverse
+
+logger = logging.getLogger(__name__)
+
+CONCURRENT_METHODS = ['GET']
+
+
+def build_sub_request(request, method, url, body=None):
+    """
+    Build a request for one batch entry that shares the caller's authentication.
+
+    The headers of the batch request are reused, and the user and token it was
+    authenticated with are forced onto the sub-request, so sub-requests do not
+    authenticate again. Anonymous sub-requests keep the regular authentication.
+    """
+    parts = urlsplit(url)
+    content = b'' if body is None else json.dumps(body).encode()
+    environ = {
+        key: value for key, value in request.META.items()
+        if key not in ['wsgi.input', 'CONTENT_LENGTH', 'CONTENT_TYPE']
+    }
+    environ.update({
+        'REQUEST_METHOD': method,
+        'PATH_INFO': parts.path,
+        'QUERY_STRING': parts.query,
+        'CONTENT_TYPE': 'application/json',
+        'CONTENT_LENGTH': str(len(content)),
+        'HTTP_ACCEPT': 'application/json',
+        'wsgi.input': BytesIO(content),
+    })
+    sub_request = WSGIRequest(environ)
+    if request.user.is_authenticated:
+        sub_request._force_auth_user = request.user
+        sub_request._force_auth_token = request.auth
+    return sub_request
+
+
+def run_sub_request(request, entry):
+    """
+    Resolve and call the view of one batch entry and return its status and body.
+
+    Views marked with streaming = True are rejected without being called;
+    a streaming response of any other view is closed and rejected as well.
+    """
+    path = urlsplit(entry['url']).path
+    if not path.startswith('/api/') or path == reverse('batch'):
+        return {'status': 400, 'body': {'detail': 'Only /api/ endpoints can be batched.'}}
+    try:
+        match = resolve(path)
+    except Resolver404:
+        return {'status': 404, 'body': {'detail': 'Not found.'}}
+    if getattr(getattr(match.func, 'view_class', None), 'streaming', False):
+        return {'status': 400, 'body': {'detail': 'Streaming endpoints cannot be batched.'}}
+    sub_request = build_sub_request(
+        request, entry['method'], entry['url'], entry.get('body'))
+    try:
+        response = match.func(sub_request, *match.args, **match.kwargs)
+    except Exception:
+        logger.exception("Batch request %s %s failed",
+                         entry['method'], entry['url'])
+        return {'status': 500, 'body': {'detail': 'Internal server error.'}}
+    if response.streaming:
+        response.close()
+        return {'status': 400, 'body': {'detail': 'Streaming endpoints cannot be batched.'}}
+    return {'status': response.status_code, 'body': get_response_body(response)}
+
+
+def get_response_body(response):
+    """
+    Get the data of a DRF response, or the decoded content of a plain response.
+    """
+    if hasattr(response, 'data'):
+        return response.data
+    if not response.content:
+        return None
+    if response.get('Content-Type', '').startswith('application/json'):
+        return json.loads(response.content)
+    return response.content.decode(response.charset)
+
+
+def run_batch(request, entries):
+    """
+    Run the batch entries and return their responses in the same order.
+
+    Writes run one after the other in request order. Consecutive GET entries
+    run concurrently on up to BATCH_MAX_WORKERS threads. Inside a transaction,
+    such as with ATOMIC_REQUESTS, everything runs on the calling thread, since
+    other threads' connections could not see the uncommitted changes.
+    """
+    max_workers = settings.BATCH_MAX_WORKERS
+    if connection.in_atomic_block:
+        max_workers = 1
+    results = []
+    group = []
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        for entry in entries + [None]:
+            if entry is not None and entry['method'] in CONCURRENT_METHODS:
+                group.append(entry)
+                continue
+            results.extend(run_reads(request, group, executor, max_workers))
+            group = []
+            if entry is not None:
+                results.append(run_sub_request(request, entry))
+    return results
+
+
+def run_reads(request, entries, executor, max_workers):
+    if max_workers <= 1 or len(entries) <= 1:
+        return [run_sub_request(request, entry) for entry in entries]
+    return list(executor.map(
+        lambda entry: run_in_thread(request, entry), entries))
+
+
+def run_in_thread(request, entry):
+    try:
+        return run_sub_request(request, entry)
+    finally:
+        connections.close_all()
@@ -0,0 +1,74 @@
+import threading
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Send bursts of identical concurrent GET requests, with and without coalescing.
+
+    Every burst starts all requests at once from separate threads, like many
+    clients opening the same page. Reports the time per burst and the number
+    of SQL queries run. Only GET requests are sent, so the database is not
+    changed.
+    """
+    help = 'Benchmark identical concurrent GET requests with single-flight coalescing.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('url', help='API path, e.g. /api/offers/')
+        parser.add_argument('--username', help='Authenticate as this user.')
+        parser.add_argument('--concurrency', type=int, default=50)
+        parser.add_argument('--bursts', type=int, default=5)
+
+    def handle(self, *args, **options):
+        user = None
+        if options['username']:
+            user = User.objects.filter(username=options['username']).first()
+            if user is None:
+                raise CommandError(f"User '{options['username']}' does not exist.")
+        for enabled in [False, True]:
+            with override_settings(SINGLE_FLIGHT_ENABLED=enabled, ALLOWED_HOSTS=['testserver']):
+                elapsed, queries = self.run_bursts(options, user)
+            label = 'single-flight' if enabled else 'independent'
+            self.stdout.write(
+                f"{label}: {elapsed / options['bursts'] * 1000:.0f} ms per burst of "
+                f"{options['concurrency']}, {queries / options['bursts']:.0f} queries per burst")
+
+    def run_bursts(self, options, user):
+        elapsed = 0.0
+        queries = [0]
+        lock = threading.Lock()
+
+        def request(barrier):
+            client = APIClient()
+            if user is not None:
+                client.force_authenticate(user=user)
+            barrier.wait()
+            with CaptureQueriesContext(connection) as captured:
+                response = client.get(options['url'])
+            close_old_connections()
+            with lock:
+                queries[0] += len(captured)
+            if response.status_code != 200:
+                raise CommandError(f"GET {options['url']} returned {response.status_code}.")
+
+        for _ in range(options['bursts']):
+            barrier = threading.Barrier(options['concurrency'] + 1)
+            threads = [threading.Thread(target=request, args=(barrier,))
+                       for _ in range(options['concurrency'])]
+            for thread in threads:
+                thread.start()
+            barrier.wait()
+            start = time.perf_counter()
+            for thread in threads:
+                thread.join()
+            elapsed += time.perf_counter() - start
+        return elapsed, queries[0]
@@ -0,0 +1,72 @@
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+
+
+class Command(BaseCommand):
+    """
+    Compare the first request latency of a fresh process with and without warm up.
+
+    Every round starts new processes, which load the application, optionally
+    run core.warmup.warm_up() and then time their first GET request of each URL.
+    Only GET requests are sent, so the database is not changed.
+    """
+    help = 'Benchmark cold versus warm first request latency.'
+    # System checks import the URLconf, which would warm up the cold process.
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument('urls', nargs='*',
+                            default=['/api/base-info/', '/api/offers/'])
+        parser.add_argument('--rounds', type=int, default=5)
+        parser.add_argument('--child', choices=['cold', 'warm'],
+                            help='Run a single measurement (used internally).')
+
+    def handle(self, *args, **options):
+        if options['child']:
+            self.measure_child(options['child'], options['urls'])
+            return
+        results = {'cold': [], 'warm': []}
+        for _ in range(options['rounds']):
+            for mode in results:
+                results[mode].append(self.run_child(mode, options['urls']))
+        for mode, runs in results.items():
+            warm_up = statistics.median(run['warm_up'] for run in runs)
+            first = statistics.median(run['requests'][0] for run in runs)
+            total = statistics.median(sum(run['requests']) for run in runs)
+            self.stdout.write(
+                f"{mode}: warm up {warm_up * 1000:.1f} ms, first request "
+                f"{first * 1000:.1f} ms, all first requests {total * 1000:.1f} ms")
+
+    def run_child(self, mode, urls):
+        completed = subprocess.run(
+            [sys.executable, sys.argv[0], 'bench_startup',
+                '--child', mode, *urls],
+            capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise CommandError(completed.stderr)
+        return json.loads(completed.stdout.strip().splitlines()[-1])
+
+    @override_settings(ALLOWED_HOSTS=['testserver'])
+    def measure_child(self, mode, urls):
+        from django.core.wsgi import get_wsgi_application
+        get_wsgi_application()
+        warm_up_time = 0
+        if mode == 'warm':
+            from core.warmup import warm_up
+            warm_up_time = warm_up()
+        client = Client()
+        durations = []
+        for url in urls:
+            start = time.perf_counter()
+            response = client.get(url)
+            durations.append(time.perf_counter() - start)
+            if response.status_code >= 500:
+                raise CommandError(f"GET {url} returned {response.status_code}.")
+        self.stdout.write(json.dumps(
+            {'warm_up': warm_up_time, 'requests': durations}))
@@ -0,0 +1,48 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from core.profiling import get_field_stats, reset_field_stats
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Request API endpoints in-process with serializer profiling and list the costliest fields.
+
+    Only GET requests are sent, so the database is not changed.
+    """
+    help = 'Profile the serializer fields of API endpoints.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('urls', nargs='+',
+                            help='API paths, e.g. /api/offers/')
+        parser.add_argument('--username', help='Authenticate as this user.')
+        parser.add_argument('--repeat', type=int, default=3)
+        parser.add_argument('--limit', type=int, default=20)
+
+    @override_settings(SERIALIZER_PROFILING=True, ALLOWED_HOSTS=['testserver'])
+    def handle(self, *args, **options):
+        client = APIClient()
+        if options['username']:
+            try:
+                user = User.objects.get(username=options['username'])
+            except User.DoesNotExist:
+                raise CommandError(
+                    f"User '{options['username']}' does not exist.")
+            client.force_authenticate(user=user)
+        reset_field_stats()
+        for url in options['urls']:
+            for _ in range(options['repeat']):
+                response = client.get(url)
+                if response.status_code != 200:
+                    raise CommandError(
+                        f"GET {url} returned {response.status_code}.")
+        self.stdout.write(
+            f"{'total ms':>10} {'calls':>7} {'avg ms':>9} {'queries':>8}  field")
+        for row in get_field_stats(options['limit']):
+            self.stdout.write(
+                f"{row['total_ms']:>10.2f} {row['calls']:>7} {row['avg_ms']:>9.4f} "
+                f"{row['queries']:>8}  {row['serializer']}.{row['field']}")
@@ -0,0 +1,113 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+
+_lock = threading.Lock()
+_field_stats = {}
+_local = threading.local()
+
+
+def is_profiling_enabled():
+    return getattr(settings, 'SERIALIZER_PROFILING', False)
+
+
+def record_field(serializer_name, field_name, seconds, queries):
+    """
+    Add one measurement to the per-process statistics of a serializer field.
+    """
+    key = (serializer_name, field_name)
+    with _lock:
+        stats = _field_stats.setdefault(key, [0, 0.0, 0])
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] += queries
+
+
+def get_field_stats(limit=None):
+    """
+    Get the recorded serializer fields, most expensive first.
+
+    Times are cumulative, so a nested serializer field includes the time of its
+    own fields and of the queries they run.
+    """
+    with _lock:
+        items = [(key, list(stats)) for key, stats in _field_stats.items()]
+    rows = [
+        {
+            'serializer': serializer_name,
+            'field': field_name,
+            'calls': calls,
+            'total_ms': round(seconds * 1000, 3),
+            'avg_ms': round(seconds * 1000 / calls, 4),
+            'queries': queries,
+        }
+        for (serializer_name, field_name), (calls, seconds, queries) in items
+    ]
+    rows.sort(key=lambda row: row['total_ms'], reverse=True)
+    return rows[:limit] if limit else rows
+
+
+def reset_field_stats():
+    with _lock:
+        _field_stats.clear()
+
+
+def _count_query(execute, sql, params, many, context):
+    _local.queries += 1
+    return execute(sql, params, many, context)
+
+
+@contextmanager
+def _count_queries():
+    """
+    Count the queries of the current thread unless an outer serializer already does.
+    """
+    if getattr(_local, 'counting', False):
+        yield
+        return
+    _local.counting = True
+    _local.queries = getattr(_local, 'queries', 0)
+    try:
+        with connection.execute_wrapper(_count_query):
+            yield
+    finally:
+        _local.counting = False
+
+
+class ProfiledSerializerMixin:
+    """
+    Serializer mixin that records the time and queries spent on each field.
+
+    Only active with the SERIALIZER_PROFILING setting; otherwise the regular
+    to_representation runs. Statistics are kept per process and can be read
+    with get_field_stats(), the serializer profile endpoint or the
+    profile_serializers command.
+    """
+
+    def to_representation(self, instance):
+        if not is_profiling_enabled():
+            return super().to_representation(instance)
+        serializer_name = f'{type(self).__module__}.{type(self).__qualname__}'
+        ret = {}
+        with _count_queries():
+            for field in self._readable_fields:
+                start = time.perf_counter()
+                queries = _local.queries
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+                check_for_none = attribute.pk if isinstance(
+                    attribute, PKOnlyObject) else attribute
+                if check_for_none is None:
+                    ret[field.field_name] = None
+                else:
+                    ret[field.field_name] = field.to_representation(attribute)
+                record_field(serializer_name, field.field_name,
+                             time.perf_counter() - start, _local.queries - queries)
+        return ret
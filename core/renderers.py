@@ -0,0 +1,38 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that encodes with orjson when it is installed.
+
+    Falls back to DRF's compact standard library renderer when orjson is missing,
+    when indented output is requested (e.g. by the browsable API) or when orjson
+    cannot encode the data (e.g. integers wider than 64 bits). Types orjson does
+    not know, as well as datetimes, are passed to DRF's encoder, and U+2028 and
+    U+2029 are escaped like DRF does. The output matches the standard renderer
+    except for floats: exponents are written without '+' (1e16, not 1e+16), and
+    NaN and infinity are rendered as null instead of raising ValueError.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render data into compact JSON bytes.
+        """
+        renderer_context = renderer_context or {}
+        if orjson is None or data is None or self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            content = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Valid JSON, but not JavaScript; DRF escapes these line terminators too.
+        return content.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -0,0 +1,150 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+
+def get_sparse_fieldset(request):
+    """
+    Get the field names requested with ?fields= and excluded with ?omit=.
+
+    Returns a tuple of (requested, omitted) sets; requested is None when all
+    fields are wanted. Only safe requests are projected.
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return None, set()
+    params = request.query_params
+    requested = {name for name in params.get(
+        'fields', '').split(',') if name} or None
+    omitted = {name for name in params.get('omit', '').split(',') if name}
+    return requested, omitted
+
+
+def is_top_level(serializer):
+    """
+    Check whether the serializer renders the response itself rather than a nested value.
+    """
+    parent = serializer.parent
+    if isinstance(parent, serializers.ListSerializer):
+        parent = parent.parent
+    return parent is None
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin that limits the output to the fields selected with ?fields= or ?omit=.
+
+    Only the top-level serializer of a request is projected; nested serializers
+    always render in full.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not is_top_level(self):
+            return fields
+        requested, omitted = get_sparse_fieldset(self.context.get('request'))
+        for name in list(fields):
+            if (requested is not None and name not in requested) or name in omitted:
+                fields.pop(name)
+        return fields
+
+
+class SparseFieldsetViewMixin:
+    """
+    View mixin that defers the model columns of fields left out with ?fields= or ?omit=.
+
+    A serializer field reads the model field named by its source (or its own name).
+    Serializers can list extra columns a field reads in Meta.field_dependencies.
+    Only plain columns are deferred; relations and annotations are left untouched.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        deferred = get_deferred_columns(
+            self.get_serializer_class(), self.request, queryset.model)
+        if deferred:
+            queryset = queryset.defer(*deferred)
+        return queryset
+
+
+def get_deferred_columns(serializer_class, request, model):
+    """
+    Get the model columns that no selected field of the serializer reads.
+    """
+    requested, omitted = get_sparse_fieldset(request)
+    if requested is None and not omitted:
+        return []
+    meta = serializer_class.Meta
+    dependencies = getattr(meta, 'field_dependencies', {})
+    declared = serializer_class._declared_fields
+    needed, unneeded = set(), set()
+    for name in meta.fields:
+        field = declared.get(name)
+        if field is not None and getattr(field, 'write_only', False):
+            continue
+        if field is None:
+            columns = {name}
+        elif field.source == '*' or isinstance(field, serializers.SerializerMethodField):
+            columns = set()
+        else:
+            columns = {(field.source or name).split('.')[0]}
+        columns.update(dependencies.get(name, []))
+        if (requested is not None and name not in requested) or name in omitted:
+            unneeded.update(columns)
+        else:
+            needed.update(columns)
+    deferred = []
+    for column in sorted(unneeded - needed):
+        try:
+            model_field = model._meta.get_field(column)
+        except FieldDoesNotExist:
+            continue
+        if model_field.concrete and not model_field.is_relation and not model_field.primary_key:
+            deferred.append(column)
+    return deferred
+
+
+def get_expanded_fields(request):
+    """
+    Get the field names requested with ?expand= for safe requests.
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return set()
+    return {name for name in request.query_params.get('expand', '').split(',') if name}
+
+
+class ExpandableFieldsMixin:
+    """
+    Serializer mixin that embeds related objects selected with ?expand=.
+
+    Meta.expandable_fields maps a field name to a tuple of the serializer class
+    that renders the related object and the select_related path it reads.
+    Unknown names are ignored, like with ?fields=.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not is_top_level(self):
+            return fields
+        expandable = getattr(self.Meta, 'expandable_fields', {})
+        for name in get_expanded_fields(self.context.get('request')):
+            if name in fields and name in expandable:
+                serializer_class = expandable[name][0]
+                fields[name] = serializer_class(
+                    source=fields[name].source, read_only=True)
+        return fields
+
+
+class ExpandableFieldsViewMixin:
+    """
+    View mixin that joins the related objects selected with ?expand= in the same query.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        expandable = getattr(
+            self.get_serializer_class().Meta, 'expandable_fields', {})
+        paths = [expandable[name][1] for name in sorted(
+            get_expanded_fields(self.request)) if name in expandable]
+        if paths:
+            queryset = queryset.select_related(*paths)
+        return queryset
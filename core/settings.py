@@ -50,17 +50,26 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
-    'django_extensions',
     'django_filters',
     'rest_framework',
     'rest_framework.authtoken',
+    'core',
+    'batch_app',
+    'events_app',
     'offers_app',
     'orders_app',
     'reviews_app',
+    'search_app',
+    'sync_app',
+    'tasks_app',
     'users_app'
 
 ]
 
+# Development helpers are not loaded by production workers.
+if DEBUG:
+    INSTALLED_APPS.append('django_extensions')
+
 AUTH_USER_MODEL = 'users_app.CustomUser'
 
 MIDDLEWARE = [
@@ -94,6 +103,8 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'core.wsgi.application'
 
+TEST_RUNNER = 'core.test_runner.TestRunner'
+
 
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
@@ -101,6 +112,14 @@ WSGI_APPLICATION = 'core.wsgi.application'
 DATABASES = {
     'default': env.db(default=f'sqlite:///{BASE_DIR / "db.sqlite3"}')
 }
+# Set CONN_MAX_AGE to reuse connections between the requests of a gunicorn
+# worker thread. Keep 0 under ASGI, where every sync_to_async thread would
+# hold its own connection open.
+DATABASES['default']['CONN_MAX_AGE'] = env.int('CONN_MAX_AGE', default=0)
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+# Warm up URL patterns and serializers when the WSGI/ASGI application is loaded.
+WARMUP_ON_STARTUP = env.bool('WARMUP_ON_STARTUP', default=not DEBUG)
 
 
 # Password validation
@@ -152,4 +171,62 @@ REST_FRAMEWORK = {
         'rest_framework.authentication.TokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
+
+# Serializer profiling (per field timings, see core/profiling.py)
+
+SERIALIZER_PROFILING = env.bool('SERIALIZER_PROFILING', default=False)
+
+# Request coalescing (identical concurrent GETs, see core/single_flight.py)
+
+SINGLE_FLIGHT_ENABLED = env.bool('SINGLE_FLIGHT_ENABLED', default=True)
+SINGLE_FLIGHT_TIMEOUT = env.float('SINGLE_FLIGHT_TIMEOUT', default=10.0)
+
+# Request batching
+
+BATCH_MAX_WORKERS = env.int('BATCH_MAX_WORKERS', default=4)
+
+# Delta sync feeds (?updated_since=, see sync_app/views.py)
+
+SYNC_PAGE_SIZE = env.int('SYNC_PAGE_SIZE', default=100)
+SYNC_MAX_PAGE_SIZE = env.int('SYNC_MAX_PAGE_SIZE', default=1000)
+SYNC_SETTLE_SECONDS = env.int('SYNC_SETTLE_SECONDS', default=5)
+SYNC_TOMBSTONE_RETENTION_DAYS = env.int(
+    'SYNC_TOMBSTONE_RETENTION_DAYS', default=30)
+
+# Offer view counters (buffered per process, see offers_app/view_counters.py)
+
+OFFER_COUNTER_FLUSH_INTERVAL = env.float(
+    'OFFER_COUNTER_FLUSH_INTERVAL', default=5.0)
+OFFER_COUNTER_FLUSH_THRESHOLD = env.int(
+    'OFFER_COUNTER_FLUSH_THRESHOLD', default=1000)
+
+# Order event streams (server-sent events, see orders_app/streams.py)
+
+ORDER_STREAM_CHANNEL = env(
+    'ORDER_STREAM_CHANNEL', default='orders_app.streams.OutboxChannel')
+ORDER_STREAM_POLL_INTERVAL = env.float(
+    'ORDER_STREAM_POLL_INTERVAL', default=1.0)
+ORDER_STREAM_GAP_TIMEOUT = env.float('ORDER_STREAM_GAP_TIMEOUT', default=10.0)
+ORDER_STREAM_HEARTBEAT_INTERVAL = env.float(
+    'ORDER_STREAM_HEARTBEAT_INTERVAL', default=15.0)
+ORDER_STREAM_QUEUE_SIZE = env.int('ORDER_STREAM_QUEUE_SIZE', default=100)
+
+# Autocomplete index (per process, see search_app/autocomplete.py)
+
+AUTOCOMPLETE_MEMORY_BUDGET = env.int(
+    'AUTOCOMPLETE_MEMORY_BUDGET', default=32 * 1024 * 1024)
+AUTOCOMPLETE_REFRESH_INTERVAL = env.float(
+    'AUTOCOMPLETE_REFRESH_INTERVAL', default=1.0)
+AUTOCOMPLETE_REBUILD_INTERVAL = env.float(
+    'AUTOCOMPLETE_REBUILD_INTERVAL', default=3600.0)
+AUTOCOMPLETE_GAP_TIMEOUT = env.float('AUTOCOMPLETE_GAP_TIMEOUT', default=60.0)
+
+# Background tasks
+
+TASKS_BACKEND = env(
+    'TASKS_BACKEND', default='tasks_app.backends.DatabaseBackend')
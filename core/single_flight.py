@@ -0,0 +1,64 @@
+import threading
+
+
+class Flight:
+    """
+    One computation in progress, shared by the requests waiting for it.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent computations within a process.
+
+    The first caller of do() for a key runs the function; callers arriving with
+    the same key while it runs wait for its result instead of running it again.
+    Nothing is kept once the computation finishes, so this never serves stale
+    results. If the first caller fails, or does not finish within the timeout,
+    the waiting callers run the function themselves.
+
+    Waiting blocks the calling thread, which works for threaded WSGI workers
+    and for ASGI, where Django runs each request's sync views in its own thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def waiting(self):
+        """
+        Get the number of callers currently waiting for another caller's result.
+        """
+        with self._lock:
+            return sum(flight.waiters for flight in self._flights.values())
+
+    def do(self, key, func, timeout):
+        """
+        Run func() once for concurrent callers with the same key.
+
+        Returns (result, shared), where shared tells whether the result was
+        computed by another caller.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = Flight()
+            else:
+                flight.waiters += 1
+        if not leader:
+            if flight.done.wait(timeout) and flight.result is not None:
+                return flight.result, True
+            return func(), False
+        try:
+            flight.result = func()
+            return flight.result, False
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
@@ -0,0 +1,16 @@
+from django.test.runner import DiscoverRunner
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Test runner that drops per-process state recorded against the test databases.
+
+    Offer view counts are buffered per process and flushed at exit, which is
+    after the test databases are gone; they would be written into the
+    configured database instead.
+    """
+
+    def teardown_databases(self, old_config, **kwargs):
+        from offers_app.view_counters import reset_counter_buffer
+        reset_counter_buffer()
+        super().teardown_databases(old_config, **kwargs)
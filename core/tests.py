@@ -0,0 +1,345 @@
+import datetime
+import threading
+import time
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.test import APIClient, APITestCase
+
+from core.profiling import get_field_stats, reset_field_stats
+from core import warmup
+from core.renderers import FastJSONRenderer
+from core.single_flight import SingleFlight
+from core.views import single_flight_group
+from offers_app.models import Offer, OfferDetail
+from users_app.models import Profile
+
+User = get_user_model()
+
+
+class FastJSONRendererTests(APITestCase):
+    """
+    Test cases for the fast JSON renderer.
+    """
+
+    def test_output_matches_default_renderer(self):
+        """
+        Test that the fast renderer produces the same bytes as DRF's renderer.
+        """
+        data = {
+            'id': 1,
+            'price': Decimal('50.00'),
+            'created_at': datetime.datetime(2025, 1, 1, 12, 0, tzinfo=datetime.timezone.utc),
+            'title': 'Café',
+            'features': ['A', 'B'],
+            'nested': {'value': None, 'flag': True},
+        }
+        self.assertEqual(FastJSONRenderer().render(data),
+                         JSONRenderer().render(data))
+
+    def test_line_separators_and_wide_integers_match_default_renderer(self):
+        """
+        Test that U+2028/U+2029 are escaped and integers beyond 64 bits still render.
+        """
+        for data in [{'title': 'a\u2028b\u2029c'}, {'id': 2 ** 70}, [-(2 ** 64)]]:
+            self.assertEqual(FastJSONRenderer().render(data),
+                             JSONRenderer().render(data))
+
+    def test_indented_output_falls_back(self):
+        """
+        Test that indentation requests use the standard renderer.
+        """
+        data = {'id': 1}
+        self.assertEqual(
+            FastJSONRenderer().render(data, 'application/json; indent=4'),
+            JSONRenderer().render(data, 'application/json; indent=4'))
+
+
+class SparseFieldsetTests(APITestCase):
+    """
+    Test cases for ?fields= and ?omit= on the list endpoints.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="business",
+            email="business@mail.de",
+            password="password123",
+            type="business"
+        )
+        Profile.objects.create(user=self.user)
+        offer = Offer.objects.create(
+            user=self.user, title="Offer", description="Long description")
+        OfferDetail.objects.create(
+            offer=offer, title="Basic", revisions=1, delivery_time_in_days=3,
+            price=50, features=["A"], offer_type="basic")
+        self.client.force_authenticate(user=self.user)
+
+    def test_fields_limits_output(self):
+        """
+        Test that only the requested fields are returned.
+        """
+        response = self.client.get(
+            reverse('offers-list'), {'fields': 'id,title'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data['results'][0]), {'id', 'title'})
+
+    def test_omit_removes_fields_and_columns(self):
+        """
+        Test that omitted fields are neither returned nor selected.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('offers-list'), {
+                'omit': 'description,created_at,user_details'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        offer = response.data['results'][0]
+        self.assertNotIn('description', offer)
+        self.assertNotIn('user_details', offer)
+        self.assertIn('title', offer)
+        offer_queries = [query['sql'] for query in queries.captured_queries
+                         if 'FROM "offers_app_offer"' in query['sql']]
+        self.assertTrue(offer_queries)
+        for sql in offer_queries:
+            self.assertNotIn('"offers_app_offer"."description"', sql)
+
+    def test_profile_fields(self):
+        """
+        Test that the profile endpoint supports sparse fieldsets.
+        """
+        response = self.client.get(
+            reverse('profile', kwargs={'pk': self.user.pk}), {'fields': 'user,username'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {
+                         'user': self.user.pk, 'username': 'business'})
+
+    def test_nested_serializers_are_not_projected(self):
+        """
+        Test that nested serializers keep their fields.
+        """
+        response = self.client.get(
+            reverse('offers-list'), {'fields': 'id,user_details'})
+        self.assertEqual(set(response.data['results'][0]['user_details']),
+                         {'first_name', 'last_name', 'username'})
+
+
+class SerializerProfilingTests(APITestCase):
+    """
+    Test cases for the serializer field profiling.
+    """
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            username="admin",
+            email="admin@mail.de",
+            password="password123",
+            type="customer"
+        )
+        self.user = User.objects.create_user(
+            username="business",
+            email="business@mail.de",
+            password="password123",
+            type="business"
+        )
+        Profile.objects.create(user=self.user)
+        offer = Offer.objects.create(
+            user=self.user, title="Offer", description="Long description")
+        OfferDetail.objects.create(
+            offer=offer, title="Basic", revisions=1, delivery_time_in_days=3,
+            price=50, features=["A"], offer_type="basic")
+        reset_field_stats()
+        self.addCleanup(reset_field_stats)
+
+    def get_stats(self):
+        return {(row['serializer'].rsplit('.', 1)[-1], row['field']): row
+                for row in get_field_stats()}
+
+    def test_disabled_by_default(self):
+        """
+        Test that nothing is recorded without the setting.
+        """
+        self.client.get(reverse('offers-list'), {'page_size': 10})
+        self.assertEqual(get_field_stats(), [])
+
+    def test_records_time_and_queries_per_field(self):
+        """
+        Test that fields are recorded with their queries and the output is unchanged.
+        """
+        url = reverse('offers-list')
+        expected = self.client.get(url, {'page_size': 10}).content
+        with override_settings(SERIALIZER_PROFILING=True):
+            response = self.client.get(url, {'page_size': 10})
+        self.assertEqual(response.content, expected)
+        stats = self.get_stats()
+        self.assertGreaterEqual(
+            stats[('OfferListReadSerializer', 'user_details')]['queries'], 1)
+        self.assertEqual(stats[('OfferListReadSerializer', 'title')]['queries'], 0)
+        self.assertEqual(stats[('UserDetailsSerializer', 'username')]['calls'], 1)
+        details = stats[('OfferListReadSerializer', 'details')]
+        self.assertGreaterEqual(
+            details['total_ms'],
+            stats[('OfferDetailReadSerializerRelativeHyperlinked', 'url')]['total_ms'])
+
+    def test_profile_endpoint(self):
+        """
+        Test that admins can read and reset the statistics.
+        """
+        url = reverse('serializer-profile')
+        with override_settings(SERIALIZER_PROFILING=True):
+            self.client.get(reverse('offers-list'), {'page_size': 10})
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.client.get(url).status_code,
+                         status.HTTP_403_FORBIDDEN)
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(url, {'limit': 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['fields']), 3)
+        self.assertEqual(self.client.delete(url).status_code,
+                         status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.client.get(url).data['fields'], [])
+
+    def test_profile_command(self):
+        """
+        Test that the command requests the endpoints and prints the costly fields.
+        """
+        out = StringIO()
+        call_command('profile_serializers', '/api/offers/?page_size=10',
+                     '--username', 'business', '--repeat', '2', stdout=out)
+        self.assertIn('OfferListReadSerializer.details', out.getvalue())
+
+
+class WarmUpTests(APITestCase):
+    """
+    Test cases for the worker warm up.
+    """
+
+    def test_serializers_build_without_errors(self):
+        """
+        Test that the fields of every API serializer can be built at startup.
+        """
+        modules = warmup.import_api_modules()
+        self.assertIn('offers_app.api.serializers',
+                      [module.__name__ for module in modules])
+        with self.assertNoLogs('core.warmup', level='WARNING'):
+            warmup.build_serializer_fields(modules)
+
+    def test_warm_up(self):
+        """
+        Test that requests are served after warming up.
+        """
+        warmup.warm_up()
+        response = self.client.get(reverse('base-info'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+def wait_for_waiters(group, count, timeout=5):
+    deadline = time.monotonic() + timeout
+    while group.waiting() < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def run_concurrently(count, func):
+    results = [None] * count
+
+    def run(index):
+        results[index] = func()
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class SingleFlightTests(SimpleTestCase):
+    """
+    Test cases for coalescing identical concurrent computations.
+    """
+
+    def test_concurrent_callers_share_one_call(self):
+        group = SingleFlight()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            wait_for_waiters(group, 4)
+            return object()
+
+        results = run_concurrently(5, lambda: group.do('key', compute, 5))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len({id(result) for result, _ in results}), 1)
+        self.assertEqual(sorted(shared for _, shared in results), [False] + [True] * 4)
+        self.assertEqual(group.waiting(), 0)
+
+    def test_waiters_compute_themselves_when_the_first_call_fails(self):
+        group = SingleFlight()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            if len(calls) == 1:
+                wait_for_waiters(group, 2)
+                raise ValueError
+            return 'result'
+
+        def call():
+            try:
+                return group.do('key', compute, 5)
+            except ValueError:
+                return None
+
+        results = run_concurrently(3, call)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(results.count(None), 1)
+        self.assertEqual(results.count(('result', False)), 2)
+
+
+class SingleFlightViewTests(APITestCase):
+    """
+    Test cases for identical concurrent GET requests sharing one response.
+    """
+
+    def setUp(self):
+        self.calls = []
+
+        def get_base_info(view, request):
+            self.calls.append(1)
+            wait_for_waiters(single_flight_group, 4)
+            return Response({'calls': len(self.calls)})
+
+        patcher = mock.patch('reviews_app.api.views.BaseInfoView.get_base_info',
+                             get_base_info)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_concurrent_requests_share_the_rendered_response(self):
+        responses = run_concurrently(
+            5, lambda: APIClient().get(reverse('base-info'), HTTP_ACCEPT='application/json'))
+        self.assertEqual(len(self.calls), 1)
+        for response in responses:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response['Content-Type'], 'application/json')
+            self.assertEqual(response.content, b'{"calls":1}')
+
+    def test_sequential_requests_are_not_shared(self):
+        with mock.patch('core.views.single_flight_group.waiting', return_value=4):
+            self.client.get(reverse('base-info'))
+            response = self.client.get(reverse('base-info'), HTTP_ACCEPT='application/json')
+        self.assertEqual(response.json(), {'calls': 2})
+
+    @override_settings(SINGLE_FLIGHT_ENABLED=False)
+    def test_disabled(self):
+        with mock.patch('core.views.single_flight_group.waiting', return_value=4):
+            responses = run_concurrently(2, lambda: APIClient().get(reverse('base-info')))
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual([response.status_code for response in responses], [200, 200])
@@ -19,12 +19,18 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 
+from core.views import SerializerProfileView
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api-auth/', include('rest_framework.urls')),
+    path('api/debug/serializer-profile/', SerializerProfileView.as_view(),
+         name='serializer-profile'),
+    path('api/', include('batch_app.api.urls')),
     path('api/', include('offers_app.api.urls')),
     path('api/', include('orders_app.api.urls')),
     path('api/', include('reviews_app.api.urls')),
+    path('api/', include('search_app.api.urls')),
     path('api/', include('users_app.api.urls'))
 ] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 
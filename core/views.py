@@ -0,0 +1,147 @@
+import re
+
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.profiling import get_field_stats, is_profiling_enabled, reset_field_stats
+from core.single_flight import SingleFlight
+
+MULTI_GET_MAX_IDS = 100
+# Largest value of a 64-bit signed integer column.
+MAX_ID = 2 ** 63 - 1
+
+single_flight_group = SingleFlight()
+
+
+def parse_ids(value, max_ids=MULTI_GET_MAX_IDS):
+    """
+    Parse a comma separated list of IDs, e.g. ?ids=1,2,3, without duplicates.
+    """
+    ids = []
+    seen = set()
+    for part in (value or '').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if not re.fullmatch(r'[0-9]{1,19}', part) or int(part) > MAX_ID:
+            raise ValidationError({'ids': [f"'{part[:20]}' is not a valid ID."]})
+        pk = int(part)
+        if pk in seen:
+            continue
+        seen.add(pk)
+        ids.append(pk)
+        if len(ids) > max_ids:
+            raise ValidationError(
+                {'ids': [f"Provide at most {max_ids} IDs."]})
+    if not ids:
+        raise ValidationError({'ids': ["Provide at least one ID, e.g. ?ids=1,2,3."]})
+    return ids
+
+
+class MultiGetMixin:
+    """
+    View mixin that retrieves several objects given with ?ids= in one query.
+
+    Objects are looked up by multi_get_field (the primary key by default), checked
+    with the object permissions of the view one by one and returned in the order
+    of the requested IDs. Unknown IDs are left out of the result.
+    """
+    multi_get_field = 'pk'
+
+    def multi_get(self, request, *args, **kwargs):
+        ids = parse_ids(request.query_params.get('ids'))
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            **{f'{self.multi_get_field}__in': ids})
+        objects = {getattr(obj, self.multi_get_field): obj for obj in queryset}
+        results = []
+        for object_id in ids:
+            obj = objects.get(object_id)
+            if obj is None:
+                continue
+            self.check_object_permissions(request, obj)
+            results.append(obj)
+        serializer = self.get_serializer(results, many=True)
+        return Response(serializer.data)
+
+
+class SingleFlightMixin:
+    """
+    View mixin that lets identical concurrent GET requests share one response.
+
+    Authentication, permissions and content negotiation run for every request.
+    Then the first request for a URL renders the response, and requests for
+    the same URL, host and format arriving meanwhile wait for it and return
+    copies of its rendered bytes (see core.single_flight). Only use it on views
+    whose output does not depend on the user, or set single_flight_vary_on_user.
+
+    Side effects of the view that must happen once per request, like view
+    counters, go into flight_state, which replay_flight_state() applies to the
+    requests that share the response.
+    """
+    single_flight_vary_on_user = False
+    flight_state = None
+
+    def get(self, request, *args, **kwargs):
+        return self.single_flight(request, super().get, *args, **kwargs)
+
+    def get_single_flight_key(self, request):
+        user_id = request.user.pk if self.single_flight_vary_on_user else None
+        return (type(self).__qualname__, request.method, request.build_absolute_uri(),
+                request.accepted_renderer.format, user_id)
+
+    def single_flight(self, request, handler, *args, **kwargs):
+        """
+        Call the handler, or wait for a running call of an identical request.
+        """
+        if not settings.SINGLE_FLIGHT_ENABLED:
+            return handler(request, *args, **kwargs)
+
+        def render():
+            response = self.finalize_response(
+                request, handler(request, *args, **kwargs), *args, **kwargs)
+            response.render()
+            return response, (response.status_code, list(response.items()),
+                              response.content, self.flight_state)
+
+        (response, shared), is_shared = single_flight_group.do(
+            self.get_single_flight_key(request), render, settings.SINGLE_FLIGHT_TIMEOUT)
+        if not is_shared:
+            return response
+        status_code, headers, content, state = shared
+        if state is not None:
+            self.replay_flight_state(state)
+        return HttpResponse(content, status=status_code, headers=headers)
+
+    def replay_flight_state(self, state):
+        """
+        Apply the flight_state of the request that rendered a shared response.
+        """
+
+
+class SerializerProfileView(APIView):
+    """
+    Admin view to show the most expensive serializer fields of this process.
+
+    GET returns the top fields (?limit=, default 20), DELETE resets the statistics.
+    Fields are only recorded while the SERIALIZER_PROFILING setting is enabled.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, format=None):
+        try:
+            limit = int(request.query_params.get('limit', 20))
+        except ValueError:
+            raise ValidationError({'limit': ["A valid integer is required."]})
+        return Response({
+            'enabled': is_profiling_enabled(),
+            'fields': get_field_stats(limit),
+        })
+
+    def delete(self, request, format=None):
+        reset_field_stats()
+        return Response(status=status.HTTP_204_NO_CONTENT)
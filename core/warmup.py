@@ -0,0 +1,89 @@
+import logging
+import os
+import time
+from importlib import import_module
+from importlib.util import find_spec
+
+logger = logging.getLogger(__name__)
+
+API_MODULES = ['urls', 'views', 'serializers', 'permissions', 'filters']
+
+_prepared = False
+
+
+def warm_up():
+    """
+    Do the work a worker would otherwise do on its first requests.
+
+    Imports the API modules, compiles the URL patterns and builds the fields of
+    every serializer used by a view. This state is shared by forked workers, so
+    it runs only once per process tree. Database connections are not opened:
+    they belong to the thread that opens them, and each request thread opens
+    its own on first use. Returns the time spent in seconds.
+    """
+    global _prepared
+    start = time.perf_counter()
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+    import django
+    from django.apps import apps
+    if not apps.ready:
+        django.setup()
+    if not _prepared:
+        modules = import_api_modules()
+        compile_url_patterns()
+        build_serializer_fields(modules)
+        _prepared = True
+    elapsed = time.perf_counter() - start
+    logger.info("Warm up finished in %.1f ms", elapsed * 1000)
+    return elapsed
+
+
+def import_api_modules():
+    """
+    Import the api modules of every installed app and return them.
+    """
+    from django.apps import apps
+    modules = []
+    for app_config in apps.get_app_configs():
+        for module_name in API_MODULES:
+            name = f'{app_config.name}.api.{module_name}'
+            try:
+                found = find_spec(name) is not None
+            except ModuleNotFoundError:
+                found = False
+            if found:
+                modules.append(import_module(name))
+    return modules
+
+
+def compile_url_patterns():
+    """
+    Populate the URL resolvers and compile the regex of every pattern.
+    """
+    from django.urls import URLResolver, get_resolver
+    pending = [get_resolver()]
+    while pending:
+        pattern = pending.pop()
+        pattern.pattern.regex
+        if isinstance(pattern, URLResolver):
+            pattern.reverse_dict
+            pending.extend(pattern.url_patterns)
+
+
+def build_serializer_fields(modules):
+    """
+    Build the fields of every serializer class defined in the given modules.
+
+    This fills the model meta caches and imports the lazily loaded field and
+    validator modules of DRF.
+    """
+    from rest_framework.serializers import BaseSerializer
+    for module in modules:
+        for value in vars(module).values():
+            if not (isinstance(value, type) and issubclass(value, BaseSerializer)
+                    and value.__module__ == module.__name__):
+                continue
+            try:
+                value(context={}).fields
+            except Exception:
+                logger.warning("Could not warm up %s", value, exc_info=True)
@@ -0,0 +1,15 @@
+from django.contrib import admin
+
+from events_app.models import OutboxEvent
+
+
+class OutboxEventAdmin(admin.ModelAdmin):
+    """
+    Admin interface for the OutboxEvent model.
+    """
+    list_display = ('id', 'topic', 'aggregate_id', 'created_at',
+                    'dispatched_at', 'attempts')
+    list_filter = ('topic',)
+
+
+admin.site.register(OutboxEvent, OutboxEventAdmin)
@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class EventsAppConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'events_app'
+
+    def ready(self):
+        """
+        Connect the delete signal and register the consumers of every installed app.
+        """
+        from events_app import signals  # noqa: F401
+        autodiscover_modules('consumers')
@@ -0,0 +1,82 @@
+import logging
+import time
+import traceback
+
+from django.db import IntegrityError, close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from events_app.models import ConsumedEvent, OutboxEvent
+from events_app.registry import get_consumers
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 10
+
+
+def dispatch_pending(batch_size=100):
+    """
+    Deliver one batch of undispatched events to their consumers, oldest first.
+
+    Delivery is at-least-once: an event stays pending until every consumer has
+    handled it. Consumers that already handled it (recorded as ConsumedEvent)
+    are skipped, which makes retries idempotent. Returns the number of events
+    that were fully dispatched.
+    """
+    events = list(OutboxEvent.objects.filter(
+        dispatched_at__isnull=True, attempts__lt=MAX_ATTEMPTS
+    ).order_by('id')[:batch_size])
+    if not events:
+        return 0
+    receipts = set(ConsumedEvent.objects.filter(
+        event__in=events).values_list('event_id', 'consumer'))
+
+    dispatched_ids = []
+    for event in events:
+        error = _deliver(event, receipts)
+        if error is None:
+            dispatched_ids.append(event.id)
+        else:
+            OutboxEvent.objects.filter(pk=event.pk).update(
+                attempts=F('attempts') + 1, last_error=error)
+    OutboxEvent.objects.filter(pk__in=dispatched_ids).update(
+        dispatched_at=timezone.now())
+    return len(dispatched_ids)
+
+
+def _deliver(event, receipts):
+    for consumer in get_consumers(event.topic):
+        if (event.id, consumer.name) in receipts:
+            continue
+        try:
+            with transaction.atomic():
+                # The receipt is written first, in its own savepoint, so only a
+                # duplicate receipt is skipped; errors of the handler, including
+                # IntegrityErrors, roll back both and count as a failed attempt.
+                try:
+                    with transaction.atomic():
+                        ConsumedEvent.objects.create(
+                            event=event, consumer=consumer.name)
+                except IntegrityError:
+                    continue
+                consumer.handler(event)
+        except Exception:
+            logger.warning("Consumer %s failed on event %s",
+                           consumer.name, event.id)
+            return traceback.format_exc()
+    return None
+
+
+def run_dispatcher(batch_size=100, interval=1.0, once=False):
+    """
+    Dispatch events until interrupted, sleeping for interval seconds when idle.
+    """
+    total = 0
+    while True:
+        close_old_connections()
+        dispatched = dispatch_pending(batch_size)
+        total += dispatched
+        if once and dispatched < batch_size:
+            return total
+        if not dispatched:
+            time.sleep(interval)
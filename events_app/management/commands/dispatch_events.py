@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from events_app.dispatcher import run_dispatcher
+
+
+class Command(BaseCommand):
+    """
+    Deliver outbox events to the registered consumers.
+    """
+    help = 'Dispatch pending outbox events to their consumers.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=100,
+            help='Number of events loaded per batch.')
+        parser.add_argument(
+            '--interval', type=float, default=1.0,
+            help='Seconds to wait when no events are pending.')
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Dispatch all pending events and exit.')
+
+    def handle(self, *args, **options):
+        try:
+            dispatched = run_dispatcher(
+                batch_size=options['batch_size'],
+                interval=options['interval'],
+                once=options['once'])
+        except KeyboardInterrupt:
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f'Dispatched {dispatched} events.'))
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.5 on 2026-10-19 10:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('topic', models.CharField(db_index=True, max_length=100)),
+                ('aggregate_type', models.CharField(max_length=50)),
+                ('aggregate_id', models.BigIntegerField()),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('dispatched_at', models.DateTimeField(blank=True, db_index=True, null=True)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, default='')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ConsumedEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('consumer', models.CharField(max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='receipts', to='events_app.outboxevent')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('event', 'consumer'), name='unique_event_consumer')],
+            },
+        ),
+    ]
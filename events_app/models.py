@@ -0,0 +1,94 @@
+from django.db import models, transaction
+
+
+class OutboxEvent(models.Model):
+    """
+    Model representing a domain event waiting in the transactional outbox.
+
+    Fields:
+        - topic: Name of the event (e.g., order.created).
+        - aggregate_type: Type of the changed object (e.g., order).
+        - aggregate_id: Primary key of the changed object.
+        - payload: JSON data describing the change.
+        - created_at: Timestamp when the event was recorded.
+        - dispatched_at: Timestamp when all consumers handled the event.
+        - attempts: Number of failed dispatch attempts.
+        - last_error: Error of the last failed dispatch attempt.
+    """
+    topic = models.CharField(max_length=100, db_index=True)
+    aggregate_type = models.CharField(max_length=50)
+    aggregate_id = models.BigIntegerField()
+    payload = models.JSONField(blank=True, default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+    dispatched_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+
+    def __str__(self):
+        return f"Event {self.id}: {self.topic} ({self.aggregate_type} {self.aggregate_id})"
+
+
+class ConsumedEvent(models.Model):
+    """
+    Model recording that a consumer has handled an outbox event.
+
+    Written in the same transaction as the consumer's own changes, so an event is
+    never applied twice by the same consumer.
+
+    Fields:
+        - event: ForeignKey to the handled OutboxEvent.
+        - consumer: Name of the consumer.
+        - created_at: Timestamp when the consumer handled the event.
+    """
+    event = models.ForeignKey(
+        OutboxEvent, on_delete=models.CASCADE, related_name='receipts')
+    consumer = models.CharField(max_length=100)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['event', 'consumer'], name='unique_event_consumer'),
+        ]
+
+    def __str__(self):
+        return f"{self.consumer} consumed event {self.event_id}"
+
+
+class OutboxModel(models.Model):
+    """
+    Abstract model that records an outbox event whenever an instance is saved or deleted.
+
+    The event is written in the same transaction as the change itself. Subclasses
+    set outbox_aggregate and may extend get_outbox_payload().
+    """
+    outbox_aggregate = None
+
+    class Meta:
+        abstract = True
+
+    def get_outbox_payload(self):
+        """
+        Get the JSON data stored with the events of this instance.
+        """
+        return {'id': self.pk}
+
+    def save(self, *args, **kwargs):
+        """
+        Save the instance and record a created or updated event atomically.
+        """
+        created = self._state.adding
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+            self.record_outbox_event('created' if created else 'updated')
+
+    def record_outbox_event(self, action, payload=None):
+        """
+        Record an event for this instance, e.g. record_outbox_event('deleted').
+        """
+        return OutboxEvent.objects.using(self._state.db).create(
+            topic=f'{self.outbox_aggregate}.{action}',
+            aggregate_type=self.outbox_aggregate,
+            aggregate_id=self.pk,
+            payload=payload if payload is not None else self.get_outbox_payload()
+        )
@@ -0,0 +1,37 @@
+from fnmatch import fnmatchcase
+
+_consumers = {}
+
+
+class Consumer:
+    """
+    A registered handler for outbox events whose topic matches one of its patterns.
+    """
+
+    def __init__(self, name, topics, handler):
+        self.name = name
+        self.topics = topics
+        self.handler = handler
+
+    def matches(self, topic):
+        return any(fnmatchcase(topic, pattern) for pattern in self.topics)
+
+
+def consumer(name, topics):
+    """
+    Register a function as consumer of the given topics (patterns like 'order.*').
+
+    The function receives the OutboxEvent. It runs in a transaction together with
+    the receipt of the event, and must tolerate being retried after a failure.
+    """
+    def decorator(func):
+        _consumers[name] = Consumer(name, list(topics), func)
+        return func
+    return decorator
+
+
+def get_consumers(topic):
+    """
+    Get all consumers subscribed to the given topic.
+    """
+    return [consumer for consumer in _consumers.values() if consumer.matches(topic)]
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from events_app.models import OutboxModel
+
+
+@receiver(post_delete)
+def record_delete_event(sender, instance, using, **kwargs):
+    """
+    Record a deleted event for outbox models.
+
+    Deletions, including cascades, run inside the transaction of the deletion
+    collector, so the event is committed together with the delete.
+    """
+    if isinstance(instance, OutboxModel):
+        instance._state.db = using
+        instance.record_outbox_event('deleted')
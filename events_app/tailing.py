@@ -0,0 +1,52 @@
+import time
+
+from django.db.models import Q
+
+MAX_GAPS = 500
+
+
+class OutboxPosition:
+    """
+    Position of a reader that follows the outbox by event ID.
+
+    Event IDs are assigned on insert, but transactions can commit in another
+    order (e.g. on PostgreSQL), so an event may appear below an ID that was
+    already read. The IDs missing below the last read one are kept and looked
+    up again by pending() for gap_timeout seconds; rolled back inserts leave
+    gaps that never fill. At most MAX_GAPS missing IDs are kept.
+    """
+
+    def __init__(self, last_event_id, gap_timeout):
+        self.last_event_id = last_event_id
+        self.gap_timeout = gap_timeout
+        self.gaps = {}
+
+    def pending(self):
+        """
+        Get the filter of the events that were not read yet.
+        """
+        condition = Q(id__gt=self.last_event_id)
+        if self.gaps:
+            condition |= Q(id__in=list(self.gaps))
+        return condition
+
+    def advance(self, event_ids):
+        """
+        Mark the given sorted event IDs as read.
+
+        Records the IDs skipped before them and forgets the missing IDs that
+        showed up or were missing for longer than gap_timeout seconds.
+        """
+        now = time.monotonic()
+        for event_id in event_ids:
+            if event_id > self.last_event_id:
+                for missing in range(max(self.last_event_id + 1, event_id - MAX_GAPS), event_id):
+                    self.gaps[missing] = now
+                self.last_event_id = event_id
+            self.gaps.pop(event_id, None)
+        self.gaps = {
+            event_id: missing_since for event_id, missing_since in self.gaps.items()
+            if now - missing_since < self.gap_timeout
+        }
+        if len(self.gaps) > MAX_GAPS:
+            self.gaps = dict(sorted(self.gaps.items())[-MAX_GAPS:])
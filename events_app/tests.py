@@ -0,0 +1,158 @@
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.test import SimpleTestCase, TestCase
+
+from events_app.dispatcher import dispatch_pending
+from events_app.models import ConsumedEvent, OutboxEvent
+from events_app.registry import consumer
+from events_app.tailing import MAX_GAPS, OutboxPosition
+from offers_app.models import Offer, OfferDetail
+
+User = get_user_model()
+
+handled = []
+fail_next = []
+
+
+@consumer('tests.recorder', topics=['test.*'])
+def record_event(event):
+    handled.append(('recorder', event.id))
+
+
+@consumer('tests.flaky', topics=['test.*'])
+def flaky_consumer(event):
+    if fail_next:
+        raise fail_next.pop()("Consumer failed")
+    handled.append(('flaky', event.id))
+
+
+class OutboxTests(TestCase):
+    """
+    Test cases for recording outbox events and dispatching them.
+    """
+
+    def setUp(self):
+        handled.clear()
+        fail_next.clear()
+        self.user = User.objects.create_user(
+            username="business",
+            email="business@mail.de",
+            password="password123",
+            type="business"
+        )
+
+    def create_offer(self):
+        return Offer.objects.create(
+            user=self.user, title="Offer", description="Description")
+
+    def test_save_records_event(self):
+        """
+        Test that creating and updating a model records outbox events.
+        """
+        offer = self.create_offer()
+        offer.title = "Updated"
+        offer.save()
+        events = OutboxEvent.objects.filter(aggregate_id=offer.id)
+        self.assertEqual(list(events.values_list('topic', flat=True)),
+                         ['offer.created', 'offer.updated'])
+        self.assertEqual(events.first().payload['user_id'], self.user.id)
+
+    def test_event_is_rolled_back_with_change(self):
+        """
+        Test that the event is not kept when the transaction of the change fails.
+        """
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.create_offer()
+                raise RuntimeError("Rollback")
+        self.assertFalse(Offer.objects.exists())
+        self.assertFalse(OutboxEvent.objects.exists())
+
+    def test_cascade_delete_records_events(self):
+        """
+        Test that deleting an offer records events for cascaded details.
+        """
+        offer = self.create_offer()
+        OfferDetail.objects.create(
+            offer=offer, title="Basic", revisions=1, delivery_time_in_days=1,
+            price=10, features=[], offer_type='basic')
+        offer.delete()
+        topics = set(OutboxEvent.objects.values_list('topic', flat=True))
+        self.assertIn('offer.deleted', topics)
+        self.assertIn('offerdetail.deleted', topics)
+
+    def test_dispatch_delivers_to_consumers(self):
+        """
+        Test that pending events are delivered and marked as dispatched.
+        """
+        event = OutboxEvent.objects.create(
+            topic='test.created', aggregate_type='test', aggregate_id=1)
+        self.assertEqual(dispatch_pending(), 1)
+        self.assertIn(('recorder', event.id), handled)
+        self.assertIn(('flaky', event.id), handled)
+        event.refresh_from_db()
+        self.assertIsNotNone(event.dispatched_at)
+        self.assertEqual(dispatch_pending(), 0)
+
+    def test_failed_consumer_is_retried_idempotently(self):
+        """
+        Test that only the failed consumer runs again on the next dispatch.
+        """
+        event = OutboxEvent.objects.create(
+            topic='test.created', aggregate_type='test', aggregate_id=1)
+        fail_next.append(RuntimeError)
+        self.assertEqual(dispatch_pending(), 0)
+        event.refresh_from_db()
+        self.assertIsNone(event.dispatched_at)
+        self.assertEqual(event.attempts, 1)
+        self.assertEqual(dispatch_pending(), 1)
+        self.assertEqual(handled.count(('recorder', event.id)), 1)
+        self.assertEqual(handled.count(('flaky', event.id)), 1)
+        self.assertEqual(ConsumedEvent.objects.filter(event=event).count(), 2)
+
+    def test_integrity_error_of_a_consumer_is_a_failed_attempt(self):
+        """
+        Test that an IntegrityError raised by a consumer is not taken for a duplicate receipt.
+        """
+        event = OutboxEvent.objects.create(
+            topic='test.created', aggregate_type='test', aggregate_id=1)
+        fail_next.append(IntegrityError)
+        self.assertEqual(dispatch_pending(), 0)
+        event.refresh_from_db()
+        self.assertIsNone(event.dispatched_at)
+        self.assertEqual(event.attempts, 1)
+        self.assertIn('IntegrityError', event.last_error)
+        self.assertFalse(ConsumedEvent.objects.filter(
+            event=event, consumer='tests.flaky').exists())
+        self.assertEqual(dispatch_pending(), 1)
+        self.assertEqual(handled.count(('flaky', event.id)), 1)
+
+
+class OutboxPositionTests(SimpleTestCase):
+    """
+    Test cases for following the outbox by event ID.
+    """
+
+    def test_missing_ids_are_read_again(self):
+        """
+        Test that IDs skipped by a read are looked up again until they show up.
+        """
+        position = OutboxPosition(10, gap_timeout=60)
+        position.advance([11, 14])
+        self.assertEqual(position.last_event_id, 14)
+        self.assertEqual(set(position.gaps), {12, 13})
+        position.advance([13])
+        self.assertEqual(set(position.gaps), {12})
+        self.assertEqual(position.last_event_id, 14)
+
+    def test_missing_ids_are_given_up(self):
+        """
+        Test that IDs missing for longer than the timeout are no longer looked up.
+        """
+        position = OutboxPosition(10, gap_timeout=0)
+        position.advance([13])
+        self.assertEqual(position.gaps, {})
+        self.assertEqual(position.last_event_id, 13)
+        position = OutboxPosition(0, gap_timeout=60)
+        position.advance([10 ** 6])
+        self.assertEqual(len(position.gaps), MAX_GAPS)
@@ -0,0 +1,26 @@
+"""
+Gunicorn configuration, used with: gunicorn -c gunicorn.conf.py core.wsgi
+
+The application is loaded once in the master process, which warms up URL
+patterns and serializers (see core/warmup.py) before the workers are forked.
+Each worker writes its buffered offer view counts when it exits.
+
+Workers are threaded (gthread): a long request, such as a client connected to
+the order event stream, keeps one thread busy instead of the whole worker, and
+the worker timeout does not kill it, because the worker keeps reporting to the
+master from its main thread.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get(
+    'WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+preload_app = True
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 16))
+
+
+def worker_exit(server, worker):
+    from offers_app.view_counters import flush_offer_counters
+    flush_offer_counters()
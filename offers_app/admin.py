@@ -10,7 +10,7 @@ class OfferAdmin(admin.ModelAdmin):
     """
     Admin interface for the Offer model.
     """
-    list_display = ('title', 'user', 'created_at', 'updated_at')
+    list_display = ('title', 'user', 'rank', 'created_at', 'updated_at')
     search_fields = ('title', 'description')
 
 
@@ -20,7 +20,7 @@ class OfferDetailAdmin(admin.ModelAdmin):
     """
     list_display = ('id', 'title', 'offer', 'price', 'delivery_time_in_days',
                     'features', 'offer_type')
-    search_fields = ('offer__title', 'features')
+    search_fields = ('offer__title', 'feature_entries__normalized')
 
 
 class OrderAdmin(admin.ModelAdmin):
@@ -1,35 +1,78 @@
 import django_filters
 
-from django.db.models import Min
-from rest_framework.exceptions import ValidationError
+from django.db.models import Exists, OuterRef, Subquery
 
-from offers_app.models import Offer
+from offers_app.models import Offer, OfferDetail, normalize_feature
+
+
+def detail_exists(**lookups):
+    """
+    Build an EXISTS predicate over the details of the outer offer.
+
+    Unlike filtering across the details join, this never repeats an offer and
+    needs no GROUP BY, so any number of them can be combined.
+    """
+    return Exists(OfferDetail.objects.filter(offer=OuterRef('pk'), **lookups))
+
+
+def detail_minimum(field_name):
+    """
+    Build a correlated subquery for the smallest value of a detail field of the outer offer.
+    """
+    return Subquery(
+        OfferDetail.objects.filter(offer=OuterRef('pk'))
+        .order_by(field_name).values(field_name)[:1]
+    )
+
+
+def annotate_detail_summary(queryset):
+    """
+    Annotate min_price and min_delivery_time without joining the details.
+    """
+    return queryset.annotate(
+        min_price=detail_minimum('price'),
+        min_delivery_time=detail_minimum('delivery_time_in_days'),
+    )
 
 
 class OfferFilter(django_filters.FilterSet):
     """
     Filter for offers based on minimum price and maximum delivery time.
+
+    Detail conditions are compiled into EXISTS predicates, so combining them
+    with each other, search and ordering never duplicates offers.
     """
     creator_id = django_filters.NumberFilter(field_name='user__id')
     min_price = django_filters.NumberFilter(method='filter_min_price')
     max_delivery_time = django_filters.NumberFilter(
         method='filter_max_delivery_time')
+    feature = django_filters.CharFilter(method='filter_feature')
 
     class Meta:
         model = Offer
-        fields = ['creator_id', 'min_price', 'max_delivery_time']
+        fields = ['creator_id', 'min_price', 'max_delivery_time', 'feature']
 
     def filter_min_price(self, queryset, name, value):
+        """
+        Keep offers with at least one detail priced at or above the value.
+        """
         if value in [None, '']:
             return queryset
-        return queryset.filter(details__price__gte=value)
+        return queryset.filter(detail_exists(price__gte=value))
 
     def filter_max_delivery_time(self, queryset, name, value):
+        """
+        Keep offers with at least one detail delivered within the value in days.
+        """
         if value in [None, '']:
             return queryset
-        annotated_queryset = queryset.annotate(
-            _min_delivery_time=Min('details__delivery_time_in_days'))
-        return annotated_queryset.filter(_min_delivery_time__lte=value)
+        return queryset.filter(detail_exists(delivery_time_in_days__lte=value))
 
-    def filter_queryset(self, queryset):
-        return super().filter_queryset(queryset)
+    def filter_feature(self, queryset, name, value):
+        """
+        Keep offers with a detail listing the feature, ignoring case and extra spaces.
+        """
+        normalized = normalize_feature(value)
+        if not normalized:
+            return queryset
+        return queryset.filter(detail_exists(feature_entries__normalized=normalized))
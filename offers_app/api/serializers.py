@@ -1,13 +1,19 @@
-from urllib.parse import urlparse
+from functools import lru_cache
 
+from django.core.signals import setting_changed
 from django.db.models import Min
+from django.dispatch import receiver
+from django.urls import get_script_prefix, get_urlconf, reverse
 from rest_framework import serializers
 
+from core.profiling import ProfiledSerializerMixin
+from core.serializers import SparseFieldsetMixin
+
 from offers_app.models import Offer, OfferDetail
 from users_app.models import Profile
 
 
-class UserDetailsSerializer(serializers.ModelSerializer):
+class UserDetailsSerializer(ProfiledSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for user details in the Offer model.
     """
@@ -22,7 +28,65 @@ class UserDetailsSerializer(serializers.ModelSerializer):
         ]
 
 
-class RelativeHyperlinkedIdentityField(serializers.HyperlinkedIdentityField):
+URL_TEMPLATE_MARKER = 987654321
+
+
+@lru_cache(maxsize=None)
+def resolve_url_template(view_name, lookup_url_kwarg, script_prefix, urlconf):
+    """
+    Reverse the route once with a marker value and split the URL around it.
+    """
+    url = reverse(view_name, kwargs={
+                  lookup_url_kwarg: URL_TEMPLATE_MARKER}, urlconf=urlconf)
+    head, _, tail = url.partition(str(URL_TEMPLATE_MARKER))
+    return head, tail
+
+
+@receiver(setting_changed)
+def clear_url_templates(setting, **kwargs):
+    if setting == 'ROOT_URLCONF':
+        resolve_url_template.cache_clear()
+
+
+class TemplatedHyperlinkedIdentityField(serializers.HyperlinkedIdentityField):
+    """
+    Hyperlinked identity field that formats the lookup value into a cached route.
+
+    The route is reversed once per view name, script prefix and URLconf instead of
+    once per object, and the absolute prefix is built once per request for
+    integer keys. The output is the same as HyperlinkedIdentityField.
+    """
+
+    absolute_head = None
+
+    def get_template(self):
+        return resolve_url_template(
+            self.view_name, self.lookup_url_kwarg, get_script_prefix(), get_urlconf())
+
+    def get_path(self, obj):
+        lookup_value = getattr(obj, self.lookup_field)
+        if lookup_value in (None, ''):
+            return None
+        head, tail = self.get_template()
+        return f'{head}{lookup_value}{tail}'
+
+    def get_url(self, obj, view_name, request, format):
+        if format or view_name != self.view_name:
+            return super().get_url(obj, view_name, request, format)
+        lookup_value = getattr(obj, self.lookup_field)
+        if request is not None and isinstance(lookup_value, int):
+            head, tail = self.get_template()
+            if self.absolute_head is None or self.absolute_head[:2] != (request, head):
+                self.absolute_head = (
+                    request, head, request.build_absolute_uri(head))
+            return f'{self.absolute_head[2]}{lookup_value}{tail}'
+        path = self.get_path(obj)
+        if path is None or request is None:
+            return path
+        return request.build_absolute_uri(path)
+
+
+class RelativeHyperlinkedIdentityField(TemplatedHyperlinkedIdentityField):
     """
     Custom field to return a relative URL instead of an absolute one.
     """
@@ -31,15 +95,19 @@ class RelativeHyperlinkedIdentityField(serializers.HyperlinkedIdentityField):
         """
         Override the to_representation method to customize the output.
         """
-        full_url = super().to_representation(value)
-        parsed = urlparse(full_url)
-        path = parsed.path
+        assert 'request' in self.context, (
+            "`%s` requires the request in the serializer context."
+            % self.__class__.__name__
+        )
+        path = self.get_path(value)
+        if path is None:
+            return None
         if path.startswith('/api'):
             path = path[len('/api'):]
         return path
 
 
-class OfferDetailBaseSerializer(serializers.ModelSerializer):
+class OfferDetailBaseSerializer(ProfiledSerializerMixin, SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Base serializer for OfferDetail, used for creating or showing details.
     It includes fields necessary for creating an offer detail.
@@ -63,11 +131,11 @@ class OfferDetailBaseSerializer(serializers.ModelSerializer):
         ]
 
 
-class OfferDetailReadSerializerHyperlink(serializers.ModelSerializer):
+class OfferDetailReadSerializerHyperlink(ProfiledSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for reading OfferDetail with a hyperlink.
     """
-    url = serializers.HyperlinkedIdentityField(
+    url = TemplatedHyperlinkedIdentityField(
         view_name='offerdetails-detail',
         lookup_field='pk'
     )
@@ -80,7 +148,7 @@ class OfferDetailReadSerializerHyperlink(serializers.ModelSerializer):
         ]
 
 
-class OfferDetailReadSerializerRelativeHyperlinked(serializers.ModelSerializer):
+class OfferDetailReadSerializerRelativeHyperlinked(ProfiledSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for reading OfferDetail with a relative URL.
     """
@@ -97,7 +165,7 @@ class OfferDetailReadSerializerRelativeHyperlinked(serializers.ModelSerializer):
         ]
 
 
-class OfferListReadSerializer(serializers.ModelSerializer):
+class OfferListReadSerializer(ProfiledSerializerMixin, SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for reading Offer details with nested OfferDetails.
     """
@@ -126,13 +194,19 @@ class OfferListReadSerializer(serializers.ModelSerializer):
     def get_min_price(self, obj):
         """
         Get the minimum price from the offer details.
+        Uses the min_price annotation of the view's queryset when present.
         """
+        if hasattr(obj, 'min_price'):
+            return obj.min_price or 0
         return obj.details.aggregate(min_price=Min('price'))['min_price'] or 0
 
     def get_min_delivery_time(self, obj):
         """
         Get the minimum delivery time from the offer details.
+        Uses the min_delivery_time annotation of the view's queryset when present.
         """
+        if hasattr(obj, 'min_delivery_time'):
+            return obj.min_delivery_time
         return obj.details.aggregate(min_delivery_time=Min('delivery_time_in_days'))['min_delivery_time']
 
 
@@ -196,7 +270,7 @@ class OfferCreateSerializer(serializers.ModelSerializer):
             detail_instance.save()
 
 
-class OfferRetrieveSerializer(serializers.ModelSerializer):
+class OfferRetrieveSerializer(ProfiledSerializerMixin, SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for retrieving an Offer with its details.
     """
@@ -222,11 +296,17 @@ class OfferRetrieveSerializer(serializers.ModelSerializer):
     def get_min_price(self, obj):
         """
         Get the minimum price from the offer details.
+        Uses the min_price annotation of the view's queryset when present.
         """
+        if hasattr(obj, 'min_price'):
+            return obj.min_price or 0
         return obj.details.aggregate(min_price=Min('price'))['min_price'] or 0
 
     def get_min_delivery_time(self, obj):
         """
         Get the minimum delivery time from the offer details.
+        Uses the min_delivery_time annotation of the view's queryset when present.
         """
+        if hasattr(obj, 'min_delivery_time'):
+            return obj.min_delivery_time
         return obj.details.aggregate(min_delivery_time=Min('delivery_time_in_days'))['min_delivery_time']
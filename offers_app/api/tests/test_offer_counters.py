@@ -0,0 +1,106 @@
+import threading
+
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from unittest import mock
+
+from offers_app.models import OfferCounter
+from offers_app.testing import create_offer
+from offers_app.view_counters import (
+    IMPRESSIONS, VIEWS, CounterBuffer, flush_offer_counters, reset_counter_buffer)
+
+User = get_user_model()
+
+
+@override_settings(OFFER_COUNTER_FLUSH_INTERVAL=3600, OFFER_COUNTER_FLUSH_THRESHOLD=1000)
+class OfferCounterTests(APITestCase):
+    """
+    Test cases for the buffered offer view and impression counters.
+    """
+
+    def setUp(self):
+        reset_counter_buffer()
+        self.user = User.objects.create_user(
+            username='business_user', password='password123', type='business')
+        self.client.force_authenticate(user=self.user)
+        self.offers = [create_offer(self.user, f'Offer {index}') for index in range(3)]
+
+    def tearDown(self):
+        reset_counter_buffer()
+
+    def get_counts(self):
+        return {counter.offer_id: (counter.views, counter.impressions)
+                for counter in OfferCounter.objects.all()}
+
+    def test_views_and_impressions_are_written_on_flush(self):
+        for _ in range(3):
+            self.client.get(reverse('offers-detail', kwargs={'pk': self.offers[0].pk}))
+        self.client.get(reverse('offers-detail', kwargs={'pk': 999}))
+        self.client.get(reverse('offers-list'), {'page_size': 2, 'ordering': 'updated_at'})
+        self.assertEqual(OfferCounter.objects.count(), 0)
+
+        with self.assertNumQueries(4):
+            self.assertEqual(flush_offer_counters(), 2)
+        self.assertEqual(self.get_counts(), {
+            self.offers[0].pk: (3, 1), self.offers[1].pk: (0, 1)})
+
+        self.client.get(reverse('offers-detail', kwargs={'pk': self.offers[0].pk}))
+        flush_offer_counters()
+        self.assertEqual(self.get_counts()[self.offers[0].pk], (4, 1))
+        self.assertEqual(flush_offer_counters(), 0)
+
+    def test_ordering_by_views(self):
+        buffer = CounterBuffer(3600, 1000)
+        buffer.add([self.offers[1].pk, self.offers[1].pk, self.offers[2].pk], VIEWS)
+        buffer.flush()
+        response = self.client.get(
+            reverse('offers-list'), {'page_size': 10, 'ordering': '-views'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([offer['id'] for offer in response.data['results']],
+                         [self.offers[1].pk, self.offers[2].pk, self.offers[0].pk])
+
+    def test_threshold_triggers_a_flush(self):
+        buffer = CounterBuffer(3600, 3)
+        buffer.add([self.offers[0].pk] * 2, IMPRESSIONS)
+        self.assertEqual(len(buffer), 2)
+        buffer.add([self.offers[0].pk], IMPRESSIONS)
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(self.get_counts(), {self.offers[0].pk: (0, 3)})
+
+    def test_failed_flush_keeps_the_counts(self):
+        buffer = CounterBuffer(3600, 1000)
+        buffer.add([self.offers[0].pk], VIEWS)
+        with mock.patch('offers_app.view_counters.write_counts',
+                        side_effect=DatabaseError), \
+                self.assertLogs('offers_app.view_counters', 'ERROR'):
+            self.assertEqual(buffer.flush(), 0)
+        self.assertEqual(len(buffer), 1)
+        buffer.add([self.offers[0].pk], VIEWS)
+        self.assertEqual(buffer.flush(), 1)
+        self.assertEqual(self.get_counts(), {self.offers[0].pk: (2, 0)})
+
+    def test_deleted_offers_are_skipped(self):
+        buffer = CounterBuffer(3600, 1000)
+        buffer.add([self.offers[0].pk, self.offers[1].pk], VIEWS)
+        self.offers[1].delete()
+        self.assertEqual(buffer.flush(), 1)
+        self.assertEqual(list(self.get_counts()), [self.offers[0].pk])
+
+    def test_concurrent_increments_are_not_lost(self):
+        buffer = CounterBuffer(3600, 10 ** 9)
+
+        def view():
+            for _ in range(1000):
+                buffer.add([self.offers[0].pk], VIEWS)
+
+        threads = [threading.Thread(target=view) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        buffer.flush()
+        self.assertEqual(self.get_counts(), {self.offers[0].pk: (8000, 0)})
@@ -0,0 +1,115 @@
+import time
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_app.facets import DELIVERY_TIME_BUCKETS, FACETS_CACHE_TIMEOUT, PRICE_BUCKETS
+from offers_app.models import Offer, OfferDetail
+
+User = get_user_model()
+
+
+class OfferFacetsTests(APITestCase):
+    """
+    Test cases for the offer search facets.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('offers-facets')
+        self.business_user = User.objects.create_user(
+            username='business_user',
+            password='password123',
+            type='business'
+        )
+        self.offers = []
+        specs = [
+            ('Logo design', [('basic', 30, 2), ('standard', 120, 5), ('premium', 600, 10)]),
+            ('Website design', [('basic', 80, 7), ('premium', 300, 20)]),
+            ('Video editing', [('standard', 45, 1)]),
+            ('Empty offer', []),
+        ]
+        for title, details in specs:
+            offer = Offer.objects.create(
+                title=title, image=None, description=title, user=self.business_user)
+            created = [
+                OfferDetail.objects.create(
+                    offer=offer, title=offer_type, revisions=1,
+                    delivery_time_in_days=delivery_time, price=price,
+                    features=[], offer_type=offer_type)
+                for offer_type, price, delivery_time in details
+            ]
+            self.offers.append((offer, created))
+
+    def oracle(self, offers):
+        def count(condition):
+            return sum(1 for _, details in offers if any(condition(detail) for detail in details))
+        return {
+            'price': [
+                {'min': low, 'max': high, 'count': count(
+                    lambda detail: detail.price >= low and (high is None or detail.price < high))}
+                for low, high in PRICE_BUCKETS
+            ],
+            'delivery_time': [
+                {'min': low, 'max': high, 'count': count(
+                    lambda detail: detail.delivery_time_in_days >= low
+                    and (high is None or detail.delivery_time_in_days <= high))}
+                for low, high in DELIVERY_TIME_BUCKETS
+            ],
+            'offer_type': {
+                offer_type: count(lambda detail: detail.offer_type == offer_type)
+                for offer_type in ['basic', 'standard', 'premium']
+            },
+        }
+
+    def test_facets_match_oracle(self):
+        """
+        Test the facets of several searches against counts computed in Python.
+        """
+        cases = [
+            ({}, self.offers),
+            ({'search': 'design'}, self.offers[:2]),
+            ({'min_price': 100}, self.offers[:2]),
+            ({'max_delivery_time': 1}, self.offers[2:3]),
+        ]
+        for params, offers in cases:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data, self.oracle(offers), params)
+
+    def test_facets_single_query_and_cache(self):
+        """
+        Test that facets take one aggregate query and are cached per normalized query.
+        """
+        with self.assertNumQueries(1):
+            first = self.client.get(self.url, {'search': 'Design ', 'page': 2})
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url, {'search': 'design'})
+        self.assertEqual(first.data, second.data)
+
+    def test_facets_expire_after_the_cache_timeout(self):
+        """
+        Test that changed offers show up in the facets once the cached counts expire.
+        """
+        self.client.get(self.url)
+        detail = self.offers[2][1][0]
+        detail.price = Decimal('1000')
+        detail.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['price'][-1]['count'], 1)
+        expired = time.time() + FACETS_CACHE_TIMEOUT + 1
+        with mock.patch('django.core.cache.backends.locmem.time.time', return_value=expired):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data['price'][-1]['count'], 2)
+
+    def test_facets_invalid_filter(self):
+        """
+        Test that invalid filter values are rejected like on the offer list.
+        """
+        response = self.client.get(self.url, {'min_price': 'abc'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,90 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_app.models import Offer, OfferDetail, OfferFeature
+
+User = get_user_model()
+
+
+class OfferFeatureTests(APITestCase):
+    """
+    Test cases for the features side table, feature filter and autocompletion.
+    """
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(
+            username='business_user',
+            password='password123',
+            type='business'
+        )
+        self.logo_offer = self.create_offer(
+            'Logo', [['Logo Design', 'Source files'], ['Logo design', 'Print ready']])
+        self.web_offer = self.create_offer(
+            'Website', [['Responsive layout', 'Source  files']])
+        self.other_offer = self.create_offer('Other', [[]])
+
+    def create_offer(self, title, features_per_detail):
+        offer = Offer.objects.create(
+            title=title, image=None, description=title, user=self.business_user)
+        for index, features in enumerate(features_per_detail):
+            OfferDetail.objects.create(
+                offer=offer, title=f'{title} {index}', revisions=1,
+                delivery_time_in_days=3, price=50, features=features,
+                offer_type=['basic', 'standard', 'premium'][index])
+        return offer
+
+    def test_features_are_synced(self):
+        """
+        Test that detail writes keep the side table in sync.
+        """
+        detail = self.logo_offer.details.get(offer_type='basic')
+        self.assertEqual(
+            sorted(detail.feature_entries.values_list('normalized', flat=True)),
+            ['logo design', 'source files'])
+        detail.features = ['Source files', 'Express delivery', 'express  DELIVERY', 3]
+        detail.save()
+        self.assertEqual(
+            sorted(detail.feature_entries.values_list('name', flat=True)),
+            ['Express delivery', 'Source files'])
+        detail.delete()
+        self.assertFalse(OfferFeature.objects.filter(detail_id=detail.id).exists())
+
+    def test_filter_by_feature(self):
+        """
+        Test filtering the offer list by feature without touching the JSON column.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse('offers-list'), {'feature': ' source FILES', 'page_size': 10})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual({offer['id'] for offer in response.data['results']},
+                         {self.logo_offer.id, self.web_offer.id})
+        self.assertFalse(any('"features"' in query['sql'] and 'LIKE' in query['sql']
+                             for query in queries.captured_queries))
+
+    def test_autocomplete_features(self):
+        """
+        Test prefix suggestions with the number of offers per feature.
+        """
+        url = reverse('offers-features')
+        response = self.client.get(url, {'q': 'LOGO'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['offer_count'], 1)
+        self.assertEqual(response.data[0]['name'].lower(), 'logo design')
+        response = self.client.get(url, {'q': 's'})
+        self.assertEqual(response.data, [{'name': 'Source files', 'offer_count': 2}])
+        response = self.client.get(url, {'limit': 2})
+        self.assertEqual(response.data[0], {'name': 'Source files', 'offer_count': 2})
+        self.assertEqual(len(response.data), 2)
+
+    def test_autocomplete_invalid_limit(self):
+        """
+        Test that a non-numeric limit is rejected.
+        """
+        response = self.client.get(reverse('offers-features'), {'limit': 'abc'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
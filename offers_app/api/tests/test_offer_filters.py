@@ -0,0 +1,132 @@
+import random
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_app.api.filters import OfferFilter, annotate_detail_summary
+from offers_app.models import Offer, OfferDetail
+from users_app.models import Profile
+
+User = get_user_model()
+
+WORDS = ['logo', 'website', 'design', 'video', 'audio', 'brand']
+
+
+class OfferFilterOracleTests(APITestCase):
+    """
+    Test cases comparing the offer filters with a brute-force Python oracle.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        generator = random.Random(41)
+        cls.users = []
+        for index in range(3):
+            user = User.objects.create_user(
+                username=f'business{index}',
+                email=f'business{index}@mail.de',
+                password='password123',
+                type='business'
+            )
+            Profile.objects.create(user=user)
+            cls.users.append(user)
+        cls.offers = []
+        for index in range(40):
+            offer = Offer.objects.create(
+                user=generator.choice(cls.users),
+                title=f'{generator.choice(WORDS)} offer {index}',
+                description=f'All about {generator.choice(WORDS)}',
+                image=None
+            )
+            details = [
+                OfferDetail.objects.create(
+                    offer=offer, title=offer_type, revisions=1,
+                    delivery_time_in_days=generator.randint(1, 14),
+                    price=Decimal(generator.randint(10, 500)), features=[],
+                    offer_type=offer_type)
+                for offer_type in ['basic', 'standard', 'premium'][:generator.randint(0, 3)]
+            ]
+            cls.offers.append((offer, details))
+
+    def oracle(self, params):
+        """
+        Compute the expected offers of a query directly from the created objects.
+        """
+        expected = []
+        for offer, details in self.offers:
+            if 'creator_id' in params and offer.user_id != params['creator_id']:
+                continue
+            if 'min_price' in params and not any(
+                    detail.price >= params['min_price'] for detail in details):
+                continue
+            if 'max_delivery_time' in params and not any(
+                    detail.delivery_time_in_days <= params['max_delivery_time'] for detail in details):
+                continue
+            if 'search' in params and params['search'] not in \
+                    f'{offer.title}\n{offer.description}'.lower():
+                continue
+            expected.append({
+                'id': offer.id,
+                'min_price': min([detail.price for detail in details], default=0),
+                'min_delivery_time': min(
+                    [detail.delivery_time_in_days for detail in details], default=None),
+            })
+        return expected
+
+    def random_params(self, generator):
+        params = {}
+        if generator.random() < 0.3:
+            params['creator_id'] = generator.choice(self.users).id
+        if generator.random() < 0.6:
+            params['min_price'] = generator.randint(0, 520)
+        if generator.random() < 0.6:
+            params['max_delivery_time'] = generator.randint(0, 15)
+        if generator.random() < 0.4:
+            params['search'] = generator.choice(WORDS)
+        if generator.random() < 0.5:
+            params['ordering'] = generator.choice(['min_price', '-min_price'])
+        return params
+
+    def test_filters_match_oracle(self):
+        """
+        Test random filter combinations against the oracle, without duplicates.
+        """
+        generator = random.Random(7)
+        for _ in range(80):
+            params = self.random_params(generator)
+            response = self.client.get(
+                reverse('offers-list'), {**params, 'page_size': 1000})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            results = response.data['results']
+            expected = self.oracle(params)
+            ids = [offer['id'] for offer in results]
+            self.assertEqual(len(ids), len(set(ids)), params)
+            self.assertEqual(response.data['count'], len(expected), params)
+            self.assertEqual(set(ids), {offer['id']
+                             for offer in expected}, params)
+            by_id = {offer['id']: offer for offer in expected}
+            for offer in results:
+                self.assertEqual(offer['min_price'],
+                                 by_id[offer['id']]['min_price'], params)
+                self.assertEqual(offer['min_delivery_time'],
+                                 by_id[offer['id']]['min_delivery_time'], params)
+            if params.get('ordering') in ['min_price', '-min_price']:
+                prices = [offer['min_price'] for offer in results]
+                self.assertEqual(prices, sorted(
+                    prices, reverse=params['ordering'] == '-min_price'), params)
+
+    def test_filters_do_not_join_details(self):
+        """
+        Test that combined filters compile to EXISTS predicates without GROUP BY.
+        """
+        queryset = OfferFilter(
+            {'min_price': 100, 'max_delivery_time': 5},
+            queryset=annotate_detail_summary(Offer.objects.all())
+        ).qs
+        sql = str(queryset.query).upper()
+        self.assertNotIn('GROUP BY', sql)
+        self.assertNotIn('JOIN', sql)
+        self.assertEqual(sql.count('EXISTS'), 2)
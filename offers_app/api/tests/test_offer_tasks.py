@@ -0,0 +1,63 @@
+import shutil
+import tempfile
+from io import BytesIO
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from offers_app.models import Offer
+from offers_app.tasks import MAX_IMAGE_SIZE, process_offer_image
+
+User = get_user_model()
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class OfferImageTaskTests(TestCase):
+    """
+    Test cases for the offer image background task.
+    """
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def create_offer(self, size):
+        user = User.objects.create_user(
+            username="business",
+            email="business@mail.de",
+            password="password123",
+            type="business"
+        )
+        buffer = BytesIO()
+        Image.new('RGB', size).save(buffer, format='PNG')
+        return Offer.objects.create(
+            user=user,
+            title="Offer",
+            description="Description",
+            image=SimpleUploadedFile('offer.png', buffer.getvalue())
+        )
+
+    def test_large_image_is_downscaled(self):
+        """
+        Test that a large image is resized to fit MAX_IMAGE_SIZE.
+        """
+        offer = self.create_offer((MAX_IMAGE_SIZE * 2, MAX_IMAGE_SIZE))
+        process_offer_image(offer.id)
+        offer.refresh_from_db()
+        with offer.image.open('rb') as image_file:
+            self.assertEqual(Image.open(image_file).size,
+                             (MAX_IMAGE_SIZE, MAX_IMAGE_SIZE // 2))
+
+    def test_small_image_is_kept(self):
+        """
+        Test that an image within the limit is not rewritten.
+        """
+        offer = self.create_offer((100, 100))
+        name = offer.image.name
+        process_offer_image(offer.id)
+        offer.refresh_from_db()
+        self.assertEqual(offer.image.name, name)
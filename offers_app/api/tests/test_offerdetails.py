@@ -43,6 +43,46 @@ class OfferDetailTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['title'], "Test Offer Detail")
 
+    def test_get_offer_details_by_ids(self):
+        """
+        Test retrieving several offer details in the requested order.
+        """
+        premium = OfferDetail.objects.create(
+            offer=self.offer_parent,
+            title="Premium Offer Detail",
+            revisions=5,
+            delivery_time_in_days=3,
+            price=200.00,
+            features=["Feature 1"],
+            offer_type="premium"
+        )
+        self.client.force_authenticate(user=self.business_user)
+        url = reverse('offerdetails-list') + \
+            f'?ids={premium.id},{self.offer.id},{premium.id}'
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([detail['id'] for detail in response.data],
+                         [premium.id, self.offer.id])
+
+    def test_get_offer_details_by_oversized_id(self):
+        """
+        Test retrieving offer details with an ID too large for the database.
+        Should return a 400 status code.
+        """
+        self.client.force_authenticate(user=self.business_user)
+        url = reverse('offerdetails-list') + '?ids=99999999999999999999999'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_offer_details_by_ids_unauthenticated(self):
+        """
+        Test retrieving several offer details without authentication.
+        """
+        url = reverse('offerdetails-list') + f'?ids={self.offer.id}'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
     def test_get_offer_detail_unauthenticated(self):
         """
         Test retrieving an offer detail without authentication.
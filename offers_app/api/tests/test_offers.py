@@ -1,5 +1,5 @@
 from django.contrib.auth import get_user_model
-from django.urls import reverse
+from django.urls import clear_script_prefix, reverse, set_script_prefix
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -444,3 +444,70 @@ class OffersRetrieveUpdateDeleteTests(APITestCase):
         detail_url = reverse('offers-detail', kwargs={'pk': 9999999})
         response = self.client.delete(detail_url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class OfferDetailUrlTests(APITestCase):
+    """
+    Test cases for the offer detail URLs in offer responses.
+    """
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(
+            username='business_user',
+            password='password123',
+            type='business'
+        )
+        Profile.objects.create(user=self.business_user)
+        self.offer = Offer.objects.create(
+            title="Test Offer",
+            image=None,
+            description="Test offer description",
+            user=self.business_user
+        )
+        self.details = [
+            OfferDetail.objects.create(
+                offer=self.offer, title=offer_type, revisions=1,
+                delivery_time_in_days=3, price=50, features=[],
+                offer_type=offer_type)
+            for offer_type in ['basic', 'standard', 'premium']
+        ]
+
+    def test_list_urls_are_relative(self):
+        """
+        Test that the offer list links the details relative to /api.
+        """
+        response = self.client.get(reverse('offers-list'), {'page_size': 10})
+        details = response.data['results'][0]['details']
+        self.assertEqual(details, [
+            {'id': detail.id, 'url': reverse('offerdetails-detail', kwargs={
+                'pk': detail.id})[len('/api'):]}
+            for detail in self.details
+        ])
+
+    def test_retrieve_urls_are_absolute(self):
+        """
+        Test that a single offer links the details with absolute URLs.
+        """
+        self.client.force_authenticate(user=self.business_user)
+        response = self.client.get(
+            reverse('offers-detail', kwargs={'pk': self.offer.id}))
+        self.assertEqual(response.data['details'], [
+            {'id': detail.id, 'url': 'http://testserver' + reverse(
+                'offerdetails-detail', kwargs={'pk': detail.id})}
+            for detail in self.details
+        ])
+
+    def test_urls_follow_script_prefix(self):
+        """
+        Test that the URLs include the script prefix of the deployment.
+        """
+        self.client.force_authenticate(user=self.business_user)
+        url = reverse('offers-detail', kwargs={'pk': self.offer.id})
+        set_script_prefix('/backend/')
+        try:
+            response = self.client.get(url)
+        finally:
+            clear_script_prefix()
+        self.assertEqual(
+            response.data['details'][0]['url'],
+            f'http://testserver/backend/api/offerdetails/{self.details[0].id}/')
@@ -0,0 +1,122 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_app.models import Offer, OfferDetail
+from offers_app.ranking import compute_rank, refresh_offer_ranks
+from orders_app.models import Order
+from reviews_app.models import Review
+from users_app.models import Profile
+
+User = get_user_model()
+
+
+class OfferRankingTests(APITestCase):
+    """
+    Test cases for the precomputed offer rank and the rank ordering.
+    """
+
+    def setUp(self):
+        self.url = reverse('offers-list')
+        self.customer_user = User.objects.create_user(
+            username="customer",
+            email="customer@mail.de",
+            password="password123",
+            type="customer"
+        )
+        Profile.objects.create(user=self.customer_user)
+        self.good_seller = self.create_business_user("good")
+        self.new_seller = self.create_business_user("new")
+        self.good_offer = self.create_offer(self.good_seller, "Good Offer")
+        self.new_offer = self.create_offer(self.new_seller, "New Offer")
+        Review.objects.create(
+            business_user=self.good_seller,
+            reviewer=self.customer_user,
+            rating=5,
+            description="Great"
+        )
+        Order.objects.create(
+            customer_user=self.customer_user,
+            business_user=self.good_seller,
+            offer=self.good_offer.details.first(),
+            status='completed'
+        )
+
+    def create_business_user(self, username):
+        user = User.objects.create_user(
+            username=username,
+            email=f"{username}@mail.de",
+            password="password123",
+            type="business"
+        )
+        Profile.objects.create(user=user)
+        return user
+
+    def create_offer(self, user, title):
+        offer = Offer.objects.create(
+            user=user, title=title, image=None, description="Description")
+        OfferDetail.objects.create(
+            offer=offer,
+            title="Basic",
+            revisions=1,
+            delivery_time_in_days=3,
+            price=50,
+            features=["A"],
+            offer_type="basic"
+        )
+        return offer
+
+    def test_compute_rank_prefers_reviews_and_orders(self):
+        """
+        Test that reviews and completed orders raise the rank.
+        """
+        now = timezone.now()
+        unrated = compute_rank(None, 0, 0, now, now)
+        rated = compute_rank(5, 10, 20, now, now)
+        old = compute_rank(5, 10, 20, now - timedelta(days=365), now)
+        self.assertGreater(rated, unrated)
+        self.assertGreater(rated, old)
+
+    def test_refresh_offer_ranks_command(self):
+        """
+        Test that the command stores ranks for all offers.
+        """
+        call_command('refresh_offer_ranks', '--full', stdout=StringIO())
+        self.good_offer.refresh_from_db()
+        self.new_offer.refresh_from_db()
+        self.assertIsNotNone(self.good_offer.rank_updated_at)
+        self.assertGreater(self.good_offer.rank, self.new_offer.rank)
+
+    def test_incremental_refresh_only_touches_changed_offers(self):
+        """
+        Test that an incremental refresh skips offers without changes.
+        """
+        refresh_offer_ranks(full=True)
+        self.assertEqual(refresh_offer_ranks(), 0)
+        Review.objects.create(
+            business_user=self.new_seller,
+            reviewer=self.customer_user,
+            rating=4,
+            description="Good"
+        )
+        self.assertEqual(refresh_offer_ranks(), 1)
+
+    def test_default_ordering_is_rank(self):
+        """
+        Test that the offer list is sorted by rank by default and via ordering=rank.
+        """
+        refresh_offer_ranks(full=True)
+        response = self.client.get(self.url, {'page_size': 10})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        titles = [offer['title'] for offer in response.data['results']]
+        self.assertEqual(titles, ["Good Offer", "New Offer"])
+        response = self.client.get(
+            self.url, {'page_size': 10, 'ordering': 'rank'})
+        titles = [offer['title'] for offer in response.data['results']]
+        self.assertEqual(titles, ["New Offer", "Good Offer"])
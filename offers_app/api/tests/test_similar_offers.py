@@ -0,0 +1,96 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from events_app.dispatcher import dispatch_pending
+from offers_app.models import Offer, SimilarOffer
+from offers_app.similarity import get_stale_offers, refresh_similar_offers
+from offers_app.testing import create_offer
+
+User = get_user_model()
+
+
+class SimilarOfferTests(APITestCase):
+    """
+    Test cases for the precomputed similar offers and their endpoint.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='business_user',
+            password='password123',
+            type='business'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.logo = create_offer(
+            self.user, 'Logo design', 'A modern logo for your brand', ['Vector files'])
+        self.logo_premium = create_offer(
+            self.user, 'Premium logo design', 'Logo and brand guide',
+            ['Vector files', 'Brand guide'])
+        self.website = create_offer(
+            self.user, 'Website', 'A responsive landing page', ['Hosting setup'])
+        self.video = create_offer(
+            self.user, 'Video editing', 'Cut and color grading of your clips', [])
+
+    def get_similar(self, offer, **params):
+        response = self.client.get(
+            reverse('offers-similar', kwargs={'pk': offer.pk}), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def get_neighbours(self):
+        return {
+            offer_id: sorted(SimilarOffer.objects.filter(offer_id=offer_id).values_list(
+                'similar_id', flat=True))
+            for offer_id in Offer.objects.values_list('pk', flat=True)
+        }
+
+    def test_lists_most_similar_offers(self):
+        self.assertEqual(refresh_similar_offers(full=True), 4)
+        data = self.get_similar(self.logo)
+        self.assertEqual(data[0]['id'], self.logo_premium.id)
+        self.assertGreater(data[0]['similarity'], 0.3)
+        self.assertNotIn(self.logo.id, [item['id'] for item in data])
+        self.assertNotIn(self.video.id, [item['id'] for item in data])
+        self.assertEqual(data[0]['min_price'], 50)
+        self.assertEqual(
+            [item['similarity'] for item in data],
+            sorted((item['similarity'] for item in data), reverse=True))
+        self.assertEqual(len(self.get_similar(self.logo, limit=1)), 1)
+
+    def test_unknown_offer_and_authentication(self):
+        response = self.client.get(reverse('offers-similar', kwargs={'pk': 999}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.client.force_authenticate(user=None)
+        response = self.client.get(
+            reverse('offers-similar', kwargs={'pk': self.logo.pk}))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refreshes_changed_offers_incrementally(self):
+        refresh_similar_offers(full=True)
+        self.assertFalse(get_stale_offers().exists())
+        self.assertEqual(refresh_similar_offers(), 0)
+
+        self.video.title = 'Logo animation video'
+        self.video.save()
+        self.assertEqual(list(get_stale_offers()), [self.video])
+        self.assertEqual(refresh_similar_offers(), 1)
+        self.assertIn(self.video.id, [
+            item['id'] for item in self.get_similar(self.logo)])
+        incremental = self.get_neighbours()
+        refresh_similar_offers(full=True)
+        self.assertEqual(incremental, self.get_neighbours())
+
+    def test_detail_changes_mark_the_offer_stale(self):
+        refresh_similar_offers(full=True)
+        dispatch_pending()
+        detail = self.website.details.get()
+        detail.features = ['Logo design', 'Brand guide']
+        detail.save()
+        self.assertFalse(get_stale_offers().exists())
+        dispatch_pending()
+        self.assertEqual(list(get_stale_offers()), [self.website])
+        refresh_similar_offers()
+        self.assertIn(self.website.id, [
+            item['id'] for item in self.get_similar(self.logo_premium)])
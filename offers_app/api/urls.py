@@ -4,8 +4,15 @@ from . import views
 
 urlpatterns = [
     path('offers/', views.OfferListCreateView.as_view(), name='offers-list'),
+    path('offers/facets/', views.OfferFacetsView.as_view(), name='offers-facets'),
+    path('offers/features/', views.OfferFeatureSuggestView.as_view(),
+         name='offers-features'),
     path('offers/<int:pk>/',
          views.OfferRetrieveUpdateDestroyView.as_view(), name='offers-detail'),
+    path('offers/<int:pk>/similar/', views.OfferSimilarView.as_view(),
+         name='offers-similar'),
+    path('offerdetails/', views.OfferDetailMultiGetView.as_view(),
+         name='offerdetails-list'),
     path('offerdetails/<int:pk>/', views.OfferDetailView.as_view(),
          name='offerdetails-detail'),
 ]
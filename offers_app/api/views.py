@@ -1,30 +1,48 @@
-from django.db.models import Min
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce
+from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, filters
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
 
+from core.serializers import SparseFieldsetViewMixin
+from core.views import MultiGetMixin, SingleFlightMixin
 
-from offers_app.api.filters import OfferFilter
+from offers_app.api.filters import OfferFilter, annotate_detail_summary
 from offers_app.api.permissions import IsBusiness, IsOfferOwner
 from offers_app.api.serializers import OfferListReadSerializer, OfferCreateSerializer, OfferRetrieveSerializer, OfferDetailBaseSerializer
+from offers_app.facets import get_cached_offer_facets
+from offers_app.features import suggest_features
 from offers_app.models import Offer, OfferDetail
+from offers_app.similarity import NEIGHBOURS
+from offers_app.view_counters import record_impressions, record_views
+from sync_app.views import DeltaSyncMixin
 
 
-class OfferListCreateView(generics.ListCreateAPIView):
+class OfferListCreateView(SingleFlightMixin, DeltaSyncMixin, SparseFieldsetViewMixin, generics.ListCreateAPIView):
     """
     View to list and create offers.
+
+    Supports delta syncs with ?updated_since= (see DeltaSyncMixin).
+    Identical concurrent GETs share one response (see SingleFlightMixin).
+    Offers on a listed page count as impressions; ?ordering=-views and
+    ?ordering=-impressions sort by the buffered popularity counters.
     """
     filter_backends = [DjangoFilterBackend,
                        filters.OrderingFilter, filters.SearchFilter]
     filterset_class = OfferFilter
-    ordering_fields = ['updated_at', 'min_price']
+    ordering_fields = ['updated_at', 'min_price', 'rank', 'views', 'impressions']
+    ordering = ['-rank', '-updated_at']
     search_fields = ['title', 'description']
     pagination_class = PageNumberPagination
     pagination_class.page_size = 1
     pagination_class.page_size_query_param = 'page_size'
 
     permission_classes = [AllowAny]
+    sync_resource = 'offer'
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -35,12 +53,20 @@ class OfferListCreateView(generics.ListCreateAPIView):
         return OfferListReadSerializer
 
     def get_queryset(self):
-        queryset = Offer.objects.all()
-        creator_id = self.request.query_params.get('creator_id')
-        if creator_id:
-            queryset = queryset.filter(user__id=creator_id)
-        queryset = queryset.annotate(min_price=Min('details__price'))
-        return queryset
+        return annotate_detail_summary(Offer.objects.all()).annotate(
+            views=Coalesce(F('counter__views'), Value(0)),
+            impressions=Coalesce(F('counter__impressions'), Value(0)),
+        )
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if page is not None:
+            self.flight_state = [offer.pk for offer in page]
+            record_impressions(self.flight_state)
+        return page
+
+    def replay_flight_state(self, state):
+        record_impressions(state)
 
     def get_permissions(self):
         if self.request.method == 'POST':
@@ -49,12 +75,53 @@ class OfferListCreateView(generics.ListCreateAPIView):
             return [permission() for permission in self.permission_classes]
 
 
-class OfferRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+class OfferFacetsView(generics.GenericAPIView):
+    """
+    View to count the offers of a search per price, delivery time and offer type.
+
+    Accepts the same filter and search parameters as the offer list. The counts
+    are cached per query for up to FACETS_CACHE_TIMEOUT seconds.
+    """
     queryset = Offer.objects.all()
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
+    filterset_class = OfferFilter
+    search_fields = OfferListCreateView.search_fields
+    permission_classes = [AllowAny]
+
+    def get(self, request, *args, **kwargs):
+        offers = self.filter_queryset(self.get_queryset())
+        return Response(get_cached_offer_facets(request.query_params, offers))
+
+
+class OfferFeatureSuggestView(generics.GenericAPIView):
+    """
+    View to autocomplete feature names with ?q=<prefix>&limit=<n>.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = max(int(request.query_params.get('limit', 10)), 1)
+        except ValueError:
+            raise ValidationError({'limit': ["A valid integer is required."]})
+        return Response(suggest_features(request.query_params.get('q', ''), limit))
+
+
+class OfferRetrieveUpdateDestroyView(SingleFlightMixin, SparseFieldsetViewMixin, generics.RetrieveUpdateDestroyAPIView):
+    queryset = annotate_detail_summary(Offer.objects.all())
     serializer_class = OfferRetrieveSerializer
     permission_classes = [IsAuthenticated]
     http_method_names = ['get', 'patch', 'delete', 'options', 'head']
 
+    def retrieve(self, request, *args, **kwargs):
+        response = super().retrieve(request, *args, **kwargs)
+        self.flight_state = [int(kwargs['pk'])]
+        record_views(self.flight_state)
+        return response
+
+    def replay_flight_state(self, state):
+        record_views(state)
+
     def get_permissions(self):
         if self.request.method in ['PATCH', 'DELETE']:
             return [IsOfferOwner(), IsAuthenticated()]
@@ -68,10 +135,52 @@ class OfferRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
             return self.serializer_class
 
 
-class OfferDetailView(generics.RetrieveAPIView):
+class OfferSimilarView(SparseFieldsetViewMixin, generics.ListAPIView):
+    """
+    View to list the precomputed similar offers of an offer, most similar first.
+
+    Returns at most ?limit= offers (default and maximum NEIGHBOURS), each with
+    its similarity score.
+    """
+    serializer_class = OfferListReadSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        offer = get_object_or_404(Offer, pk=self.kwargs['pk'])
+        offers = Offer.objects.filter(similar_of__offer=offer).annotate(
+            similarity=F('similar_of__score')).order_by('-similarity', 'pk')
+        return annotate_detail_summary(offers).select_related(
+            'user__profile').prefetch_related('details')
+
+    def list(self, request, *args, **kwargs):
+        try:
+            limit = int(request.query_params.get('limit', NEIGHBOURS))
+        except ValueError:
+            raise ValidationError({'limit': ["A valid integer is required."]})
+        offers = self.filter_queryset(self.get_queryset())[
+            :min(max(limit, 1), NEIGHBOURS)]
+        data = self.get_serializer(offers, many=True).data
+        for offer, item in zip(offers, data):
+            item['similarity'] = round(offer.similarity, 4)
+        return Response(data)
+
+
+class OfferDetailView(SparseFieldsetViewMixin, generics.RetrieveAPIView):
     """
     View to retrieve offer details.
     """
     queryset = OfferDetail.objects.all()
     serializer_class = OfferDetailBaseSerializer
     permission_classes = [IsAuthenticated]
+
+
+class OfferDetailMultiGetView(SparseFieldsetViewMixin, MultiGetMixin, generics.GenericAPIView):
+    """
+    View to retrieve several offer details at once with ?ids=1,2,3.
+    """
+    queryset = OfferDetail.objects.all()
+    serializer_class = OfferDetailBaseSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        return self.multi_get(request, *args, **kwargs)
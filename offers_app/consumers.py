@@ -0,0 +1,30 @@
+from events_app.registry import consumer
+from offers_app.models import Offer
+from offers_app.tasks import process_offer_image, refresh_seller_offer_ranks
+
+
+@consumer('offers.process_image', topics=['offer.created'])
+def process_new_offer_image(event):
+    """
+    Enqueue image processing for new offers with an image.
+    """
+    if event.payload.get('has_image'):
+        process_offer_image.delay(event.aggregate_id)
+
+
+@consumer('offers.refresh_seller_ranks',
+          topics=['review.*', 'order.updated', 'order.status_changed', 'order.deleted'])
+def refresh_ranks_of_seller(event):
+    """
+    Enqueue a rank refresh for the seller whose reviews or orders changed.
+    """
+    refresh_seller_offer_ranks.delay(event.payload['business_user_id'])
+
+
+@consumer('offers.mark_details_changed', topics=['offerdetail.*'])
+def mark_details_changed(event):
+    """
+    Record when the details of an offer changed, so its similar offers are recomputed.
+    """
+    Offer.objects.filter(pk=event.payload['offer_id']).update(
+        details_updated_at=event.created_at)
@@ -0,0 +1,102 @@
+import hashlib
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from offers_app.models import OfferDetail, normalize_feature
+
+# Prices: min inclusive, max exclusive.
+PRICE_BUCKETS = [(0, 50), (50, 100), (100, 250), (250, 500), (500, None)]
+# Delivery times in days: min and max inclusive.
+DELIVERY_TIME_BUCKETS = [(1, 1), (2, 3), (4, 7), (8, 14), (15, None)]
+
+FACET_PARAMS = ['creator_id', 'min_price',
+                'max_delivery_time', 'feature', 'search']
+FACETS_CACHE_TIMEOUT = 300
+
+
+def price_condition(low, high):
+    condition = Q(price__gte=low)
+    if high is not None:
+        condition &= Q(price__lt=high)
+    return condition
+
+
+def delivery_time_condition(low, high):
+    condition = Q(delivery_time_in_days__gte=low)
+    if high is not None:
+        condition &= Q(delivery_time_in_days__lte=high)
+    return condition
+
+
+def compute_offer_facets(offers):
+    """
+    Count the given offers per price bucket, delivery time bucket and offer type.
+
+    An offer is counted in a bucket when at least one of its details falls into
+    it. All counts come from a single aggregate over the details of the offers,
+    using one conditional COUNT(DISTINCT offer) per bucket.
+    """
+    aggregates = {}
+    for index, (low, high) in enumerate(PRICE_BUCKETS):
+        aggregates[f'price_{index}'] = Count(
+            'offer', distinct=True, filter=price_condition(low, high))
+    for index, (low, high) in enumerate(DELIVERY_TIME_BUCKETS):
+        aggregates[f'delivery_time_{index}'] = Count(
+            'offer', distinct=True, filter=delivery_time_condition(low, high))
+    for offer_type, _ in OfferDetail.OFFER_TYPE_CHOICES:
+        aggregates[f'offer_type_{offer_type}'] = Count(
+            'offer', distinct=True, filter=Q(offer_type=offer_type))
+    counts = OfferDetail.objects.filter(
+        offer__in=offers.order_by().values('pk')).aggregate(**aggregates)
+    return {
+        'price': [
+            {'min': low, 'max': high, 'count': counts[f'price_{index}']}
+            for index, (low, high) in enumerate(PRICE_BUCKETS)
+        ],
+        'delivery_time': [
+            {'min': low, 'max': high, 'count': counts[f'delivery_time_{index}']}
+            for index, (low, high) in enumerate(DELIVERY_TIME_BUCKETS)
+        ],
+        'offer_type': {
+            offer_type: counts[f'offer_type_{offer_type}']
+            for offer_type, _ in OfferDetail.OFFER_TYPE_CHOICES
+        },
+    }
+
+
+def get_facets_cache_key(query_params):
+    """
+    Build the cache key of a facet query from its normalized filter parameters.
+
+    Only the filter and search parameters are used, so paging and ordering share
+    an entry.
+    """
+    params = []
+    for name in FACET_PARAMS:
+        value = query_params.get(name, '').strip()
+        if name == 'search':
+            value = ' '.join(value.lower().replace(',', ' ').split())
+        elif name == 'feature':
+            value = normalize_feature(value)
+        if value:
+            params.append((name, value))
+    digest = hashlib.sha256(urlencode(params).encode()).hexdigest()
+    return f'offer-facets:{digest}'
+
+
+def get_cached_offer_facets(query_params, offers):
+    """
+    Get the facets of the filtered offers, computed once per normalized query.
+
+    Entries are not invalidated when offers change; the default cache is local
+    to each process, so the counts may be up to FACETS_CACHE_TIMEOUT seconds old.
+    """
+    key = get_facets_cache_key(query_params)
+    facets = cache.get(key)
+    if facets is None:
+        facets = compute_offer_facets(offers)
+        cache.set(key, facets, FACETS_CACHE_TIMEOUT)
+    return facets
+
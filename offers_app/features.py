@@ -0,0 +1,29 @@
+from django.db.models import Count, Min
+
+from offers_app.models import OfferFeature, normalize_feature
+
+MAX_SUGGESTIONS = 50
+
+
+def suggest_features(prefix, limit=10):
+    """
+    Get the feature names starting with prefix, most used first.
+
+    The prefix is matched as a range on the indexed normalized column, so the
+    lookup is an index range scan on every database. Each suggestion counts the
+    offers listing the feature.
+    """
+    normalized = normalize_feature(prefix)
+    entries = OfferFeature.objects.all()
+    if normalized:
+        entries = entries.filter(
+            normalized__gte=normalized,
+            normalized__lt=normalized + '\U0010ffff',
+            normalized__startswith=normalized,
+        )
+    rows = (
+        entries.values('normalized')
+        .annotate(name=Min('name'), offer_count=Count('detail__offer', distinct=True))
+        .order_by('-offer_count', 'normalized')[:min(limit, MAX_SUGGESTIONS)]
+    )
+    return [{'name': row['name'], 'offer_count': row['offer_count']} for row in rows]
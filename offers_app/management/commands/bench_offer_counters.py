@@ -0,0 +1,65 @@
+import random
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+
+from offers_app.models import Offer, OfferCounter
+from offers_app.view_counters import VIEWS, CounterBuffer
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Compare counting offer views with one UPDATE per view and with the buffer.
+
+    Views follow a Zipf like distribution over the offers. Test data is
+    created inside a transaction that is rolled back afterwards.
+    """
+    help = 'Benchmark the buffered offer view counters.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--offers', type=int, default=1000)
+        parser.add_argument('--views', type=int, default=20_000)
+        parser.add_argument('--threshold', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user = User.objects.create_user(
+                username='bench_counters', password='bench', type='business')
+            offers = Offer.objects.bulk_create([
+                Offer(user=user, title=f'Offer {index}', description='Bench')
+                for index in range(options['offers'])
+            ])
+            OfferCounter.objects.bulk_create(
+                [OfferCounter(offer=offer) for offer in offers])
+            ids = [offer.pk for offer in offers]
+            generator = random.Random(0)
+            views = [ids[min(int(generator.paretovariate(1.2)) - 1, len(ids) - 1)]
+                     for _ in range(options['views'])]
+
+            start = time.perf_counter()
+            for offer_id in views:
+                OfferCounter.objects.filter(offer_id=offer_id).update(views=F('views') + 1)
+            self.report('UPDATE per view', start, len(views), options['views'])
+
+            buffer = CounterBuffer(3600, options['threshold'])
+            start = time.perf_counter()
+            for offer_id in views:
+                buffer.add([offer_id], VIEWS)
+            buffer.flush()
+            self.report('buffered upserts', start,
+                        -(-options['views'] // options['threshold']), options['views'])
+
+            total = sum(OfferCounter.objects.values_list('views', flat=True))
+            self.stdout.write(f"Stored views: {total} (expected {2 * options['views']})")
+            transaction.set_rollback(True)
+
+    def report(self, label, start, flushes, views):
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"{label}: {elapsed * 1000:.0f} ms for {views} views "
+            f"({elapsed / views * 1e6:.1f} µs per view, {flushes} writes)")
@@ -0,0 +1,88 @@
+import time
+from urllib.parse import urlparse
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from rest_framework import serializers
+from rest_framework.test import APIRequestFactory
+
+from offers_app.api.serializers import (
+    OfferDetailReadSerializerHyperlink, OfferDetailReadSerializerRelativeHyperlinked)
+from offers_app.models import OfferDetail
+
+
+class ReverseRelativeHyperlinkedIdentityField(serializers.HyperlinkedIdentityField):
+    """
+    Previous relative URL field: reverse() and urlparse() for every object.
+    """
+
+    def to_representation(self, value):
+        path = urlparse(super().to_representation(value)).path
+        if path.startswith('/api'):
+            path = path[len('/api'):]
+        return path
+
+
+class ReverseRelativeSerializer(serializers.ModelSerializer):
+    url = ReverseRelativeHyperlinkedIdentityField(
+        view_name='offerdetails-detail', lookup_field='pk')
+
+    class Meta:
+        model = OfferDetail
+        fields = ['id', 'url']
+
+
+class ReverseAbsoluteSerializer(serializers.ModelSerializer):
+    url = serializers.HyperlinkedIdentityField(
+        view_name='offerdetails-detail', lookup_field='pk')
+
+    class Meta:
+        model = OfferDetail
+        fields = ['id', 'url']
+
+
+class Command(BaseCommand):
+    """
+    Compare reversing the offer detail URL per object with the cached route template.
+
+    Unsaved offer details are serialized, so no database access is involved.
+    """
+    help = 'Benchmark generating offer detail URLs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--details', type=int, default=300)
+        parser.add_argument('--repeat', type=int, default=20)
+
+    @override_settings(ALLOWED_HOSTS=['testserver'])
+    def handle(self, *args, **options):
+        details = [OfferDetail(pk=pk)
+                   for pk in range(1, options['details'] + 1)]
+        context = {'request': APIRequestFactory().get('/api/offers/')}
+        pairs = [
+            ('relative', ReverseRelativeSerializer,
+             OfferDetailReadSerializerRelativeHyperlinked),
+            ('absolute', ReverseAbsoluteSerializer,
+             OfferDetailReadSerializerHyperlink),
+        ]
+        for label, reverse_class, template_class in pairs:
+            expected = reverse_class(details, many=True, context=context).data
+            actual = template_class(details, many=True, context=context).data
+            if expected != actual:
+                raise AssertionError(f"{label} URLs differ")
+            reverse_time = self.measure(options['repeat'], lambda: reverse_class(
+                details, many=True, context=context).data)
+            template_time = self.measure(options['repeat'], lambda: template_class(
+                details, many=True, context=context).data)
+            self.stdout.write(
+                f"{label}: reverse {reverse_time * 1000:.2f} ms, template "
+                f"{template_time * 1000:.2f} ms for {len(details)} details, "
+                f"speedup {reverse_time / template_time:.1f}x")
+
+    def measure(self, repeat, func):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
@@ -0,0 +1,90 @@
+import random
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Min, Q
+
+from offers_app.api.filters import OfferFilter, annotate_detail_summary
+from offers_app.models import Offer, OfferDetail
+
+User = get_user_model()
+
+WORDS = ['logo', 'website', 'design', 'video', 'audio', 'brand']
+
+
+def legacy_queryset(min_price, max_delivery_time, search):
+    """
+    Previous filter chain: joins and GROUP BYs over the details.
+    """
+    queryset = Offer.objects.annotate(min_price=Min('details__price'))
+    queryset = queryset.filter(details__price__gte=min_price)
+    queryset = queryset.annotate(
+        _min_delivery_time=Min('details__delivery_time_in_days'))
+    queryset = queryset.filter(_min_delivery_time__lte=max_delivery_time)
+    return queryset.filter(Q(title__icontains=search) | Q(description__icontains=search))
+
+
+def exists_queryset(min_price, max_delivery_time, search):
+    queryset = OfferFilter(
+        {'min_price': min_price, 'max_delivery_time': max_delivery_time},
+        queryset=annotate_detail_summary(Offer.objects.all())
+    ).qs
+    return queryset.filter(Q(title__icontains=search) | Q(description__icontains=search))
+
+
+class Command(BaseCommand):
+    """
+    Compare the previous join based offer filters with the EXISTS based filters.
+
+    Test data is created inside a transaction that is rolled back afterwards.
+    """
+    help = 'Benchmark combined offer filters.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--offers', type=int, default=5000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        params = (150, 7, 'design')
+        with transaction.atomic():
+            self.create_offers(options['offers'])
+            for label, build in [('join + GROUP BY', legacy_queryset), ('EXISTS', exists_queryset)]:
+                rows = list(build(*params).order_by(
+                    'min_price').values_list('id', flat=True))
+                seconds = self.measure(options['repeat'], lambda: (
+                    build(*params).count(),
+                    list(build(*params).order_by('min_price')[:20]),
+                ))
+                self.stdout.write(
+                    f"{label}: {seconds * 1000:.1f} ms for count and first page, "
+                    f"{len(rows)} rows, {len(set(rows))} distinct offers")
+            transaction.set_rollback(True)
+
+    def measure(self, repeat, func):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    def create_offers(self, count):
+        generator = random.Random(0)
+        user = User.objects.create(
+            username='bench_business', email='bench_business@mail.de', type='business')
+        offers = Offer.objects.bulk_create([
+            Offer(user=user, title=f'{generator.choice(WORDS)} offer {index}',
+                  description=f'All about {generator.choice(WORDS)}')
+            for index in range(count)
+        ], batch_size=1000)
+        OfferDetail.objects.bulk_create([
+            OfferDetail(
+                offer=offer, title=offer_type, revisions=1,
+                delivery_time_in_days=generator.randint(1, 14),
+                price=generator.randint(10, 500), features=[], offer_type=offer_type)
+            for offer in offers
+            for offer_type in ['basic', 'standard', 'premium']
+        ], batch_size=1000)
@@ -0,0 +1,58 @@
+import random
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from offers_app.models import Offer
+from offers_app.similarity import refresh_similar_offers
+
+User = get_user_model()
+
+WORDS = ['logo', 'website', 'design', 'video', 'audio', 'brand', 'landing',
+         'page', 'illustration', 'animation', 'podcast', 'editing', 'mixing',
+         'seo', 'copywriting', 'translation', 'photo', 'retouching']
+
+
+class Command(BaseCommand):
+    """
+    Measure a full and an incremental refresh of the similar offers.
+
+    Test data is created inside a transaction that is rolled back afterwards.
+    """
+    help = 'Benchmark the similar offers computation.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--offers', type=int, default=20000)
+        parser.add_argument('--changed', type=int, default=100)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            offer_ids = self.create_offers(options['offers'])
+            start = time.perf_counter()
+            refresh_similar_offers(full=True)
+            self.stdout.write(
+                f"Full refresh of {len(offer_ids)} offers: "
+                f"{time.perf_counter() - start:.2f} s")
+            changed = random.Random(1).sample(offer_ids, options['changed'])
+            Offer.objects.filter(pk__in=changed).update(
+                updated_at=timezone.now())
+            start = time.perf_counter()
+            count = refresh_similar_offers()
+            self.stdout.write(
+                f"Incremental refresh of {count} offers: "
+                f"{time.perf_counter() - start:.2f} s")
+            transaction.set_rollback(True)
+
+    def create_offers(self, count):
+        generator = random.Random(0)
+        user = User.objects.create(
+            username='bench_business', email='bench_business@mail.de', type='business')
+        offers = Offer.objects.bulk_create([
+            Offer(user=user, title=' '.join(generator.sample(WORDS, 2)),
+                  description=' '.join(generator.choices(WORDS, k=12)))
+            for _ in range(count)
+        ], batch_size=1000)
+        return [offer.pk for offer in offers]
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from offers_app.ranking import refresh_offer_ranks
+
+
+class Command(BaseCommand):
+    """
+    Recompute the precomputed offer ranks.
+
+    Meant to run periodically; only offers affected by changes since the last
+    run are recomputed unless --full is given.
+    """
+    help = 'Recompute the rank of offers changed since the last run.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full', action='store_true',
+            help='Recompute the rank of every offer.')
+
+    def handle(self, *args, **options):
+        updated = refresh_offer_ranks(full=options['full'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Refreshed the rank of {updated} offers.'))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from offers_app.similarity import refresh_similar_offers
+
+
+class Command(BaseCommand):
+    """
+    Recompute the precomputed similar offers.
+
+    Meant to run periodically; only offers changed since their last computation
+    are recomputed unless --full is given.
+    """
+    help = 'Recompute the similar offers of changed offers.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full', action='store_true',
+            help='Recompute the similar offers of every offer.')
+
+    def handle(self, *args, **options):
+        updated = refresh_similar_offers(full=options['full'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Refreshed the similar offers of {updated} offers.'))
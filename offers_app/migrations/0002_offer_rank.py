@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-19 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='rank',
+            field=models.FloatField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='rank_updated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0002_offer_rank'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OfferFeature',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('normalized', models.CharField(db_index=True, max_length=255)),
+                ('detail', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='feature_entries', to='offers_app.offerdetail')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('detail', 'normalized'), name='unique_feature_per_detail')],
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:21
+
+from django.db import migrations
+
+BATCH_SIZE = 1000
+MAX_LENGTH = 255
+
+
+def backfill_offer_features(apps, schema_editor):
+    """
+    Mirror the features of existing offer details in primary key batches.
+    """
+    OfferDetail = apps.get_model('offers_app', 'OfferDetail')
+    OfferFeature = apps.get_model('offers_app', 'OfferFeature')
+    alias = schema_editor.connection.alias
+    queryset = OfferDetail.objects.using(alias).order_by('pk')
+    last_pk = 0
+    while True:
+        details = list(queryset.filter(pk__gt=last_pk)
+                       .only('pk', 'features')[:BATCH_SIZE])
+        if not details:
+            break
+        entries = []
+        for detail in details:
+            wanted = {}
+            for feature in detail.features or []:
+                if isinstance(feature, str) and feature.strip():
+                    name = ' '.join(feature.split())[:MAX_LENGTH]
+                    wanted.setdefault(' '.join(name.lower().split()), name)
+            entries.extend(
+                OfferFeature(detail_id=detail.pk, name=name, normalized=normalized)
+                for normalized, name in wanted.items()
+            )
+        OfferFeature.objects.using(alias).bulk_create(entries)
+        last_pk = details[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0003_offer_feature'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_offer_features,
+                             migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0004_backfill_offer_feature'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='details_updated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='similar_updated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='SimilarOffer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('offer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar_offers', to='offers_app.offer')),
+                ('similar', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar_of', to='offers_app.offer')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('offer', 'similar'), name='unique_similar_offer')],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0005_similar_offer'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['updated_at', 'id'], name='offer_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0006_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OfferCounter',
+            fields=[
+                ('offer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='counter', serialize=False, to='offers_app.offer')),
+                ('views', models.BigIntegerField(default=0)),
+                ('impressions', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
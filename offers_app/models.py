@@ -1,10 +1,12 @@
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import models, transaction
+
+from events_app.models import OutboxModel
 
 User = get_user_model()
 
 
-class Offer(models.Model):
+class Offer(OutboxModel):
     """
     Model representing an offer made by a business user.
 
@@ -15,6 +17,10 @@ class Offer(models.Model):
         - description: Detailed description of the offer.
         - created_at: Timestamp when the offer was created.
         - updated_at: Timestamp when the offer was last updated.
+        - rank: Precomputed quality score used to order the marketplace.
+        - rank_updated_at: Timestamp when the rank was last recomputed.
+        - details_updated_at: Timestamp when one of the details last changed.
+        - similar_updated_at: Timestamp when the similar offers were last computed.
     """
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name='offers')
@@ -23,12 +29,30 @@ class Offer(models.Model):
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    rank = models.FloatField(default=0, db_index=True)
+    rank_updated_at = models.DateTimeField(null=True, blank=True)
+    details_updated_at = models.DateTimeField(null=True, blank=True)
+    similar_updated_at = models.DateTimeField(null=True, blank=True)
+
+    outbox_aggregate = 'offer'
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='offer_updated_idx'),
+        ]
 
     def __str__(self):
         return f"Offer by {self.user.username}: {self.title}"
 
+    def get_outbox_payload(self):
+        return {
+            'id': self.pk,
+            'user_id': self.user_id,
+            'has_image': bool(self.image),
+        }
 
-class OfferDetail(models.Model):
+
+class OfferDetail(OutboxModel):
     """
     Model representing details of an offer.
 
@@ -56,5 +80,128 @@ class OfferDetail(models.Model):
     offer_type = models.CharField(
         choices=OFFER_TYPE_CHOICES, max_length=10)
 
+    outbox_aggregate = 'offerdetail'
+
     def __str__(self):
         return f"Detail for {self.offer.title}: {self.title} ({self.offer_type})"
+
+    def get_outbox_payload(self):
+        return {
+            'id': self.pk,
+            'offer_id': self.offer_id,
+            'offer_type': self.offer_type,
+        }
+
+    def save(self, *args, **kwargs):
+        """
+        Save the detail and mirror its features into OfferFeature in the same transaction.
+        """
+        update_fields = kwargs.get('update_fields')
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+            if update_fields is None or 'features' in update_fields:
+                self.sync_features()
+
+    def sync_features(self):
+        """
+        Make the OfferFeature rows of this detail match its features list.
+        """
+        wanted = {}
+        for feature in self.features or []:
+            if isinstance(feature, str) and feature.strip():
+                name = ' '.join(feature.split())[:OfferFeature.MAX_LENGTH]
+                wanted.setdefault(normalize_feature(name), name)
+        entries = self.feature_entries.all()
+        existing = set(entries.values_list('normalized', flat=True))
+        entries.exclude(normalized__in=wanted).delete()
+        OfferFeature.objects.bulk_create([
+            OfferFeature(detail=self, name=name, normalized=normalized)
+            for normalized, name in wanted.items() if normalized not in existing
+        ])
+
+
+def normalize_feature(name):
+    """
+    Normalize a feature name for exact and prefix lookups.
+    """
+    return ' '.join(name.lower().split())
+
+
+class OfferFeature(models.Model):
+    """
+    Model mirroring one entry of OfferDetail.features for indexed lookups.
+
+    Kept in sync by OfferDetail.save(), so feature filters and autocompletion
+    never have to scan the JSON column.
+
+    Fields:
+        - detail: ForeignKey to the OfferDetail listing the feature.
+        - name: Feature as written in the detail, with collapsed whitespace.
+        - normalized: Lowercase feature with collapsed whitespace, used for lookups.
+    """
+    MAX_LENGTH = 255
+
+    detail = models.ForeignKey(
+        OfferDetail, on_delete=models.CASCADE, related_name='feature_entries')
+    name = models.CharField(max_length=MAX_LENGTH)
+    normalized = models.CharField(max_length=MAX_LENGTH, db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['detail', 'normalized'], name='unique_feature_per_detail'),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+class SimilarOffer(models.Model):
+    """
+    Model storing a precomputed neighbour of an offer by text similarity.
+
+    Rows are written by offers_app.similarity; each offer keeps its most similar
+    offers with their cosine similarity.
+
+    Fields:
+        - offer: ForeignKey to the Offer the neighbour belongs to.
+        - similar: ForeignKey to the similar Offer.
+        - score: Cosine similarity of the two offers, between 0 and 1.
+    """
+    offer = models.ForeignKey(
+        Offer, on_delete=models.CASCADE, related_name='similar_offers')
+    similar = models.ForeignKey(
+        Offer, on_delete=models.CASCADE, related_name='similar_of')
+    score = models.FloatField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['offer', 'similar'], name='unique_similar_offer'),
+        ]
+
+    def __str__(self):
+        return f"Offer {self.similar_id} is similar to offer {self.offer_id} ({self.score:.2f})"
+
+
+class OfferCounter(models.Model):
+    """
+    Model storing how often an offer was viewed and shown in listings.
+
+    Rows are written in batches by offers_app.view_counters, which buffers the
+    increments of each process, so the counts lag by a few seconds.
+
+    Fields:
+        - offer: OneToOneField to the counted Offer, also the primary key.
+        - views: Number of times the offer was retrieved.
+        - impressions: Number of times the offer was shown in the offer list.
+        - updated_at: Timestamp of the last flush that changed the counts.
+    """
+    offer = models.OneToOneField(
+        Offer, on_delete=models.CASCADE, primary_key=True, related_name='counter')
+    views = models.BigIntegerField(default=0)
+    impressions = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Offer {self.offer_id}: {self.views} views, {self.impressions} impressions"
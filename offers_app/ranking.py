@@ -0,0 +1,117 @@
+import math
+from datetime import timedelta
+
+from django.db.models import Avg, Count, Max, Q
+from django.utils import timezone
+
+from offers_app.models import Offer
+from orders_app.models import Order
+from reviews_app.models import Review
+
+RATING_WEIGHT = 0.5
+ORDERS_WEIGHT = 0.3
+RECENCY_WEIGHT = 0.2
+
+RATING_PRIOR_COUNT = 5
+RATING_PRIOR_MEAN = 3.0
+ORDERS_SCALE = 10
+RECENCY_HALF_LIFE_DAYS = 30
+RANK_MAX_AGE = timedelta(days=1)
+BATCH_SIZE = 500
+
+
+def compute_rank(review_avg, review_count, completed_orders, updated_at, now, global_avg=RATING_PRIOR_MEAN):
+    """
+    Combine review average, review count, completed orders and recency into one score.
+
+    The review average is shrunk towards the global average so a single five star
+    review does not outrank a long track record. Completed orders saturate and the
+    recency bonus halves every RECENCY_HALF_LIFE_DAYS days.
+    """
+    rating_sum = (review_avg or 0) * review_count
+    bayesian_avg = (RATING_PRIOR_COUNT * global_avg + rating_sum) / \
+        (RATING_PRIOR_COUNT + review_count)
+    rating_score = bayesian_avg / 5
+    orders_score = 1 - 1 / (1 + completed_orders / ORDERS_SCALE)
+    age_days = max((now - updated_at).total_seconds(), 0) / 86400
+    recency_score = math.pow(0.5, age_days / RECENCY_HALF_LIFE_DAYS)
+    rank = (RATING_WEIGHT * rating_score + ORDERS_WEIGHT * orders_score
+            + RECENCY_WEIGHT * recency_score)
+    return round(rank, 6)
+
+
+def get_offers_to_refresh(since, now):
+    """
+    Get the offers whose rank may have changed since the given timestamp.
+
+    An offer is affected when it was edited, its seller received or changed a
+    review or order, it was never ranked, or its rank is older than RANK_MAX_AGE
+    (so the recency component keeps decaying).
+    """
+    changed_sellers = set(Review.objects.filter(
+        updated_at__gt=since).values_list('business_user_id', flat=True))
+    changed_sellers.update(Order.objects.filter(
+        updated_at__gt=since).values_list('business_user_id', flat=True))
+    return Offer.objects.filter(
+        Q(updated_at__gt=since)
+        | Q(user_id__in=changed_sellers)
+        | Q(rank_updated_at__isnull=True)
+        | Q(rank_updated_at__lt=now - RANK_MAX_AGE)
+    )
+
+
+def refresh_offer_ranks(full=False, now=None, offers=None):
+    """
+    Recompute the rank column for changed offers, or for all offers when full is set.
+
+    Aggregates are computed in batches per seller and per offer, so the offer list
+    can sort on the stored column without joining reviews and orders at query time.
+    When explicit offers are passed, rank_updated_at is left untouched so the
+    watermark of the periodic incremental run does not skip other changes.
+    Returns the number of offers updated.
+    """
+    now = now or timezone.now()
+    touch = offers is None
+    if offers is None:
+        since = None
+        if not full:
+            since = Offer.objects.aggregate(
+                last=Max('rank_updated_at'))['last']
+        if since is None:
+            offers = Offer.objects.all()
+        else:
+            offers = get_offers_to_refresh(since, now)
+    global_avg = Review.objects.aggregate(
+        avg=Avg('rating'))['avg'] or RATING_PRIOR_MEAN
+
+    offer_ids = list(offers.order_by('pk').values_list('pk', flat=True))
+    updated = 0
+    for start in range(0, len(offer_ids), BATCH_SIZE):
+        batch = list(Offer.objects.filter(
+            pk__in=offer_ids[start:start + BATCH_SIZE]).only('id', 'user_id', 'updated_at'))
+        updated += _refresh_batch(batch, global_avg, now, touch)
+    return updated
+
+
+def _refresh_batch(batch, global_avg, now, touch):
+    seller_ids = {offer.user_id for offer in batch}
+    review_stats = {
+        row['business_user']: row
+        for row in Review.objects.filter(business_user__in=seller_ids)
+        .values('business_user')
+        .annotate(avg=Avg('rating'), count=Count('id'))
+    }
+    completed_orders = dict(
+        Order.objects.filter(status='completed', offer__offer__in=batch)
+        .values_list('offer__offer')
+        .annotate(count=Count('id'))
+    )
+    for offer in batch:
+        stats = review_stats.get(offer.user_id, {'avg': None, 'count': 0})
+        offer.rank = compute_rank(
+            stats['avg'], stats['count'], completed_orders.get(offer.pk, 0),
+            offer.updated_at, now, global_avg)
+        offer.rank_updated_at = now
+    fields = ['rank', 'rank_updated_at'] if touch else ['rank']
+    Offer.objects.bulk_update(batch, fields)
+    return len(batch)
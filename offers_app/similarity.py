@@ -0,0 +1,211 @@
+import re
+import zlib
+from collections import defaultdict
+
+import numpy as np
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from offers_app.models import Offer, OfferFeature, SimilarOffer
+
+VECTOR_DIMENSIONS = 2 ** 10
+TITLE_WEIGHT = 2
+NEIGHBOURS = 10
+MIN_SCORE = 0.05
+CHUNK_SIZE = 512
+TOKEN_PATTERN = re.compile(r'\w\w+')
+STOP_WORDS = {
+    'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is', 'it',
+    'my', 'of', 'on', 'or', 'our', 'the', 'to', 'we', 'with', 'you', 'your',
+}
+
+
+def hash_token(token):
+    """
+    Map a token to a vector column. crc32 is stable across processes, unlike hash().
+    """
+    return zlib.crc32(token.encode()) % VECTOR_DIMENSIONS
+
+
+def get_offer_columns(title, description, features):
+    """
+    Get the hashed columns of an offer's tokens, repeated once per occurrence.
+
+    Title tokens count TITLE_WEIGHT times; features count like the description.
+    Stop words are left out.
+    """
+    text = ' '.join([description or '', *features]).lower()
+    tokens = TOKEN_PATTERN.findall((title or '').lower()) * TITLE_WEIGHT
+    tokens += TOKEN_PATTERN.findall(text)
+    return [hash_token(token) for token in tokens if token not in STOP_WORDS]
+
+
+def load_term_counts(offer_ids):
+    """
+    Count the hashed tokens of the given offers, one row per offer.
+    """
+    features = defaultdict(list)
+    for offer_id, name in OfferFeature.objects.filter(
+            detail__offer_id__in=offer_ids).values_list('detail__offer_id', 'normalized'):
+        features[offer_id].append(name)
+    texts = dict((offer_id, (title, description)) for offer_id, title, description in Offer.objects.filter(
+        pk__in=offer_ids).values_list('id', 'title', 'description'))
+    counts = np.zeros((len(offer_ids), VECTOR_DIMENSIONS), dtype=np.float32)
+    for row, offer_id in enumerate(offer_ids):
+        title, description = texts.get(offer_id, ('', ''))
+        columns = get_offer_columns(title, description, features[offer_id])
+        np.add.at(counts[row], columns, 1)
+    return counts
+
+
+def build_vectors():
+    """
+    Build the L2 normalized TF-IDF vectors of all offers.
+
+    Tokens are hashed into VECTOR_DIMENSIONS columns, so no vocabulary has to be
+    kept. Term counts are loaded in chunks of CHUNK_SIZE offers and damped
+    with 1 + log(count) chunk by chunk. Returns the offer IDs and a float32
+    matrix with one row per offer, i.e. 4 KiB per offer: time and memory grow
+    with the catalogue, not with the number of changed offers.
+    """
+    offer_ids = np.array(
+        Offer.objects.order_by('pk').values_list('pk', flat=True), dtype=np.int64)
+    vectors = np.zeros((len(offer_ids), VECTOR_DIMENSIONS), dtype=np.float32)
+    document_frequency = np.zeros(VECTOR_DIMENSIONS, dtype=np.int64)
+    for start in range(0, len(offer_ids), CHUNK_SIZE):
+        chunk = offer_ids[start:start + CHUNK_SIZE].tolist()
+        counts = load_term_counts(chunk)
+        present = counts > 0
+        document_frequency += present.sum(axis=0)
+        np.log(counts, out=counts, where=present)
+        np.add(counts, 1, out=counts, where=present)
+        vectors[start:start + len(chunk)] = counts
+    idf = np.log((1 + len(offer_ids)) / (1 + document_frequency)) + 1
+    vectors *= idf.astype(np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return offer_ids, vectors
+
+
+def top_neighbours(scores, candidate_ids, exclude_ids, limit=NEIGHBOURS):
+    """
+    Get the best (id, score) pairs per row of a score matrix.
+
+    scores has one column per candidate. Candidates in the row's entry of
+    exclude_ids, e.g. the offer itself, and scores below MIN_SCORE are skipped.
+    """
+    count = min(limit + 1, scores.shape[1])
+    if count < scores.shape[1]:
+        best = np.argpartition(-scores, count - 1, axis=1)[:, :count]
+    else:
+        best = np.broadcast_to(np.arange(count), scores.shape)
+    best_scores = np.take_along_axis(scores, best, axis=1)
+    order = np.argsort(-best_scores, axis=1, kind='stable')
+    best = np.take_along_axis(best, order, axis=1)
+    best_scores = np.take_along_axis(best_scores, order, axis=1)
+    results = []
+    for columns, row_scores, exclude_id in zip(best, best_scores, exclude_ids):
+        results.append([
+            (int(candidate_ids[column]), float(score))
+            for column, score in zip(columns, row_scores)
+            if score >= MIN_SCORE and candidate_ids[column] != exclude_id
+        ][:limit])
+    return results
+
+
+def save_neighbours(neighbours):
+    """
+    Replace the stored neighbours of the offers in the given {offer_id: pairs} dict.
+    """
+    with transaction.atomic():
+        SimilarOffer.objects.filter(offer_id__in=list(neighbours)).delete()
+        SimilarOffer.objects.bulk_create([
+            SimilarOffer(offer_id=offer_id, similar_id=similar_id, score=score)
+            for offer_id, pairs in neighbours.items()
+            for similar_id, score in pairs
+        ], batch_size=1000)
+
+
+def get_stale_offers():
+    """
+    Get the offers whose similar offers have to be computed again.
+
+    An offer is stale when it was never computed, or when it or one of its
+    details changed after its last computation.
+    """
+    return Offer.objects.filter(
+        Q(similar_updated_at__isnull=True)
+        | Q(similar_updated_at__lt=F('updated_at'))
+        | Q(similar_updated_at__lt=F('details_updated_at'))
+    )
+
+
+def refresh_similar_offers(full=False, now=None):
+    """
+    Recompute the similar offers of stale offers, or of all offers when full is set.
+
+    The vectors of all offers are built, since the document frequencies depend
+    on every offer, so even a run with one changed offer reads the text of the
+    whole catalogue (see build_vectors()). The neighbours of the changed
+    offers are then found with one matrix multiply per chunk of CHUNK_SIZE
+    offers.
+    In an incremental run, the stored neighbours of the other offers are
+    updated with their similarity to the changed offers. An offer that drops
+    out of such a list is not replaced by the next best unchanged offer until
+    the next full run. Returns the number of offers whose neighbours were
+    recomputed.
+    """
+    now = now or timezone.now()
+    if full:
+        changed = Offer.objects.all()
+    else:
+        changed = get_stale_offers()
+    changed_ids = set(changed.values_list('pk', flat=True))
+    if not changed_ids:
+        return 0
+    offer_ids, vectors = build_vectors()
+    changed_rows = np.flatnonzero(np.isin(offer_ids, list(changed_ids)))
+
+    for start in range(0, len(changed_rows), CHUNK_SIZE):
+        rows = changed_rows[start:start + CHUNK_SIZE]
+        scores = vectors[rows] @ vectors.T
+        pairs = top_neighbours(scores, offer_ids, offer_ids[rows])
+        save_neighbours(dict(zip(offer_ids[rows].tolist(), pairs)))
+
+    if not full and len(changed_rows) < len(offer_ids):
+        merge_changed_neighbours(offer_ids, vectors, changed_rows)
+    Offer.objects.filter(pk__in=changed_ids).update(similar_updated_at=now)
+    return len(changed_ids)
+
+
+def merge_changed_neighbours(offer_ids, vectors, changed_rows):
+    """
+    Update the stored neighbours of unchanged offers for the changed offers.
+
+    Stored pairs pointing to a changed offer are dropped and replaced by the
+    new similarity to every changed offer, keeping the best NEIGHBOURS pairs.
+    Only lists that actually change are written.
+    """
+    changed_ids = offer_ids[changed_rows]
+    changed_set = set(changed_ids.tolist())
+    changed_vectors = vectors[changed_rows]
+    for start in range(0, len(offer_ids), CHUNK_SIZE):
+        chunk_ids = offer_ids[start:start + CHUNK_SIZE]
+        scores = vectors[start:start + CHUNK_SIZE] @ changed_vectors.T
+        candidates = top_neighbours(scores, changed_ids, chunk_ids)
+        stored = defaultdict(list)
+        for offer_id, similar_id, score in SimilarOffer.objects.filter(
+                offer_id__in=chunk_ids.tolist()).values_list('offer_id', 'similar_id', 'score'):
+            stored[offer_id].append((similar_id, score))
+        updates = {}
+        for offer_id, new_pairs in zip(chunk_ids.tolist(), candidates):
+            if offer_id in changed_set:
+                continue
+            old_pairs = sorted(stored[offer_id], key=lambda pair: -pair[1])
+            pairs = [pair for pair in old_pairs if pair[0] not in changed_set]
+            pairs = sorted(pairs + new_pairs, key=lambda pair: -pair[1])[:NEIGHBOURS]
+            if pairs != old_pairs:
+                updates[offer_id] = pairs
+        if updates:
+            save_neighbours(updates)
@@ -0,0 +1,69 @@
+import os
+from datetime import timedelta
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image
+
+from offers_app import ranking, similarity
+from offers_app.models import Offer
+from tasks_app.registry import task
+
+MAX_IMAGE_SIZE = 1200
+
+
+@task(max_retries=3)
+def process_offer_image(offer_id):
+    """
+    Downscale an uploaded offer image so it fits into MAX_IMAGE_SIZE pixels.
+    """
+    offer = Offer.objects.filter(pk=offer_id).first()
+    if offer is None or not offer.image:
+        return
+    with offer.image.open('rb') as source:
+        image = Image.open(source)
+        image.load()
+    if max(image.size) <= MAX_IMAGE_SIZE:
+        return
+    image_format = image.format
+    image.thumbnail((MAX_IMAGE_SIZE, MAX_IMAGE_SIZE))
+    buffer = BytesIO()
+    image.save(buffer, format=image_format)
+    old_name = offer.image.name
+    offer.image.save(os.path.basename(old_name),
+                     ContentFile(buffer.getvalue()), save=False)
+    Offer.objects.filter(pk=offer_id).update(image=offer.image.name)
+    offer.image.storage.delete(old_name)
+
+
+@task(run_every=timedelta(minutes=5))
+def refresh_offer_ranks():
+    """
+    Periodically recompute the rank of offers changed since the last run.
+    """
+    ranking.refresh_offer_ranks()
+
+
+@task(run_every=timedelta(minutes=10))
+def refresh_similar_offers():
+    """
+    Periodically recompute the similar offers of changed offers.
+    """
+    similarity.refresh_similar_offers()
+
+
+@task(run_every=timedelta(days=1))
+def rebuild_similar_offers():
+    """
+    Recompute the similar offers of all offers once a day.
+    """
+    similarity.refresh_similar_offers(full=True)
+
+
+@task(max_retries=3)
+def refresh_seller_offer_ranks(business_user_id):
+    """
+    Recompute the rank of all offers of one business user.
+    """
+    ranking.refresh_offer_ranks(
+        offers=Offer.objects.filter(user_id=business_user_id))
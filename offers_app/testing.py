@@ -0,0 +1,15 @@
+from offers_app.models import Offer, OfferDetail
+
+
+def create_offer(user, title, description=None, features=None):
+    """
+    Create an offer of the user with a single 'Basic' detail for 50, for tests.
+
+    The description defaults to the title.
+    """
+    offer = Offer.objects.create(
+        user=user, title=title, description=description or title)
+    OfferDetail.objects.create(
+        offer=offer, title='Basic', revisions=1, delivery_time_in_days=3,
+        price=50, features=features or [], offer_type='basic')
+    return offer
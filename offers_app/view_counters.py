@@ -0,0 +1,165 @@
+import atexit
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+
+from offers_app.models import Offer, OfferCounter
+
+logger = logging.getLogger(__name__)
+
+VIEWS = 0
+IMPRESSIONS = 1
+UPSERT_BATCH_SIZE = 500
+
+_lock = threading.Lock()
+_state = {'buffer': None}
+
+
+class CounterBuffer:
+    """
+    Per-process buffer of offer view and impression increments.
+
+    Increments are summed per offer in memory and written with batched upserts,
+    so a page view costs a dict update instead of an UPDATE statement. The
+    buffer is flushed by the request that finds it older than flush_interval
+    seconds or holding flush_threshold increments; only one thread flushes at a
+    time, the others do not wait for it. The lock is only held to add
+    increments or to swap in an empty buffer.
+    """
+
+    def __init__(self, flush_interval, flush_threshold):
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._counts = defaultdict(lambda: [0, 0])
+        self._pending = 0
+        self._flushed_at = time.monotonic()
+
+    def __len__(self):
+        return self._pending
+
+    def add(self, offer_ids, column):
+        """
+        Count one view or impression (column VIEWS or IMPRESSIONS) per offer ID.
+        """
+        with self._lock:
+            for offer_id in offer_ids:
+                self._counts[offer_id][column] += 1
+            self._pending += len(offer_ids)
+            due = (self._pending >= self.flush_threshold
+                   or time.monotonic() - self._flushed_at >= self.flush_interval)
+        if due:
+            self.flush(blocking=False)
+
+    def flush(self, blocking=True):
+        """
+        Write the buffered increments to the database.
+
+        Returns the number of offers written. If the write fails, the
+        increments are put back into the buffer for the next flush.
+        """
+        if not self._flush_lock.acquire(blocking=blocking):
+            return 0
+        try:
+            with self._lock:
+                counts, self._counts = self._counts, defaultdict(lambda: [0, 0])
+                pending, self._pending = self._pending, 0
+                self._flushed_at = time.monotonic()
+            if not counts:
+                return 0
+            try:
+                return write_counts(counts)
+            except DatabaseError:
+                logger.exception("Flushing %d offer counts failed", pending)
+                with self._lock:
+                    for offer_id, (views, impressions) in counts.items():
+                        self._counts[offer_id][VIEWS] += views
+                        self._counts[offer_id][IMPRESSIONS] += impressions
+                    self._pending += pending
+                return 0
+        finally:
+            self._flush_lock.release()
+
+
+def write_counts(counts):
+    """
+    Add {offer_id: [views, impressions]} to the stored counters.
+
+    Uses one INSERT ... ON CONFLICT DO UPDATE statement per UPSERT_BATCH_SIZE
+    offers (SQLite and PostgreSQL), so the increments are applied atomically
+    by the database and concurrent flushes of other processes are not lost.
+    Offers deleted in the meantime are skipped. Returns the number of offers
+    written.
+    """
+    table = connection.ops.quote_name(OfferCounter._meta.db_table)
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    with transaction.atomic():
+        offer_ids = sorted(counts)
+        existing = set()
+        for start in range(0, len(offer_ids), UPSERT_BATCH_SIZE):
+            existing.update(Offer.objects.filter(
+                pk__in=offer_ids[start:start + UPSERT_BATCH_SIZE]
+            ).values_list('pk', flat=True))
+        rows = [(offer_id, *counts[offer_id], now)
+                for offer_id in offer_ids if offer_id in existing]
+        with connection.cursor() as cursor:
+            for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+                batch = rows[start:start + UPSERT_BATCH_SIZE]
+                values = ', '.join(['(%s, %s, %s, %s)'] * len(batch))
+                cursor.execute(
+                    f'INSERT INTO {table} (offer_id, views, impressions, updated_at) '
+                    f'VALUES {values} ON CONFLICT (offer_id) DO UPDATE SET '
+                    f'views = {table}.views + excluded.views, '
+                    f'impressions = {table}.impressions + excluded.impressions, '
+                    f'updated_at = excluded.updated_at',
+                    [value for row in batch for value in row])
+    return len(rows)
+
+
+def get_counter_buffer():
+    """
+    Get the counter buffer of this process.
+    """
+    buffer = _state['buffer']
+    if buffer is not None:
+        return buffer
+    with _lock:
+        if _state['buffer'] is None:
+            _state['buffer'] = CounterBuffer(
+                settings.OFFER_COUNTER_FLUSH_INTERVAL,
+                settings.OFFER_COUNTER_FLUSH_THRESHOLD)
+        return _state['buffer']
+
+
+def record_views(offer_ids):
+    get_counter_buffer().add(offer_ids, VIEWS)
+
+
+def record_impressions(offer_ids):
+    get_counter_buffer().add(offer_ids, IMPRESSIONS)
+
+
+def flush_offer_counters():
+    """
+    Write the buffered counts of this process, waiting for a running flush.
+    """
+    buffer = _state['buffer']
+    return buffer.flush() if buffer is not None else 0
+
+
+def reset_counter_buffer():
+    """
+    Drop the buffered counts of this process without writing them.
+    """
+    with _lock:
+        _state['buffer'] = None
+
+
+# Counts must survive a worker shutdown (gunicorn also flushes in worker_exit).
+atexit.register(flush_offer_counters)
@@ -1,23 +1,22 @@
-
+from django.utils import timezone
 from rest_framework import serializers
 from rest_framework.exceptions import NotFound
 
+from core.profiling import ProfiledSerializerMixin
+from core.serializers import SparseFieldsetMixin
 from orders_app.models import Order, OfferDetail
 
 
-class OrderListSerializer(serializers.ModelSerializer):
+class OrderListSerializer(ProfiledSerializerMixin, SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for listing and creating orders.
     """
-    title = serializers.CharField(source='offer.title', read_only=True)
-    revisions = serializers.IntegerField(
-        source='offer.revisions', read_only=True)
-    delivery_time_in_days = serializers.IntegerField(
-        source='offer.delivery_time_in_days', read_only=True)
-    price = serializers.FloatField(source='offer.price', read_only=True)
-    features = serializers.JSONField(source='offer.features', read_only=True)
-    offer_type = serializers.CharField(
-        source='offer.offer_type', read_only=True)
+    title = serializers.CharField(read_only=True)
+    revisions = serializers.IntegerField(read_only=True)
+    delivery_time_in_days = serializers.IntegerField(read_only=True)
+    price = serializers.FloatField(read_only=True)
+    features = serializers.JSONField(read_only=True)
+    offer_type = serializers.CharField(read_only=True)
     offer_detail_id = serializers.PrimaryKeyRelatedField(
         write_only=True, source='offer', queryset=OfferDetail.objects.all())
 
@@ -72,19 +71,69 @@ class OrderListSerializer(serializers.ModelSerializer):
             raise
 
 
-class OrderDetailSerializer(serializers.ModelSerializer):
+ORDER_LIST_COLUMNS = (
+    'id',
+    'customer_user_id',
+    'business_user_id',
+    'title',
+    'revisions',
+    'delivery_time_in_days',
+    'price',
+    'features',
+    'offer_type',
+    'status',
+    'created_at',
+    'updated_at',
+)
+
+
+def serialize_order_list(queryset):
+    """
+    Serialize orders for the list endpoint from one values() query on the orders table.
+
+    Produces the same output as OrderListSerializer without building model
+    instances or per-field serializer calls. Datetimes are rendered like DRF's
+    ISO 8601 DateTimeField in the current timezone.
+    """
+    current_timezone = timezone.get_current_timezone()
+    return [
+        {
+            'id': row[0],
+            'customer_user': row[1],
+            'business_user': row[2],
+            'title': row[3],
+            'revisions': row[4],
+            'delivery_time_in_days': row[5],
+            'price': float(row[6]),
+            'features': row[7],
+            'offer_type': row[8],
+            'status': row[9],
+            'created_at': _format_datetime(row[10], current_timezone),
+            'updated_at': _format_datetime(row[11], current_timezone),
+        }
+        for row in queryset.values_list(*ORDER_LIST_COLUMNS)
+    ]
+
+
+def _format_datetime(value, current_timezone):
+    if not value:
+        return None
+    value = value.astimezone(current_timezone).isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+class OrderDetailSerializer(ProfiledSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for patching orders.
     """
-    title = serializers.CharField(source='offer.title', read_only=True)
-    revisions = serializers.IntegerField(
-        source='offer.revisions', read_only=True)
-    delivery_time_in_days = serializers.IntegerField(
-        source='offer.delivery_time_in_days', read_only=True)
-    price = serializers.FloatField(source='offer.price', read_only=True)
-    features = serializers.JSONField(source='offer.features', read_only=True)
-    offer_type = serializers.CharField(
-        source='offer.offer_type', read_only=True)
+    title = serializers.CharField(read_only=True)
+    revisions = serializers.IntegerField(read_only=True)
+    delivery_time_in_days = serializers.IntegerField(read_only=True)
+    price = serializers.FloatField(read_only=True)
+    features = serializers.JSONField(read_only=True)
+    offer_type = serializers.CharField(read_only=True)
 
     class Meta:
         model = Order
@@ -0,0 +1,124 @@
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_app.testing import create_offer
+from orders_app.co_orders import CoOrderCounter, rebuild_co_orders
+from orders_app.models import CoOrderedOffers, Order
+
+User = get_user_model()
+
+
+class CoOrderCounterTests(SimpleTestCase):
+    """
+    Test cases for counting offers ordered by the same customers.
+    """
+    baskets = [[1, 2, 3], [1, 2], [2, 3, 3], [4], [1, 99], [3, 1]]
+
+    def count(self, **kwargs):
+        counter = CoOrderCounter([1, 2, 3, 4], **kwargs)
+        for basket in self.baskets:
+            counter.add_basket(basket)
+        return counter
+
+    def test_counts_customers_per_pair(self):
+        self.assertEqual(self.count().top(), {
+            1: ([2, 3], [2, 2]),
+            2: ([1, 3], [2, 2]),
+            3: ([1, 2], [2, 2]),
+        })
+        self.assertEqual(self.count().top(limit=1), {
+            1: ([2], [2]), 2: ([1], [2]), 3: ([1], [2])})
+
+    def test_small_buffer_gives_the_same_counts(self):
+        self.assertEqual(self.count(buffer_size=2).top(), self.count().top())
+
+    def test_orders_of_unknown_offers_are_skipped(self):
+        counter = CoOrderCounter([1, 2, 3])
+        counter.add_orders([5, 5], [9, 10])
+        counter.add_basket([9, 10, 2])
+        counter.add_orders([5, 5, 6, 6], [1, 2, 9, 10])
+        counter.flush()
+        self.assertEqual(counter.top(), {1: ([2], [1]), 2: ([1], [1])})
+
+    def test_max_pairs_bounds_memory(self):
+        counter = CoOrderCounter([1, 2, 3], buffer_size=2, max_pairs=2)
+        for basket in [[1, 2], [1, 2], [2, 3]]:
+            counter.add_basket(basket)
+        self.assertEqual(counter.top(), {1: ([2], [2]), 2: ([1], [2])})
+        self.assertEqual(len(counter.codes), 2)
+        self.assertEqual(counter.dropped, 2)
+
+
+class AlsoOrderedTests(APITestCase):
+    """
+    Test cases for rebuilding co-ordered offers and the also ordered endpoint.
+    """
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(
+            username='business', email='business@mail.de',
+            password='password123', type='business')
+        self.customers = [
+            User.objects.create_user(
+                username=f'customer{index}', email=f'customer{index}@mail.de',
+                password='password123', type='customer')
+            for index in range(3)
+        ]
+        self.offers = [create_offer(self.business_user, f'Offer {index}')
+                       for index in range(4)]
+        self.order(0, [0, 1, 2])
+        self.order(1, [0, 1])
+        self.order(2, [0, 2])
+        cancelled = self.order(2, [3])[0]
+        cancelled.status = 'cancelled'
+        cancelled.save()
+        self.client.force_authenticate(user=self.customers[0])
+
+    def order(self, customer_index, offer_indexes):
+        return [
+            Order.objects.create(
+                customer_user=self.customers[customer_index],
+                business_user=self.business_user,
+                offer=self.offers[index].details.get())
+            for index in offer_indexes
+        ]
+
+    def get_also_ordered(self, offer, **params):
+        return self.client.get(
+            reverse('offers-also-ordered', kwargs={'pk': offer.pk}), params)
+
+    def test_lists_offers_ordered_by_the_same_customers(self):
+        self.assertEqual(rebuild_co_orders(), 3)
+        entry = CoOrderedOffers.objects.get(offer=self.offers[0])
+        self.assertEqual(entry.offer_ids, [self.offers[1].pk, self.offers[2].pk])
+        self.assertEqual(entry.counts, [2, 2])
+
+        response = self.get_also_ordered(self.offers[1])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(item['id'], item['co_order_count']) for item in response.data],
+            [(self.offers[0].pk, 2), (self.offers[2].pk, 1)])
+        self.assertEqual(response.data[0]['min_price'], 50)
+        response = self.get_also_ordered(self.offers[1], limit=1)
+        self.assertEqual(len(response.data), 1)
+
+    def test_offer_without_co_orders(self):
+        rebuild_co_orders()
+        response = self.get_also_ordered(self.offers[3])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
+        response = self.client.get(
+            reverse('offers-also-ordered', kwargs={'pk': 999}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_deleted_offers_are_left_out(self):
+        rebuild_co_orders()
+        self.offers[2].delete()
+        response = self.get_also_ordered(self.offers[0])
+        self.assertEqual([item['id'] for item in response.data],
+                         [self.offers[1].pk])
+        self.assertFalse(CoOrderedOffers.objects.filter(
+            offer_id=self.offers[2].pk).exists())
@@ -0,0 +1,122 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from events_app.dispatcher import dispatch_pending
+from offers_app.models import Offer, OfferDetail
+from orders_app.analytics import rebuild_daily_stats
+from orders_app.models import Order, OrderDailyStat
+
+User = get_user_model()
+
+
+class OrderAnalyticsTests(APITestCase):
+    """Test suite for the order analytics endpoint and its rollups."""
+
+    def setUp(self):
+        """Set up users, an offer with two tiers and three orders."""
+        self.url = reverse('orders-analytics')
+        self.business_user = User.objects.create_user(
+            username="business",
+            email="business@mail.de",
+            password="password123",
+            type="business"
+        )
+        self.customer_user = User.objects.create_user(
+            username="customer",
+            email="customer@mail.de",
+            password="password123",
+            type="customer"
+        )
+        offer = Offer.objects.create(
+            title="Test Offer",
+            image=None,
+            description="Test offer description",
+            user=self.business_user
+        )
+        details = [
+            OfferDetail.objects.create(
+                offer=offer, title=offer_type, revisions=1,
+                delivery_time_in_days=3, price=price, features=[],
+                offer_type=offer_type)
+            for offer_type, price in [('basic', 50), ('standard', 100)]
+        ]
+        self.orders = [
+            Order.objects.create(
+                customer_user=self.customer_user,
+                business_user=self.business_user,
+                offer=detail
+            )
+            for detail in details + details[:1]
+        ]
+        dispatch_pending()
+
+    def get_buckets(self, **params):
+        self.client.force_authenticate(user=self.business_user)
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {bucket['status']: bucket for bucket in response.data['buckets']}
+
+    def test_get_daily_buckets(self):
+        """
+        Test that new orders are counted with their revenue.
+        """
+        buckets = self.get_buckets(interval='day')
+        self.assertEqual(buckets['in_progress']['order_count'], 3)
+        self.assertEqual(buckets['in_progress']['revenue'], 200)
+        self.assertEqual(buckets['in_progress']['period'], timezone.localdate())
+
+    def test_status_change_moves_order(self):
+        """
+        Test that a status change moves the order to the new status bucket.
+        """
+        order = Order.objects.get(pk=self.orders[1].pk)
+        order.status = 'completed'
+        order.save()
+        dispatch_pending()
+        buckets = self.get_buckets(interval='month')
+        self.assertEqual(buckets['in_progress']['order_count'], 2)
+        self.assertEqual(buckets['completed']['order_count'], 1)
+        self.assertEqual(buckets['completed']['revenue'], 100)
+
+    def test_rebuild_matches_incremental_rollups(self):
+        """
+        Test that rebuilding from the orders table gives the same rollups.
+        """
+        self.orders[0].delete()
+        dispatch_pending()
+        incremental = set(OrderDailyStat.objects.filter(order_count__gt=0).values_list(
+            'business_user_id', 'day', 'status', 'order_count', 'revenue'))
+        rebuild_daily_stats()
+        rebuilt = set(OrderDailyStat.objects.values_list(
+            'business_user_id', 'day', 'status', 'order_count', 'revenue'))
+        self.assertEqual(incremental, rebuilt)
+
+    def test_range_excludes_other_days(self):
+        """
+        Test that only rollups inside the requested range are returned.
+        """
+        yesterday = timezone.localdate() - timedelta(days=1)
+        buckets = self.get_buckets(
+            start=(yesterday - timedelta(days=7)).isoformat(), end=yesterday.isoformat())
+        self.assertEqual(buckets, {})
+
+    def test_invalid_interval(self):
+        """
+        Test that an unknown interval is rejected.
+        """
+        self.client.force_authenticate(user=self.business_user)
+        response = self.client.get(self.url, {'interval': 'year'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_customer_forbidden(self):
+        """
+        Test that customers have no order analytics.
+        """
+        self.client.force_authenticate(user=self.customer_user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
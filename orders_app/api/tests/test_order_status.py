@@ -0,0 +1,152 @@
+import threading
+import time
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import OperationalError, connection
+from django.test import TransactionTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from events_app.models import OutboxEvent
+from offers_app.models import Offer, OfferDetail
+from orders_app.api.views import OrderUpdateDeleteView
+from orders_app.models import Order
+from orders_app.state_machine import (
+    InvalidStatusTransition, StatusTransitionConflict, transition_order)
+
+User = get_user_model()
+
+
+def create_order():
+    business_user = User.objects.create_user(
+        username="business",
+        email="business@mail.de",
+        password="password123",
+        type="business"
+    )
+    customer_user = User.objects.create_user(
+        username="customer",
+        email="customer@mail.de",
+        password="password123",
+        type="customer"
+    )
+    offer = Offer.objects.create(
+        title="Test Offer",
+        image=None,
+        description="Test offer description",
+        user=business_user
+    )
+    detail = OfferDetail.objects.create(
+        offer=offer, title="Basic", revisions=1, delivery_time_in_days=3,
+        price=50, features=[], offer_type="basic")
+    return Order.objects.create(
+        customer_user=customer_user, business_user=business_user, offer=detail)
+
+
+class OrderStatusTransitionTests(APITestCase):
+    """Test suite for order status transitions."""
+
+    def setUp(self):
+        """Set up an order in progress."""
+        self.order = create_order()
+        self.url = reverse('orders-detail', kwargs={'pk': self.order.id})
+
+    def test_transition_records_event(self):
+        """
+        Test that a transition updates the row and records an event.
+        """
+        transition_order(self.order, 'completed')
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, 'completed')
+        event = OutboxEvent.objects.get(topic='order.status_changed')
+        self.assertEqual(event.payload['previous_status'], 'in_progress')
+        self.assertEqual(event.payload['status'], 'completed')
+
+    def test_invalid_transition(self):
+        """
+        Test that a finished order cannot be reopened.
+        """
+        transition_order(self.order, 'cancelled')
+        with self.assertRaises(InvalidStatusTransition):
+            transition_order(self.order, 'in_progress')
+        self.client.force_authenticate(user=self.order.business_user)
+        response = self.client.patch(
+            self.url, {'status': 'in_progress'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_stale_transition_conflicts(self):
+        """
+        Test that a transition based on an outdated status is rejected.
+        """
+        stale_order = Order.objects.get(pk=self.order.pk)
+        transition_order(self.order, 'cancelled')
+        with self.assertRaises(StatusTransitionConflict):
+            transition_order(stale_order, 'completed')
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, 'cancelled')
+
+    def test_lost_race_returns_conflict(self):
+        """
+        Test that the endpoint answers 409 when the status changes concurrently.
+        """
+        self.client.force_authenticate(user=self.order.business_user)
+        original_get_object = OrderUpdateDeleteView.get_object
+
+        def get_object(view):
+            order = original_get_object(view)
+            Order.objects.filter(pk=order.pk).update(status='cancelled')
+            return order
+
+        with mock.patch.object(OrderUpdateDeleteView, 'get_object', get_object):
+            response = self.client.patch(
+                self.url, {'status': 'completed'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+
+class OrderStatusConcurrencyTests(TransactionTestCase):
+    """Test suite for concurrent order status transitions."""
+
+    def test_concurrent_transitions_have_one_winner(self):
+        """
+        Test that of many concurrent transitions exactly one is applied.
+        """
+        order = create_order()
+        targets = ['completed', 'cancelled'] * 4
+        barrier = threading.Barrier(len(targets))
+        results = []
+
+        def worker(target):
+            loaded = Order.objects.get(pk=order.pk)
+            barrier.wait()
+            try:
+                # The in-memory SQLite test database fails with "table is
+                # locked" instead of waiting for a concurrent writer.
+                for _ in range(100):
+                    try:
+                        transition_order(loaded, target)
+                        results.append(('won', target))
+                    except StatusTransitionConflict:
+                        results.append(('lost', target))
+                    except OperationalError:
+                        time.sleep(0.01)
+                        continue
+                    break
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker, args=(target,))
+                   for target in targets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        winners = [target for outcome, target in results if outcome == 'won']
+        self.assertEqual(len(results), len(targets))
+        self.assertEqual(len(winners), 1)
+        order.refresh_from_db()
+        self.assertEqual(order.status, winners[0])
+        self.assertEqual(OutboxEvent.objects.filter(
+            topic='order.status_changed').count(), 1)
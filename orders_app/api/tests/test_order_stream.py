@@ -0,0 +1,161 @@
+import json
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.contrib.auth import get_user_model
+from django.test import AsyncClient, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from events_app.models import OutboxEvent
+from offers_app.testing import create_offer
+from orders_app.models import Order
+from orders_app.streams import (
+    Subscription, astream_events, get_broadcaster, get_channel, reset_broadcaster)
+
+User = get_user_model()
+
+
+def parse_event(message):
+    if isinstance(message, bytes):
+        message = message.decode()
+    fields = dict(line.split(': ', 1) for line in message.strip().split('\n'))
+    return fields['event'], json.loads(fields['data'])
+
+
+@override_settings(ORDER_STREAM_POLL_INTERVAL=0, ORDER_STREAM_HEARTBEAT_INTERVAL=5)
+class OrderStreamTests(APITestCase):
+    """
+    Test cases for the server-sent event stream of order changes and counts.
+    """
+
+    def setUp(self):
+        reset_broadcaster()
+        self.business_user = User.objects.create_user(
+            username='business', email='business@mail.de',
+            password='password123', type='business')
+        self.customer_user = User.objects.create_user(
+            username='customer', email='customer@mail.de',
+            password='password123', type='customer')
+        self.other_customer = User.objects.create_user(
+            username='other', email='other@mail.de',
+            password='password123', type='customer')
+        self.detail = create_offer(self.business_user, 'Logo').details.get()
+        Order.objects.create(customer_user=self.customer_user,
+                             business_user=self.business_user, offer=self.detail)
+
+    def tearDown(self):
+        reset_broadcaster()
+
+    def create_order(self):
+        order = Order.objects.create(customer_user=self.customer_user,
+                                     business_user=self.business_user, offer=self.detail)
+        get_channel().poll()
+        return order
+
+    def open_stream(self, user):
+        self.client.force_authenticate(user=user)
+        response = self.client.get(reverse('orders-stream'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.addCleanup(response.close)
+        return iter(response.streaming_content)
+
+    def test_business_gets_counts_and_order_events(self):
+        events = self.open_stream(self.business_user)
+        self.assertEqual(next(events), b'retry: 3000\n\n')
+        self.assertEqual(parse_event(next(events)), ('counts', {
+            'business_user_id': self.business_user.id,
+            'order_count': 1, 'completed_order_count': 0}))
+
+        order = self.create_order()
+        event, data = parse_event(next(events))
+        self.assertEqual((event, data['event'], data['id'], data['status']),
+                         ('order', 'order.created', order.id, 'in_progress'))
+        self.assertEqual(parse_event(next(events))[1]['order_count'], 2)
+
+        order.status = 'completed'
+        order.save()
+        get_channel().poll()
+        self.assertEqual(parse_event(next(events))[1]['event'], 'order.updated')
+        self.assertEqual(parse_event(next(events))[1], {
+            'business_user_id': self.business_user.id,
+            'order_count': 1, 'completed_order_count': 1})
+
+    def test_only_the_parties_of_an_order_get_its_events(self):
+        broadcaster = get_broadcaster()
+        customer = broadcaster.subscribe(Subscription(self.customer_user.id, 10))
+        other = broadcaster.subscribe(Subscription(self.other_customer.id, 10))
+        self.create_order()
+        self.assertEqual([parse_event(customer.get(0))[0] for _ in range(2)],
+                         ['order', 'counts'])
+        self.assertIsNone(other.get(0))
+        broadcaster.unsubscribe(customer)
+        broadcaster.unsubscribe(other)
+        self.assertEqual(len(broadcaster), 0)
+
+    def test_events_committed_out_of_order_are_published(self):
+        subscription = get_broadcaster().subscribe(Subscription(self.customer_user.id, 10))
+        self.addCleanup(get_broadcaster().unsubscribe, subscription)
+        late = Order.objects.create(customer_user=self.customer_user,
+                                    business_user=self.business_user, offer=self.detail)
+        late_event = OutboxEvent.objects.get(aggregate_type='order', aggregate_id=late.id)
+        late_event_id = late_event.id
+        late_event.delete()
+        early = self.create_order()
+        self.assertEqual(parse_event(subscription.get(0))[1]['id'], early.id)
+        subscription.get(0)
+
+        late_event.id = late_event_id
+        late_event.save()
+        get_channel().poll()
+        self.assertEqual(parse_event(subscription.get(0))[1]['id'], late.id)
+        self.assertEqual(get_channel().position.gaps, {})
+
+    @override_settings(ORDER_STREAM_HEARTBEAT_INTERVAL=0.01)
+    def test_keep_alive_and_authentication(self):
+        events = self.open_stream(self.customer_user)
+        next(events)
+        self.assertEqual(next(events), b': keep-alive\n\n')
+        self.client.force_authenticate(user=None)
+        response = self.client.get(reverse('orders-stream'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(ORDER_STREAM_QUEUE_SIZE=1)
+    def test_slow_client_is_asked_to_resync(self):
+        events = self.open_stream(self.customer_user)
+        next(events)
+        self.create_order()
+        self.assertEqual(parse_event(next(events))[0], 'resync')
+        self.assertEqual(list(events), [])
+        self.assertEqual(len(get_broadcaster()), 0)
+
+    def test_async_stream(self):
+        async def read():
+            stream = astream_events(self.business_user)
+            messages = [await anext(stream), await anext(stream)]
+            await sync_to_async(self.create_order)()
+            messages += [await anext(stream), await anext(stream)]
+            await stream.aclose()
+            return messages
+
+        messages = async_to_sync(read)()
+        self.assertEqual(messages[0], 'retry: 3000\n\n')
+        self.assertEqual([parse_event(message)[0] for message in messages[1:]],
+                         ['counts', 'order', 'counts'])
+        self.assertEqual(parse_event(messages[3])[1]['order_count'], 2)
+        self.assertEqual(len(get_broadcaster()), 0)
+
+    def test_asgi_requests_use_the_async_stream(self):
+        async def read():
+            client = AsyncClient()
+            await client.aforce_login(self.business_user)
+            response = await client.get(reverse('orders-stream'))
+            self.assertTrue(response.is_async)
+            stream = aiter(response.streaming_content)
+            messages = [await anext(stream), await anext(stream)]
+            await stream.aclose()
+            return messages
+
+        messages = async_to_sync(read)()
+        self.assertEqual(parse_event(messages[1])[1]['order_count'], 1)
@@ -4,7 +4,10 @@ from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from core.renderers import FastJSONRenderer
+
 from offers_app.models import OfferDetail, Offer
+from orders_app.api.serializers import OrderListSerializer, serialize_order_list
 from orders_app.models import Order
 from users_app.models import Profile
 
@@ -64,6 +67,63 @@ class OrdersGetPostTests(APITestCase):
                              'delivery_time_in_days', 'price', 'features', 'offer_type', 'status', 'created_at', 'updated_at'}
             self.assertTrue(expected_keys.issubset(response.data[0].keys()))
 
+    def test_get_orders_fast_path_matches_serializer(self):
+        """
+        Test that the order list fast path renders the same bytes as the serializer in one query.
+        """
+        for detail in OfferDetail.objects.all():
+            Order.objects.create(
+                customer_user=self.customer_user,
+                business_user=self.business_user,
+                offer=detail
+            )
+        queryset = Order.objects.order_by('id')
+        renderer = FastJSONRenderer()
+        expected = renderer.render(
+            OrderListSerializer(queryset, many=True).data)
+        with self.assertNumQueries(1):
+            actual = renderer.render(serialize_order_list(queryset))
+        self.assertEqual(actual, expected)
+        self.client.force_authenticate(user=self.business_user)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, format='json')
+        self.assertEqual(len(response.data), 3)
+
+    def test_order_keeps_price_snapshot(self):
+        """
+        Test that editing the offer detail does not change existing orders.
+        """
+        order = Order.objects.create(
+            customer_user=self.customer_user,
+            business_user=self.business_user,
+            offer_id=self.offer_detail_id
+        )
+        OfferDetail.objects.filter(pk=self.offer_detail_id).update(
+            price=999, title="Changed")
+        self.client.force_authenticate(user=self.customer_user)
+        with self.assertNumQueries(1) as queries:
+            response = self.client.get(self.url, format='json')
+        self.assertNotIn('offers_app_offerdetail',
+                         queries.captured_queries[0]['sql'])
+        self.assertEqual(response.data[0]['id'], order.id)
+        self.assertEqual(response.data[0]['price'], 50.0)
+        self.assertEqual(response.data[0]['title'], "Basic")
+
+    def test_get_orders_sparse_fields(self):
+        """
+        Test retrieval of orders limited to selected fields.
+        """
+        Order.objects.create(
+            customer_user=self.customer_user,
+            business_user=self.business_user,
+            offer_id=self.offer_detail_id
+        )
+        self.client.force_authenticate(user=self.business_user)
+        response = self.client.get(
+            self.url, {'fields': 'id,status,title'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data[0]), {'id', 'status', 'title'})
+
     def test_get_orders_not_authenticated(self):
         """
         Test retrieval of orders without authentication.
@@ -4,8 +4,14 @@ from . import views
 
 urlpatterns = [
     path('orders/', views.OrderListCreateView.as_view(), name='orders-list'),
+    path('orders/stream/', views.OrderStreamView.as_view(),
+         name='orders-stream'),
+    path('orders/analytics/', views.OrderAnalyticsView.as_view(),
+         name='orders-analytics'),
     path('orders/<int:pk>/', views.OrderUpdateDeleteView.as_view(),
          name='orders-detail'),
+    path('offers/<int:pk>/also-ordered/', views.OfferAlsoOrderedView.as_view(),
+         name='offers-also-ordered'),
     path('order-count/<int:business_user_id>/',
          views.OrderCountView.as_view(), name='order-count'),
     path('completed-order-count/<int:business_user_id>/',
@@ -1,27 +1,54 @@
+from datetime import timedelta
+
 from django.contrib.auth import get_user_model
+from django.core.handlers.asgi import ASGIRequest
 from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 
 
-from rest_framework import generics
-from rest_framework.exceptions import NotFound
+from rest_framework import generics, status
+from rest_framework.exceptions import APIException, NotFound, PermissionDenied, ValidationError
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.views import APIView
 
-from orders_app.api.serializers import OrderListSerializer, OrderDetailSerializer
+from core.serializers import SparseFieldsetViewMixin, get_sparse_fieldset
+from offers_app.api.filters import annotate_detail_summary
+from offers_app.api.serializers import OfferListReadSerializer
+from offers_app.models import Offer
+from orders_app.api.serializers import OrderListSerializer, OrderDetailSerializer, serialize_order_list
+from orders_app.analytics import INTERVALS, get_order_buckets
 from orders_app.api.permissions import IsOrderBusinessUser, IsCustomer
-from orders_app.models import Order
+from orders_app.co_orders import TOP_N
+from orders_app.models import CoOrderedOffers, Order
+from orders_app.state_machine import InvalidStatusTransition, StatusTransitionConflict, transition_order
+from orders_app.streams import astream_events, stream_events
+from sync_app.views import DeltaSyncMixin
 
 User = get_user_model()
 
 
-class OrderListCreateView(generics.ListCreateAPIView):
+class OrderStatusConflict(APIException):
+    """
+    Raised when the order status was changed by another request in the meantime.
+    """
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'The order status was changed by another request.'
+    default_code = 'conflict'
+
+
+class OrderListCreateView(DeltaSyncMixin, SparseFieldsetViewMixin, generics.ListCreateAPIView):
     """
     View to list and create orders.
+
+    Supports delta syncs with ?updated_since= (see DeltaSyncMixin).
     """
     queryset = Order.objects.all()
     serializer_class = OrderListSerializer
     permission_classes = [IsAuthenticated]
+    sync_resource = 'order'
 
     def perform_create(self, serializer):
         serializer.save(customer_user=self.request.user)
@@ -32,6 +59,27 @@ class OrderListCreateView(generics.ListCreateAPIView):
             Q(customer_user=user) | Q(business_user=user)
         )
 
+    def get_tombstones(self):
+        user = self.request.user
+        return super().get_tombstones().filter(
+            Q(customer_user_id=user.pk) | Q(business_user_id=user.pk))
+
+    def list(self, request, *args, **kwargs):
+        """
+        List orders through the values() fast path unless a sparse fieldset is requested.
+        """
+        requested, omitted = get_sparse_fieldset(request)
+        if requested is not None or omitted:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(serialize_order_list(queryset))
+
+    def serialize_sync_page(self, queryset):
+        requested, omitted = get_sparse_fieldset(self.request)
+        if requested is not None or omitted:
+            return super().serialize_sync_page(queryset)
+        return serialize_order_list(queryset)
+
     def get_permissions(self):
         if self.request.method == 'POST':
             return [IsCustomer(), IsAuthenticated()]
@@ -48,6 +96,22 @@ class OrderUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
     def get(self, request, *args, **kwargs):
         return Response({'detail': 'Method \"GET\" not allowed.'}, status=405)
 
+    def update(self, request, *args, **kwargs):
+        """
+        Change the order status through the state machine instead of saving the row.
+        """
+        order = self.get_object()
+        serializer = self.get_serializer(
+            order, data=request.data, partial=kwargs.pop('partial', False))
+        serializer.is_valid(raise_exception=True)
+        try:
+            transition_order(order, serializer.validated_data['status'])
+        except InvalidStatusTransition as exception:
+            raise ValidationError({'status': [str(exception)]})
+        except StatusTransitionConflict:
+            raise OrderStatusConflict()
+        return Response(self.get_serializer(order).data)
+
     def get_permissions(self):
         if self.request.method == 'DELETE':
             return [IsAdminUser()]
@@ -85,3 +149,116 @@ class OrderCompleteCount(APIView):
         count = Order.objects.filter(
             business_user=business_user_id, status="completed").count()
         return Response({'completed_order_count': count})
+
+
+class OrderStreamView(APIView):
+    """
+    View to stream order changes and order counts as server-sent events.
+
+    Sends an 'order' event for every created, changed or deleted order of the
+    user, as customer or business, and a 'counts' event with the in progress
+    and completed order counts of the business after each change (and on
+    connect, for business users). This replaces polling order-count/ and
+    completed-order-count/. After a 'resync' event the client fell behind and
+    should reconnect. Serve it with the ASGI application, where a connected
+    client does not occupy a worker thread.
+    """
+    permission_classes = [IsAuthenticated]
+    streaming = True
+
+    def get(self, request, format=None):
+        if isinstance(request._request, ASGIRequest):
+            events = astream_events(request.user)
+        else:
+            events = stream_events(request.user)
+        response = StreamingHttpResponse(events, content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+
+class OrderAnalyticsView(APIView):
+    """
+    View to retrieve order counts and revenue per day, week or month.
+
+    Business users see their own orders; staff users may pass business_user_id.
+    Served from the daily rollups, so long ranges do not scan the orders table.
+    """
+    permission_classes = [IsAuthenticated]
+    default_range_days = 30
+
+    def get(self, request, format=None):
+        interval = request.query_params.get('interval', 'day')
+        if interval not in INTERVALS:
+            raise ValidationError(
+                {'interval': f"Must be one of: {', '.join(INTERVALS)}."})
+        end = self.get_date('end', timezone.localdate())
+        start = self.get_date(
+            'start', end - timedelta(days=self.default_range_days))
+        if start > end:
+            raise ValidationError({'start': "Must not be after end."})
+        business_user_id = self.get_business_user_id(request)
+        return Response({
+            'business_user': business_user_id,
+            'interval': interval,
+            'start': start,
+            'end': end,
+            'buckets': get_order_buckets(business_user_id, interval, start, end),
+        })
+
+    def get_date(self, name, default):
+        value = self.request.query_params.get(name)
+        if not value:
+            return default
+        try:
+            parsed = parse_date(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValidationError({name: "Use the format YYYY-MM-DD."})
+        return parsed
+
+    def get_business_user_id(self, request):
+        business_user_id = request.query_params.get('business_user_id')
+        if business_user_id and request.user.is_staff:
+            try:
+                User.objects.get(id=business_user_id, type='business')
+            except (User.DoesNotExist, ValueError):
+                raise NotFound("Business user with this id does not exist.")
+            return int(business_user_id)
+        if request.user.type != 'business':
+            raise PermissionDenied("Only business users have order analytics.")
+        return request.user.id
+
+
+class OfferAlsoOrderedView(generics.GenericAPIView):
+    """
+    View to list the offers most often ordered by the customers of an offer.
+
+    The list is precomputed per offer, so it is read with one primary key lookup.
+    Returns at most ?limit= offers (default and maximum TOP_N), each with the
+    number of customers who ordered both offers.
+    """
+    serializer_class = OfferListReadSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk, format=None):
+        try:
+            limit = min(max(int(request.query_params.get('limit', TOP_N)), 1), TOP_N)
+        except ValueError:
+            raise ValidationError({'limit': ["A valid integer is required."]})
+        entry = CoOrderedOffers.objects.filter(pk=pk).first()
+        if entry is None:
+            if not Offer.objects.filter(pk=pk).exists():
+                raise NotFound()
+            return Response([])
+        offers = annotate_detail_summary(Offer.objects.filter(
+            pk__in=entry.offer_ids[:limit])).select_related('user__profile').prefetch_related('details')
+        offers = {offer.pk: offer for offer in offers}
+        found = [(offers[offer_id], count)
+                 for offer_id, count in zip(entry.offer_ids[:limit], entry.counts)
+                 if offer_id in offers]
+        data = self.get_serializer([offer for offer, _ in found], many=True).data
+        for item, (_, count) in zip(data, found):
+            item['co_order_count'] = count
+        return Response(data)
@@ -0,0 +1,186 @@
+import numpy as np
+from django.db import transaction
+
+from offers_app.models import Offer
+from orders_app.models import CoOrderedOffers, Order
+
+TOP_N = 10
+MAX_BASKET_SIZE = 100
+BUFFER_SIZE = 1_000_000
+MAX_PAIRS = 5_000_000
+STREAM_CHUNK_SIZE = 10_000
+SAVE_BATCH_SIZE = 1000
+
+
+class CoOrderCounter:
+    """
+    Count how often two offers were ordered by the same customer.
+
+    Offers are mapped to dense indices, and every ordered pair (a, b) of a
+    customer's distinct offers is encoded as a * n + b in an int64 array. Pair codes are
+    buffered and then merged into sorted arrays of distinct codes and counts,
+    so memory grows with the number of distinct pairs, not with the number of
+    orders. Once more than max_pairs distinct pairs exist, the rarest are
+    dropped, which makes the counts approximate but keeps memory bounded.
+    Only the first MAX_BASKET_SIZE distinct offers of a customer are paired.
+    """
+
+    def __init__(self, offer_ids, buffer_size=BUFFER_SIZE, max_pairs=MAX_PAIRS):
+        self.offer_ids = np.unique(np.asarray(offer_ids, dtype=np.int64))
+        self.size = len(self.offer_ids)
+        self.max_pairs = max_pairs
+        self.codes = np.empty(0, dtype=np.int64)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.dropped = 0
+        self._buffer = np.empty(buffer_size, dtype=np.int64)
+        self._used = 0
+
+    def add_basket(self, offer_ids):
+        """
+        Count the pairs of offers in one customer's orders.
+        """
+        self.add_orders(np.zeros(len(offer_ids), dtype=np.int64), offer_ids)
+
+    def add_orders(self, customer_ids, offer_ids):
+        """
+        Count the pairs of offers ordered by the same customer.
+
+        Takes the customer and offer of each order as two arrays. All orders of
+        a customer must be passed in the same call. The pairs of all customers
+        are generated at once with array operations.
+        """
+        customer_ids = np.asarray(customer_ids, dtype=np.int64)
+        offer_ids = np.asarray(offer_ids, dtype=np.int64)
+        if not self.size or len(offer_ids) < 2:
+            return
+        indices = np.searchsorted(self.offer_ids, offer_ids)
+        known = self.offer_ids[np.minimum(indices, self.size - 1)] == offer_ids
+        customer_ids, indices = customer_ids[known], indices[known]
+        if len(indices) < 2:
+            return
+        order = np.lexsort((indices, customer_ids))
+        customer_ids, indices = customer_ids[order], indices[order]
+        distinct = np.r_[True, (customer_ids[1:] != customer_ids[:-1])
+                         | (indices[1:] != indices[:-1])]
+        customer_ids, indices = customer_ids[distinct], indices[distinct]
+        starts = np.flatnonzero(np.r_[True, customer_ids[1:] != customer_ids[:-1]])
+        sizes = np.diff(np.r_[starts, len(indices)])
+        ranks = np.arange(len(indices)) - np.repeat(starts, sizes)
+        indices = indices[ranks < MAX_BASKET_SIZE]
+        sizes = np.minimum(sizes, MAX_BASKET_SIZE)
+        starts = np.cumsum(sizes) - sizes
+
+        # Pair every offer with every offer of its basket, including itself.
+        element_sizes = np.repeat(sizes, sizes)
+        element_starts = np.repeat(starts, sizes)
+        left = np.repeat(indices, element_sizes)
+        offsets = np.arange(len(left)) - np.repeat(
+            np.cumsum(element_sizes) - element_sizes, element_sizes)
+        right = indices[np.repeat(element_starts, element_sizes) + offsets]
+        others = left != right
+        self._add_codes(left[others] * self.size + right[others])
+
+    def _add_codes(self, codes):
+        if not len(codes):
+            return
+        if self._used + len(codes) > len(self._buffer):
+            self.flush()
+        if len(codes) > len(self._buffer):
+            self._merge(codes)
+            return
+        self._buffer[self._used:self._used + len(codes)] = codes
+        self._used += len(codes)
+
+    def flush(self):
+        """
+        Merge the buffered pair codes into the counts.
+        """
+        if self._used:
+            self._merge(self._buffer[:self._used])
+            self._used = 0
+
+    def _merge(self, codes):
+        codes, counts = np.unique(codes, return_counts=True)
+        codes = np.concatenate([self.codes, codes])
+        counts = np.concatenate([self.counts, counts])
+        order = np.argsort(codes, kind='stable')
+        codes, counts = codes[order], counts[order]
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        self.codes = codes[starts]
+        self.counts = np.add.reduceat(counts, starts)
+        if len(self.codes) > self.max_pairs:
+            keep = np.sort(np.argpartition(-self.counts,
+                           self.max_pairs - 1)[:self.max_pairs])
+            self.dropped += len(self.codes) - self.max_pairs
+            self.codes, self.counts = self.codes[keep], self.counts[keep]
+
+    def top(self, limit=TOP_N):
+        """
+        Get {offer_id: ([co-ordered offer IDs], [counts])} with the limit most
+        frequent pairs per offer, ties ordered by offer ID.
+        """
+        self.flush()
+        rows, columns = np.divmod(self.codes, self.size)
+        order = np.lexsort((columns, -self.counts, rows))
+        rows, columns, counts = rows[order], columns[order], self.counts[order]
+        ranks = np.arange(len(rows)) - np.searchsorted(rows, rows)
+        keep = ranks < limit
+        rows, columns, counts = rows[keep], columns[keep], counts[keep]
+        result = {}
+        starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]]) if len(rows) else []
+        for start, end in zip(starts, [*starts[1:], len(rows)]):
+            offer_id = int(self.offer_ids[rows[start]])
+            result[offer_id] = (self.offer_ids[columns[start:end]].tolist(),
+                                counts[start:end].tolist())
+        return result
+
+
+def stream_orders(chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Yield (customer IDs, offer IDs) arrays of about chunk_size orders.
+
+    Orders are read in customer order with a server side cursor, so only one
+    chunk of rows is in memory at a time. A chunk always holds all orders of
+    its customers. Cancelled orders are skipped.
+    """
+    rows = Order.objects.exclude(status='cancelled').order_by(
+        'customer_user_id').values_list('customer_user_id', 'offer__offer_id')
+    customer_ids, offer_ids = [], []
+    for customer_id, offer_id in rows.iterator(chunk_size=chunk_size):
+        if len(customer_ids) >= chunk_size and customer_id != customer_ids[-1]:
+            yield np.array(customer_ids), np.array(offer_ids)
+            customer_ids, offer_ids = [], []
+        customer_ids.append(customer_id)
+        offer_ids.append(offer_id)
+    if customer_ids:
+        yield np.array(customer_ids), np.array(offer_ids)
+
+
+def save_co_orders(top):
+    """
+    Replace all stored co-ordered offers with the given top lists.
+
+    Offers deleted since the counts were taken are skipped.
+    """
+    with transaction.atomic():
+        CoOrderedOffers.objects.all().delete()
+        existing = set(Offer.objects.values_list('pk', flat=True))
+        CoOrderedOffers.objects.bulk_create([
+            CoOrderedOffers(offer_id=offer_id,
+                            offer_ids=offer_ids, counts=counts)
+            for offer_id, (offer_ids, counts) in top.items() if offer_id in existing
+        ], batch_size=SAVE_BATCH_SIZE)
+
+
+def rebuild_co_orders(limit=TOP_N):
+    """
+    Recompute the offers most often ordered by the same customers as each offer.
+
+    Returns the number of offers with co-ordered offers.
+    """
+    counter = CoOrderCounter(list(Offer.objects.values_list('pk', flat=True)))
+    for customer_ids, offer_ids in stream_orders():
+        counter.add_orders(customer_ids, offer_ids)
+    top = counter.top(limit)
+    save_co_orders(top)
+    return len(top)
@@ -0,0 +1,10 @@
+from events_app.registry import consumer
+from orders_app.analytics import apply_order_event
+
+
+@consumer('orders.daily_stats', topics=['order.*'])
+def update_daily_stats(event):
+    """
+    Keep the daily order rollups in sync with order changes.
+    """
+    apply_order_event(event)
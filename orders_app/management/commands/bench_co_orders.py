@@ -0,0 +1,46 @@
+import time
+import tracemalloc
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from orders_app.co_orders import CoOrderCounter
+
+CHUNK_SIZE = 100_000
+
+
+class Command(BaseCommand):
+    """
+    Measure counting co-ordered offers over a synthetic order history.
+
+    Orders are generated in memory and fed to the counter in chunks of whole
+    customers, as rebuild_co_orders() does with the rows streamed from the
+    database.
+    Offer popularity follows a Zipf distribution.
+    """
+    help = 'Benchmark the co-ordered offers counter.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orders', type=int, default=10_000_000)
+        parser.add_argument('--offers', type=int, default=50_000)
+        parser.add_argument('--orders-per-customer', type=int, default=5)
+
+    def handle(self, *args, **options):
+        generator = np.random.default_rng(0)
+        tracemalloc.start()
+        start = time.perf_counter()
+        counter = CoOrderCounter(np.arange(1, options['offers'] + 1))
+        for chunk_start in range(0, options['orders'], CHUNK_SIZE):
+            size = min(CHUNK_SIZE, options['orders'] - chunk_start)
+            customers = np.sort(generator.integers(
+                0, size // options['orders_per_customer'], size))
+            offers = np.minimum(generator.zipf(1.3, size), options['offers'])
+            counter.add_orders(customers + chunk_start, offers)
+        top = counter.top()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.stdout.write(
+            f"{options['orders']} orders: {elapsed:.1f} s, "
+            f"{len(counter.codes)} distinct pairs ({counter.dropped} dropped), "
+            f"{len(top)} offers with co-orders, peak {peak / 1024 / 1024:.0f} MB")
@@ -0,0 +1,72 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.renderers import FastJSONRenderer
+from offers_app.models import Offer, OfferDetail
+from orders_app.api.serializers import OrderListSerializer, serialize_order_list
+from orders_app.models import Order
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Compare the order list serializer with the values() fast path.
+
+    Test data is created inside a transaction that is rolled back afterwards.
+    """
+    help = 'Benchmark serializing the order list.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orders', type=int, default=10000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            queryset = self.create_orders(options['orders'])
+            renderer = FastJSONRenderer()
+            serializer_time = self.measure(options['repeat'], lambda: renderer.render(
+                OrderListSerializer(queryset, many=True).data))
+            fast_time = self.measure(options['repeat'], lambda: renderer.render(
+                serialize_order_list(queryset)))
+            transaction.set_rollback(True)
+        for label, seconds in [('OrderListSerializer', serializer_time), ('serialize_order_list', fast_time)]:
+            self.stdout.write(
+                f"{label}: {seconds * 1000:.1f} ms, {options['orders'] / seconds:.0f} orders/s")
+        self.stdout.write(f"Speedup: {serializer_time / fast_time:.1f}x")
+
+    def measure(self, repeat, func):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    def create_orders(self, count):
+        business_user = User.objects.create(
+            username='bench_business', email='bench_business@mail.de', type='business')
+        customer_user = User.objects.create(
+            username='bench_customer', email='bench_customer@mail.de', type='customer')
+        offer = Offer.objects.create(
+            user=business_user, title='Benchmark Offer', description='Benchmark')
+        details = [
+            OfferDetail.objects.create(
+                offer=offer, title=offer_type.capitalize(), revisions=index + 1,
+                delivery_time_in_days=index + 3, price=50 * (index + 1),
+                features=['A', 'B'], offer_type=offer_type)
+            for index, offer_type in enumerate(['basic', 'standard', 'premium'])
+        ]
+        orders = [
+            Order(customer_user=customer_user, business_user=business_user,
+                  offer=details[index % len(details)])
+            for index in range(count)
+        ]
+        for order in orders:
+            order.copy_offer_snapshot()
+        Order.objects.bulk_create(orders, batch_size=1000)
+        return Order.objects.filter(business_user=business_user).order_by('id')
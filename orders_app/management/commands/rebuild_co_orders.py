@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from orders_app.co_orders import rebuild_co_orders
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the offers most often ordered together from the orders table.
+    """
+    help = 'Recompute the co-ordered offers of every offer.'
+
+    def handle(self, *args, **options):
+        count = rebuild_co_orders()
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt the co-ordered offers of {count} offers.'))
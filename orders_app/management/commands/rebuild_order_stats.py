@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from orders_app.analytics import rebuild_daily_stats
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the daily order rollups from the orders table.
+    """
+    help = 'Recompute all daily order rollups.'
+
+    def handle(self, *args, **options):
+        count = rebuild_daily_stats()
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {count} daily order rollups.'))
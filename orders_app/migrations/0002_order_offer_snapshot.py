@@ -0,0 +1,43 @@
+# Generated by Django 5.2.5 on 2026-10-19 10:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='delivery_time_in_days',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='features',
+            field=models.JSONField(blank=True, default=list, null=True),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='offer_type',
+            field=models.CharField(blank=True, choices=[('basic', 'Basic'), ('standard', 'Standard'), ('premium', 'Premium')], default='', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='price',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='revisions',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='title',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.5 on 2026-10-19 10:42
+
+from django.db import migrations
+
+BATCH_SIZE = 1000
+SNAPSHOT_FIELDS = [
+    'title',
+    'revisions',
+    'delivery_time_in_days',
+    'price',
+    'features',
+    'offer_type',
+]
+
+
+def backfill_offer_snapshot(apps, schema_editor):
+    """
+    Copy the offer detail fields onto existing orders in primary key batches.
+    """
+    Order = apps.get_model('orders_app', 'Order')
+    queryset = Order.objects.using(
+        schema_editor.connection.alias).select_related('offer').order_by('pk')
+    last_pk = 0
+    while True:
+        orders = list(queryset.filter(pk__gt=last_pk)[:BATCH_SIZE])
+        if not orders:
+            break
+        for order in orders:
+            for field_name in SNAPSHOT_FIELDS:
+                setattr(order, field_name, getattr(order.offer, field_name))
+        Order.objects.using(schema_editor.connection.alias).bulk_update(
+            orders, SNAPSHOT_FIELDS)
+        last_pk = orders[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0002_order_offer_snapshot'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_offer_snapshot,
+                             migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0005_similar_offer'),
+        ('orders_app', '0004_order_daily_stat'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CoOrderedOffers',
+            fields=[
+                ('offer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='co_ordered', serialize=False, to='offers_app.offer')),
+                ('offer_ids', models.JSONField(default=list)),
+                ('counts', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
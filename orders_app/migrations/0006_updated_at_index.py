@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0006_updated_at_index'),
+        ('orders_app', '0005_co_ordered_offers'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['updated_at', 'id'], name='order_updated_idx'),
+        ),
+    ]
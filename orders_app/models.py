@@ -1,12 +1,14 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.utils import timezone
 
-from offers_app.models import OfferDetail
+from events_app.models import OutboxModel
+from offers_app.models import Offer, OfferDetail
 
 User = get_user_model()
 
 
-class Order(models.Model):
+class Order(OutboxModel):
     """
     Model representing an order placed by a customer for an offer.
 
@@ -15,6 +17,9 @@ class Order(models.Model):
         - business_user: ForeignKey to the User who owns the offer.
         - offer: ForeignKey to the OfferDetail being ordered.
         - status: Current status of the order (e.g., in progress, completed).
+        - title, revisions, delivery_time_in_days, price, features, offer_type:
+          Snapshot of the OfferDetail taken when the order is created, so later
+          edits of the offer do not change existing orders.
         - created_at: Timestamp when the order was created.
         - updated_at: Timestamp when the order was last updated.
     """
@@ -23,6 +28,14 @@ class Order(models.Model):
         ('completed', 'Completed'),
         ('cancelled', 'Cancelled')
     ]
+    SNAPSHOT_FIELDS = [
+        'title',
+        'revisions',
+        'delivery_time_in_days',
+        'price',
+        'features',
+        'offer_type',
+    ]
     customer_user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name='customer_orders')
     business_user = models.ForeignKey(
@@ -31,8 +44,113 @@ class Order(models.Model):
         OfferDetail, on_delete=models.CASCADE, related_name='orders')
     status = models.CharField(
         max_length=20, choices=STATUS_CHOICES, default='in_progress')
+    title = models.CharField(max_length=255, blank=True, default='')
+    revisions = models.PositiveIntegerField(default=0)
+    delivery_time_in_days = models.PositiveIntegerField(default=0)
+    price = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    features = models.JSONField(blank=True, null=True, default=list)
+    offer_type = models.CharField(
+        choices=OfferDetail.OFFER_TYPE_CHOICES, max_length=10, blank=True, default='')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    outbox_aggregate = 'order'
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='order_updated_idx'),
+        ]
+
     def __str__(self):
         return f"Order {self.id} by {self.customer_user.username} for {self.offer.title} from {self.business_user.username}"
+
+    def save(self, *args, **kwargs):
+        """
+        Take the snapshot of the ordered offer detail when the order is created.
+        """
+        if self._state.adding:
+            self.copy_offer_snapshot()
+        super().save(*args, **kwargs)
+        self._loaded_status = self.status
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the status loaded from the database to detect status changes.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+
+    def copy_offer_snapshot(self):
+        """
+        Copy the snapshot fields from the ordered offer detail.
+        """
+        for field_name in self.SNAPSHOT_FIELDS:
+            setattr(self, field_name, getattr(self.offer, field_name))
+
+    def get_outbox_payload(self):
+        return {
+            'id': self.pk,
+            'customer_user_id': self.customer_user_id,
+            'business_user_id': self.business_user_id,
+            'offer_detail_id': self.offer_id,
+            'status': self.status,
+            'previous_status': getattr(self, '_loaded_status', None),
+            'price': str(self.price),
+            'created_on': timezone.localdate(self.created_at).isoformat(),
+        }
+
+
+class OrderDailyStat(models.Model):
+    """
+    Model representing the daily order rollup of a business user per status.
+
+    Updated incrementally from order events, so analytics never scan the
+    orders table.
+
+    Fields:
+        - business_user: ForeignKey to the User who owns the orders.
+        - day: Day the orders were created.
+        - status: Current status of the counted orders.
+        - order_count: Number of orders.
+        - revenue: Sum of the order prices.
+    """
+    business_user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name='order_daily_stats')
+    day = models.DateField()
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    order_count = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['business_user', 'day', 'status'], name='unique_order_daily_stat'),
+        ]
+
+    def __str__(self):
+        return f"{self.business_user_id} {self.day} {self.status}: {self.order_count}"
+
+
+class CoOrderedOffers(models.Model):
+    """
+    Model storing the offers most often ordered by the customers of an offer.
+
+    Rebuilt from the order history by orders_app.co_orders. One row per offer,
+    so a lookup is a single primary key read.
+
+    Fields:
+        - offer: The Offer the list belongs to, also the primary key.
+        - offer_ids: IDs of the co-ordered offers, most frequent first.
+        - counts: Number of customers who ordered both offers, per entry of offer_ids.
+        - updated_at: Timestamp when the list was computed.
+    """
+    offer = models.OneToOneField(
+        Offer, on_delete=models.CASCADE, primary_key=True, related_name='co_ordered')
+    offer_ids = models.JSONField(default=list)
+    counts = models.JSONField(default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Offers ordered together with offer {self.offer_id}"
@@ -0,0 +1,59 @@
+from django.db import transaction
+from django.utils import timezone
+
+from orders_app.models import Order
+
+TRANSITIONS = {
+    'in_progress': {'completed', 'cancelled'},
+    'completed': set(),
+    'cancelled': set(),
+}
+
+
+class InvalidStatusTransition(Exception):
+    """
+    Raised when the requested status cannot follow the current status.
+    """
+
+
+class StatusTransitionConflict(Exception):
+    """
+    Raised when the order status changed concurrently before the transition was applied.
+    """
+
+
+def transition_order(order, new_status):
+    """
+    Move an order from the status it was loaded with to new_status.
+
+    The change is a single conditional UPDATE ... WHERE status=<loaded status>,
+    so concurrent transitions cannot overwrite each other: the loser raises
+    StatusTransitionConflict. An order.status_changed event is recorded in the
+    same transaction. Requesting the current status is a no-op. If the
+    transaction fails, the instance keeps its loaded status.
+    """
+    expected_status = order.status
+    if new_status == expected_status:
+        return order
+    if new_status not in TRANSITIONS.get(expected_status, set()):
+        raise InvalidStatusTransition(
+            f"Cannot change status from '{expected_status}' to '{new_status}'.")
+    now = timezone.now()
+    previous_updated_at = order.updated_at
+    try:
+        with transaction.atomic():
+            updated = Order.objects.filter(pk=order.pk, status=expected_status).update(
+                status=new_status, updated_at=now)
+            if not updated:
+                raise StatusTransitionConflict(
+                    f"Order {order.pk} is no longer '{expected_status}'.")
+            order._loaded_status = expected_status
+            order.status = new_status
+            order.updated_at = now
+            order.record_outbox_event('status_changed')
+    except Exception:
+        order.status = order._loaded_status = expected_status
+        order.updated_at = previous_updated_at
+        raise
+    order._loaded_status = new_status
+    return order
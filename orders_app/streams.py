@@ -0,0 +1,316 @@
+import asyncio
+import json
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Count, Max, Q
+from django.utils.module_loading import import_string
+
+from events_app.models import OutboxEvent
+from events_app.tailing import OutboxPosition
+from orders_app.models import Order
+
+logger = logging.getLogger(__name__)
+
+POLL_BATCH_SIZE = 500
+RETRY_MILLISECONDS = 3000
+
+_lock = threading.Lock()
+_state = {'broadcaster': None, 'channel': None}
+
+
+def format_event(event, data, event_id=None):
+    """
+    Format one server-sent event.
+    """
+    lines = [f'id: {event_id}'] if event_id is not None else []
+    lines += [f'event: {event}', f'data: {json.dumps(data)}']
+    return '\n'.join(lines) + '\n\n'
+
+
+def get_order_counts(business_user_ids):
+    """
+    Get {business_user_id: {'order_count': ..., 'completed_order_count': ...}}
+    with one grouped query.
+    """
+    counts = {
+        business_user_id: {'order_count': 0, 'completed_order_count': 0}
+        for business_user_id in business_user_ids
+    }
+    rows = Order.objects.filter(business_user_id__in=counts).values(
+        'business_user_id').annotate(
+        order_count=Count('id', filter=Q(status='in_progress')),
+        completed_order_count=Count('id', filter=Q(status='completed')),
+    ).order_by()
+    for row in rows:
+        counts[row.pop('business_user_id')] = row
+    return counts
+
+
+def format_counts(business_user_id, counts):
+    return format_event('counts', {'business_user_id': business_user_id, **counts})
+
+
+class Subscription:
+    """
+    Messages for one connected client, held in a bounded queue.
+
+    A client that falls queue_size messages behind is marked as overflowed and
+    gets no further messages; its stream then asks it to reconnect.
+    """
+
+    def __init__(self, user_id, queue_size):
+        self.user_id = user_id
+        self.queue = queue.Queue(queue_size)
+        self.overflowed = False
+
+    def put(self, message):
+        try:
+            self.queue.put_nowait(message)
+        except queue.Full:
+            self.overflowed = True
+
+    def get(self, timeout):
+        """
+        Wait up to timeout seconds for the next message; None on timeout.
+        """
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class AsyncSubscription(Subscription):
+    """
+    Subscription read from an event loop. Messages are handed to the loop,
+    so publishing from another thread never blocks on the client.
+    """
+
+    def __init__(self, user_id, queue_size):
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(queue_size)
+        self.overflowed = False
+
+    def put(self, message):
+        try:
+            self.loop.call_soon_threadsafe(self._put, message)
+        except RuntimeError:
+            pass  # The loop of a disconnected client is already closed.
+
+    def _put(self, message):
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self, timeout):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class Broadcaster:
+    """
+    In-process fan-out of stream messages to the subscriptions of users.
+
+    The lock is only held to look up or change subscriptions, never while
+    handing messages to clients.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = defaultdict(set)
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def subscribe(self, subscription):
+        with self._lock:
+            self._subscriptions[subscription.user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.user_id]
+
+    def listeners(self, user_ids):
+        """
+        Get the IDs of the given users with at least one subscription.
+        """
+        with self._lock:
+            return {user_id for user_id in user_ids if user_id in self._subscriptions}
+
+    def publish(self, user_ids, message):
+        with self._lock:
+            subscriptions = [
+                subscription for user_id in set(user_ids)
+                for subscription in self._subscriptions.get(user_id, ())
+            ]
+        for subscription in subscriptions:
+            subscription.put(message)
+
+
+class OutboxChannel:
+    """
+    Cross-worker channel that reads order events from the outbox table.
+
+    Every order change is recorded as an outbox event in the same transaction,
+    so tailing the outbox shows each worker the changes made by all workers
+    without a message broker. A background thread polls every
+    ORDER_STREAM_POLL_INTERVAL seconds (0 disables it; call poll() instead)
+    and publishes each order event, plus fresh counts of the affected
+    businesses, to the business and customer of the order. Counts are
+    only queried for orders whose users are connected to this worker.
+
+    Events committed out of ID order are still published if they show up
+    within ORDER_STREAM_GAP_TIMEOUT seconds (see OutboxPosition).
+
+    Other channels (e.g. a Redis pub/sub subscriber) can be configured with
+    ORDER_STREAM_CHANNEL; they take the broadcaster and implement start().
+    """
+
+    def __init__(self, broadcaster):
+        self.broadcaster = broadcaster
+        self.position = None
+        self._thread = None
+
+    def start(self):
+        """
+        Start following the outbox from its current end.
+        """
+        self.position = OutboxPosition(
+            OutboxEvent.objects.aggregate(last=Max('id'))['last'] or 0,
+            settings.ORDER_STREAM_GAP_TIMEOUT)
+        interval = settings.ORDER_STREAM_POLL_INTERVAL
+        if interval > 0:
+            self._thread = threading.Thread(
+                target=self.run, args=(interval,), name='order-stream', daemon=True)
+            self._thread.start()
+
+    def run(self, interval):
+        while True:
+            close_old_connections()
+            try:
+                if self.poll() == POLL_BATCH_SIZE:
+                    continue
+            except Exception:
+                logger.exception("Polling order events failed")
+            time.sleep(interval)
+
+    def poll(self):
+        """
+        Publish the order events recorded since the last poll.
+
+        Returns the number of events read.
+        """
+        events = list(OutboxEvent.objects.filter(self.position.pending()).order_by(
+            'id').values_list('id', 'aggregate_type', 'topic', 'payload')[:POLL_BATCH_SIZE])
+        self.position.advance([event[0] for event in events])
+        if not events:
+            return 0
+
+        recipients = defaultdict(set)
+        for event_id, aggregate_type, topic, payload in events:
+            if aggregate_type != 'order':
+                continue
+            users = [payload.get('business_user_id'), payload.get('customer_user_id')]
+            users = self.broadcaster.listeners(user_id for user_id in users if user_id)
+            if not users:
+                continue
+            self.broadcaster.publish(users, format_event(
+                'order', {'event': topic, **payload}, event_id))
+            recipients[payload['business_user_id']].update(users)
+        for business_user_id, counts in get_order_counts(recipients).items():
+            self.broadcaster.publish(
+                recipients[business_user_id], format_counts(business_user_id, counts))
+        return len(events)
+
+
+def get_broadcaster():
+    """
+    Get the broadcaster of this process, starting its channel on first use.
+    """
+    with _lock:
+        if _state['broadcaster'] is None:
+            broadcaster = Broadcaster()
+            channel = import_string(settings.ORDER_STREAM_CHANNEL)(broadcaster)
+            channel.start()
+            _state.update(broadcaster=broadcaster, channel=channel)
+        return _state['broadcaster']
+
+
+def get_channel():
+    get_broadcaster()
+    return _state['channel']
+
+
+def get_snapshot(user):
+    """
+    Get the messages sent when a client connects: the counts of a business user.
+    """
+    if user.type != 'business':
+        return []
+    counts = get_order_counts([user.id])[user.id]
+    return [format_counts(user.id, counts)]
+
+
+def stream_events(user):
+    """
+    Yield the server-sent events for a user, for WSGI deployments.
+
+    Each connected client keeps one worker thread busy.
+    """
+    broadcaster = get_broadcaster()
+    subscription = broadcaster.subscribe(
+        Subscription(user.id, settings.ORDER_STREAM_QUEUE_SIZE))
+    try:
+        yield f'retry: {RETRY_MILLISECONDS}\n\n'
+        yield from get_snapshot(user)
+        while not subscription.overflowed:
+            message = subscription.get(settings.ORDER_STREAM_HEARTBEAT_INTERVAL)
+            yield message if message is not None else ': keep-alive\n\n'
+        yield format_event('resync', {})
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+async def astream_events(user):
+    """
+    Yield the server-sent events for a user, for ASGI deployments.
+
+    Clients wait on the event loop, so one worker serves many of them.
+    """
+    broadcaster = await sync_to_async(get_broadcaster)()
+    subscription = broadcaster.subscribe(
+        AsyncSubscription(user.id, settings.ORDER_STREAM_QUEUE_SIZE))
+    try:
+        yield f'retry: {RETRY_MILLISECONDS}\n\n'
+        for message in await sync_to_async(get_snapshot)(user):
+            yield message
+        while not subscription.overflowed:
+            message = await subscription.get(settings.ORDER_STREAM_HEARTBEAT_INTERVAL)
+            yield message if message is not None else ': keep-alive\n\n'
+        yield format_event('resync', {})
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+def reset_broadcaster():
+    """
+    Drop the broadcaster of this process, so the next stream creates it again.
+    """
+    with _lock:
+        _state.update(broadcaster=None, channel=None)
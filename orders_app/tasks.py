@@ -0,0 +1,12 @@
+from datetime import timedelta
+
+from orders_app import co_orders
+from tasks_app.registry import task
+
+
+@task(run_every=timedelta(days=1))
+def rebuild_co_orders():
+    """
+    Recompute the offers most often ordered together once a day.
+    """
+    co_orders.rebuild_co_orders()
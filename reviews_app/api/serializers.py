@@ -1,12 +1,17 @@
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 from rest_framework.exceptions import PermissionDenied
 
+from core.profiling import ProfiledSerializerMixin
+from core.serializers import ExpandableFieldsMixin, SparseFieldsetMixin
 from reviews_app.models import Review
+from users_app.api.serializers import UserSummarySerializer
 
 
-class ReviewListSerializer(serializers.ModelSerializer):
+class ReviewListSerializer(ProfiledSerializerMixin, ExpandableFieldsMixin, SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for listing reviews and creating.
+    Embeds user summaries instead of IDs for the fields named in ?expand=.
     """
     class Meta:
         model = Review
@@ -25,24 +30,52 @@ class ReviewListSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at'
         ]
+        expandable_fields = {
+            'reviewer': (UserSummarySerializer, 'reviewer__profile'),
+            'business_user': (UserSummarySerializer, 'business_user__profile'),
+        }
 
-    def create(self, validated_data):
+    def validate_business_user(self, value):
         """
-        Create a new review.
-        Checks if the business user is valid and if the reviewer has already reviewed the business.
+        Check that only business users are reviewed.
         """
-        reviewer = self.context['request'].user
-        business_user = validated_data['business_user']
-        if business_user.type != 'business':
+        if value.type != 'business':
             raise serializers.ValidationError(
                 "You can only review business users.")
-        if Review.objects.filter(business_user=business_user, reviewer=reviewer).exists():
+        return value
+
+    def create(self, validated_data):
+        """
+        Create a new review.
+        Relies on the unique constraint on business user and reviewer, so two
+        concurrent requests cannot both create a review of the same business.
+        """
+        validated_data['reviewer'] = self.context['request'].user
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
             raise PermissionDenied("You have already reviewed this business.")
-        validated_data['reviewer'] = reviewer
-        return super().create(validated_data)
+
+    def upsert(self):
+        """
+        Create the reviewer's review of the business or update the existing one.
+        Returns the review and whether it was created.
+        """
+        data = self.validated_data
+        review, created = Review.objects.update_or_create(
+            business_user=data['business_user'],
+            reviewer=self.context['request'].user,
+            defaults={
+                'rating': data['rating'],
+                'description': data['description'],
+            }
+        )
+        self.instance = review
+        return review, created
 
 
-class ReviewDetailSerializer(serializers.ModelSerializer):
+class ReviewDetailSerializer(ProfiledSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for retrieving and updating reviews.
     """
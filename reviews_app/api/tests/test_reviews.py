@@ -1,9 +1,19 @@
+import threading
+import time
+from unittest import mock
+
 from django.contrib.auth import get_user_model
+from django.db import OperationalError, connection
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APIClient, APITestCase
 
+from events_app.dispatcher import dispatch_pending
+from reviews_app.api.serializers import ReviewListSerializer
 from reviews_app.models import Review
+from tasks_app.models import Task
 from users_app.models import Profile
 
 User = get_user_model()
@@ -49,6 +59,48 @@ class ReviewsGetPostTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
 
+    def test_get_reviews_expanded(self):
+        """
+        Test embedding user summaries with a constant number of queries.
+        """
+        self.client.force_authenticate(user=self.business_user)
+        url = self.url + '?expand=reviewer,business_user'
+        with CaptureQueriesContext(connection) as single_review:
+            response = self.client.get(url, format='json')
+        self.assertEqual(len(single_review), 1)
+        reviewer = response.data[0]['reviewer']
+        self.assertEqual(reviewer['user'], self.customer_user.id)
+        self.assertEqual(reviewer['username'], 'customer')
+        self.assertEqual(reviewer['type'], 'customer')
+        self.assertEqual(
+            response.data[0]['business_user']['user'], self.business_user.id)
+
+        for index in range(5):
+            customer = User.objects.create_user(
+                username=f"customer{index}",
+                email=f"customer{index}@mail.de",
+                password="password123",
+                type="customer"
+            )
+            Review.objects.create(
+                business_user=self.business_user,
+                reviewer=customer,
+                rating=4,
+                description='Test description'
+            )
+        with self.assertNumQueries(len(single_review)):
+            response = self.client.get(url, format='json')
+        self.assertEqual(len(response.data), 6)
+        self.assertIsNone(response.data[-1]['reviewer']['first_name'])
+
+    def test_get_reviews_not_expanded(self):
+        """
+        Test that reviews reference users by ID without ?expand=.
+        """
+        self.client.force_authenticate(user=self.business_user)
+        response = self.client.get(self.url + '?expand=unknown', format='json')
+        self.assertEqual(response.data[0]['reviewer'], self.customer_user.id)
+
     def test_get_reviews_not_authorized(self):
         """
         Test getting reviews as an unauthenticated user.
@@ -74,6 +126,10 @@ class ReviewsGetPostTests(APITestCase):
         }
         response = self.client.post(self.url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        dispatch_pending()
+        self.assertTrue(Task.objects.filter(
+            name='offers_app.tasks.refresh_seller_offer_ranks',
+            args=[business_user.id]).exists())
 
     def test_post_missing_fields(self):
         """
@@ -113,6 +169,205 @@ class ReviewsGetPostTests(APITestCase):
         self.client.post(self.url, data, format='json')
         response = self.client.post(self.url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Review.objects.filter(
+            business_user=self.business_user, reviewer=self.customer_user).count(), 1)
+
+    def test_post_review_created_concurrently(self):
+        """
+        Test posting a review while another request creates the same review.
+        The unique constraint rejects the insert; should return a 403 status code.
+        """
+        Review.objects.all().delete()
+        self.client.force_authenticate(user=self.customer_user)
+        data = {
+            "business_user": self.business_user.id,
+            "rating": 5,
+            "description": "Test description"
+        }
+        validate = ReviewListSerializer.validate_business_user
+
+        def validate_during_concurrent_post(serializer, value):
+            Review.objects.create(
+                business_user=self.business_user, reviewer=self.customer_user,
+                rating=4, description="Concurrent review")
+            return validate(serializer, value)
+
+        with mock.patch.object(ReviewListSerializer, 'validate_business_user',
+                               validate_during_concurrent_post):
+            response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Review.objects.get().description, "Concurrent review")
+
+    def test_post_review_of_customer(self):
+        """
+        Test posting a review of a user that is not a business user.
+        """
+        self.client.force_authenticate(user=self.customer_user)
+        data = {
+            "business_user": self.customer_user.id,
+            "rating": 5,
+            "description": "Test description"
+        }
+        response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ReviewsUpsertTests(APITestCase):
+    """
+    Test suite for creating or updating the own review.
+    """
+
+    def setUp(self):
+        """
+        Set up the test case.
+        """
+        self.url = reverse('reviews-upsert')
+        self.business_user = User.objects.create_user(
+            username="business",
+            email="business@mail.de",
+            password="password123",
+            type="business"
+        )
+        self.customer_user = User.objects.create_user(
+            username="customer",
+            email="customer@mail.de",
+            password="password123",
+            type="customer"
+        )
+        self.data = {
+            "business_user": self.business_user.id,
+            "rating": 4,
+            "description": "Test description"
+        }
+
+    def test_upsert_creates_review(self):
+        """
+        Test that the first upsert creates the review.
+        """
+        self.client.force_authenticate(user=self.customer_user)
+        response = self.client.put(self.url, self.data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['reviewer'], self.customer_user.id)
+        self.assertEqual(response.data['rating'], 4)
+
+    def test_upsert_updates_review(self):
+        """
+        Test that a second upsert updates the existing review.
+        """
+        self.client.force_authenticate(user=self.customer_user)
+        first = self.client.put(self.url, self.data, format='json')
+        self.data['rating'] = 2
+        response = self.client.put(self.url, self.data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], first.data['id'])
+        self.assertEqual(Review.objects.get().rating, 2)
+
+    def test_upsert_as_business_user(self):
+        """
+        Test that business users cannot write reviews.
+        """
+        self.client.force_authenticate(user=self.business_user)
+        response = self.client.put(self.url, self.data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ReviewsConcurrencyTests(TransactionTestCase):
+    """
+    Test suite for concurrent review requests.
+    """
+
+    def setUp(self):
+        """
+        Set up the test case.
+        """
+        self.business_user = User.objects.create_user(
+            username="business",
+            email="business@mail.de",
+            password="password123",
+            type="business"
+        )
+        self.customer_user = User.objects.create_user(
+            username="customer",
+            email="customer@mail.de",
+            password="password123",
+            type="customer"
+        )
+        self.data = {
+            "business_user": self.business_user.id,
+            "rating": 5,
+            "description": "Test description"
+        }
+
+    def send_concurrently(self, method, url, count=8):
+        """
+        Send the same request from several threads at once and collect the status codes.
+
+        The in-memory SQLite test database fails with "table is locked" instead
+        of waiting for a concurrent writer. Idempotent requests are retried then;
+        a POST is not, because a retry could see its own earlier attempt, so a
+        locked POST is collected as None.
+        """
+        barrier = threading.Barrier(count)
+        status_codes = []
+        attempts = 1 if method == 'post' else 100
+
+        def worker():
+            client = APIClient()
+            client.force_authenticate(user=self.customer_user)
+            barrier.wait()
+            try:
+                for _ in range(attempts):
+                    try:
+                        response = getattr(client, method)(
+                            url, self.data, format='json')
+                    except OperationalError:
+                        time.sleep(0.01)
+                        continue
+                    status_codes.append(response.status_code)
+                    break
+                else:
+                    status_codes.append(None)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return status_codes
+
+    def test_concurrent_posts_create_one_review(self):
+        """
+        Test that concurrent posts of the same review create it at most once.
+        """
+        status_codes = self.send_concurrently('post', reverse('reviews-list'))
+        self.assertEqual(len(status_codes), 8)
+        self.assertTrue(all(code in [status.HTTP_201_CREATED, status.HTTP_403_FORBIDDEN, None]
+                            for code in status_codes))
+        self.assertLessEqual(status_codes.count(status.HTTP_201_CREATED), 1)
+        # A post can hit the lock after its review was committed.
+        self.assertLessEqual(status_codes.count(status.HTTP_201_CREATED),
+                             Review.objects.count())
+        self.assertLessEqual(Review.objects.count(), 1)
+
+        # Every post may have hit a lock; a later post still sees the one review.
+        expected = status.HTTP_403_FORBIDDEN if Review.objects.exists() else status.HTTP_201_CREATED
+        client = APIClient()
+        client.force_authenticate(user=self.customer_user)
+        response = client.post(reverse('reviews-list'), self.data, format='json')
+        self.assertEqual(response.status_code, expected)
+        self.assertEqual(Review.objects.count(), 1)
+
+    def test_concurrent_upserts_create_one_review(self):
+        """
+        Test that concurrent upserts of the same review create it only once.
+        """
+        status_codes = self.send_concurrently('put', reverse('reviews-upsert'))
+        self.assertEqual(len(status_codes), 8)
+        self.assertTrue(all(code in [status.HTTP_200_OK, status.HTTP_201_CREATED]
+                            for code in status_codes))
+        self.assertEqual(Review.objects.count(), 1)
 
 
 class ReviewsPatchDeleteTests(APITestCase):
@@ -4,6 +4,8 @@ from reviews_app.api import views
 
 urlpatterns = [
     path('reviews/', views.ReviewListCreateView.as_view(), name='reviews-list'),
+    path('reviews/mine/', views.ReviewUpsertView.as_view(),
+         name='reviews-upsert'),
     path('reviews/<int:pk>/', views.ReviewUpdateDeleteView.as_view(),
          name='reviews-detail'),
     path('base-info/', views.BaseInfoView.as_view(), name='base-info')
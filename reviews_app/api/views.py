@@ -1,23 +1,28 @@
 from django.contrib.auth import get_user_model
 from django.db.models import Avg
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import generics, filters
+from rest_framework import generics, filters, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.views import APIView
 
+from core.serializers import ExpandableFieldsViewMixin, SparseFieldsetViewMixin
+from core.views import SingleFlightMixin
 from offers_app.models import Offer
 from reviews_app.api.permissions import IsCustomer, IsReviewer
 from reviews_app.api.serializers import ReviewListSerializer, ReviewDetailSerializer
 from reviews_app.models import Review
+from sync_app.views import DeltaSyncMixin
 from users_app.models import Profile
 
 User = get_user_model()
 
 
-class ReviewListCreateView(generics.ListCreateAPIView):
+class ReviewListCreateView(DeltaSyncMixin, ExpandableFieldsViewMixin, SparseFieldsetViewMixin, generics.ListCreateAPIView):
     """
     View to list and create reviews.
+
+    Supports delta syncs with ?updated_since= (see DeltaSyncMixin).
     """
     queryset = Review.objects.all()
     serializer_class = ReviewListSerializer
@@ -25,6 +30,7 @@ class ReviewListCreateView(generics.ListCreateAPIView):
     filter_backends = [filters.OrderingFilter, DjangoFilterBackend]
     filterset_fields = ['business_user_id', 'reviewer_id']
     ordering_fields = ['updated_at', 'rating']
+    sync_resource = 'review'
 
     def perform_create(self, serializer):
         serializer.save(reviewer=self.request.user)
@@ -35,6 +41,22 @@ class ReviewListCreateView(generics.ListCreateAPIView):
         return [IsAuthenticated()]
 
 
+class ReviewUpsertView(generics.GenericAPIView):
+    """
+    View to create the own review of a business or update it if it already exists.
+    """
+    serializer_class = ReviewListSerializer
+    permission_classes = [IsCustomer, IsAuthenticated]
+
+    def put(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        _, created = serializer.upsert()
+        return Response(
+            serializer.data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+
+
 class ReviewUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
     """
     View to update and delete reviews.
@@ -45,13 +67,18 @@ class ReviewUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
     http_method_names = ['patch', 'delete', 'options', 'head']
 
 
-class BaseInfoView(APIView):
+class BaseInfoView(SingleFlightMixin, APIView):
     """
     View to retrieve base information.
+
+    Identical concurrent GETs share one response (see SingleFlightMixin).
     """
     permission_classes = [AllowAny]
 
     def get(self, request, format=None):
+        return self.single_flight(request, self.get_base_info)
+
+    def get_base_info(self, request):
         avg = Review.objects.aggregate(Avg('rating'))['rating__avg']
         average_rating = round(avg, 1) if avg is not None else None
         data = {
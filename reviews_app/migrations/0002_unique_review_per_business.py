@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-19 10:50
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def remove_duplicate_reviews(apps, schema_editor):
+    """
+    Keep only the most recent review of each reviewer per business user.
+    """
+    Review = apps.get_model('reviews_app', 'Review')
+    reviews = Review.objects.using(schema_editor.connection.alias)
+    duplicates = reviews.values('business_user', 'reviewer').annotate(
+        count=Count('id'), latest=Max('id')).filter(count__gt=1)
+    for duplicate in duplicates:
+        reviews.filter(
+            business_user=duplicate['business_user'],
+            reviewer=duplicate['reviewer']
+        ).exclude(pk=duplicate['latest']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews_app', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_reviews,
+                             migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='review',
+            constraint=models.UniqueConstraint(fields=('business_user', 'reviewer'), name='unique_review_per_business'),
+        ),
+    ]
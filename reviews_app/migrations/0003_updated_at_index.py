@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews_app', '0002_unique_review_per_business'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['updated_at', 'id'], name='review_updated_idx'),
+        ),
+    ]
@@ -2,10 +2,12 @@ from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
 
+from events_app.models import OutboxModel
+
 User = get_user_model()
 
 
-class Review(models.Model):
+class Review(OutboxModel):
     """
     Model representing a review left by a customer for a business user.
 
@@ -27,5 +29,24 @@ class Review(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    outbox_aggregate = 'review'
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['business_user', 'reviewer'], name='unique_review_per_business'),
+        ]
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='review_updated_idx'),
+        ]
+
     def __str__(self):
         return f"Review by {self.reviewer.username} for {self.business_user.username}: {self.rating} stars"
+
+    def get_outbox_payload(self):
+        return {
+            'id': self.pk,
+            'business_user_id': self.business_user_id,
+            'reviewer_id': self.reviewer_id,
+            'rating': self.rating,
+        }
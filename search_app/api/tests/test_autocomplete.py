@@ -0,0 +1,178 @@
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from events_app.models import OutboxEvent
+from offers_app.models import Offer
+from search_app.autocomplete import (
+    add_business, add_offer, get_autocomplete_index, reset_autocomplete_index)
+from search_app.index import KEY_LENGTH, PrefixIndex
+from users_app.models import Profile
+
+User = get_user_model()
+
+
+@override_settings(AUTOCOMPLETE_REFRESH_INTERVAL=0)
+class AutocompleteTests(APITestCase):
+    """
+    Test cases for the autocomplete endpoint and its incremental updates.
+    """
+
+    def setUp(self):
+        reset_autocomplete_index()
+        self.addCleanup(reset_autocomplete_index)
+        self.url = reverse('autocomplete')
+        self.business_user = self.create_business('pixelstudio', 'Anna', 'Logan')
+        self.logo_offer = self.create_offer('Professional logo design', 0.9)
+        self.cheap_offer = self.create_offer('Cheap logo', 0.2)
+        self.web_offer = self.create_offer('Website design', 0.5)
+
+    def create_business(self, username, first_name='', last_name=''):
+        user = User.objects.create_user(
+            username=username, email=f'{username}@mail.de',
+            password='password123', type='business')
+        Profile.objects.create(
+            user=user, first_name=first_name, last_name=last_name)
+        return user
+
+    def create_offer(self, title, rank):
+        return Offer.objects.create(
+            user=self.business_user, title=title, description=title, rank=rank)
+
+    def suggest(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [(item['type'], item['label']) for item in response.data]
+
+    def test_matches_word_prefixes_by_popularity(self):
+        self.assertEqual(self.suggest(q='LO'), [
+            ('business', 'Anna Logan'),
+            ('offer', 'Professional logo design'),
+            ('offer', 'Cheap logo'),
+        ])
+        self.assertEqual(self.suggest(q='design'), [
+            ('offer', 'Professional logo design'),
+            ('offer', 'Website design'),
+        ])
+        self.assertEqual(self.suggest(q='logo d'), [
+            ('offer', 'Professional logo design')])
+        self.assertEqual(self.suggest(q='esign'), [])
+        self.assertEqual(self.suggest(q=''), [])
+
+    def test_business_matches_username(self):
+        response = self.client.get(self.url, {'q': 'pixel'})
+        self.assertEqual(response.data, [
+            {'type': 'business', 'id': self.business_user.id, 'label': 'Anna Logan'}])
+
+    def test_type_and_limit(self):
+        self.assertEqual(self.suggest(q='lo', type='offer', limit=1), [
+            ('offer', 'Professional logo design')])
+        self.assertEqual(self.suggest(q='lo', type='business'), [
+            ('business', 'Anna Logan')])
+        response = self.client.get(self.url, {'q': 'lo', 'type': 'user'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {'q': 'lo', 'limit': 'many'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_follows_changes_incrementally(self):
+        self.suggest(q='lo')
+        index = get_autocomplete_index()
+
+        new_offer = self.create_offer('Logo animation', 0.95)
+        self.assertEqual(self.suggest(q='logo', limit=1), [
+            ('offer', 'Logo animation')])
+
+        new_offer.title = 'Intro animation'
+        new_offer.save()
+        self.assertEqual(self.suggest(q='anim'), [('offer', 'Intro animation')])
+        self.assertNotIn(('offer', 'Intro animation'), self.suggest(q='logo'))
+
+        new_offer.delete()
+        self.assertEqual(self.suggest(q='anim'), [])
+
+        profile = self.business_user.profile
+        profile.first_name = 'Berta'
+        profile.save()
+        self.assertEqual(self.suggest(q='berta'), [('business', 'Berta Logan')])
+        self.assertEqual(self.suggest(q='anna'), [])
+
+        other = self.create_business('logoworks')
+        self.assertIn(('business', 'logoworks'), self.suggest(q='logow'))
+        other.delete()
+        self.assertEqual(self.suggest(q='logow'), [])
+        self.assertIs(get_autocomplete_index(), index)
+
+    def test_applies_events_committed_out_of_order(self):
+        self.suggest(q='lo')
+        late = self.create_offer('Logo animation', 0.95)
+        late_event = OutboxEvent.objects.get(aggregate_type='offer', aggregate_id=late.id)
+        late_event_id = late_event.id
+        late_event.delete()
+        self.create_offer('Video editing', 0.1)
+        self.assertEqual(self.suggest(q='video'), [('offer', 'Video editing')])
+        self.assertEqual(self.suggest(q='anim'), [])
+
+        late_event.id = late_event_id
+        late_event.save()
+        self.assertEqual(self.suggest(q='anim'), [('offer', 'Logo animation')])
+
+    def test_memory_budget_keeps_most_popular(self):
+        index = PrefixIndex(10 ** 9)
+        add_business(index, self.business_user.id, 'Anna Logan', 'pixelstudio', 0.9)
+        add_offer(index, self.logo_offer.id, 'Professional logo design', 0.9)
+        with override_settings(AUTOCOMPLETE_MEMORY_BUDGET=index.size):
+            reset_autocomplete_index()
+            index = get_autocomplete_index()
+        self.assertEqual(len(index), 2)
+        self.assertGreater(index.evicted, 0)
+        self.assertEqual(self.suggest(q='lo'), [
+            ('business', 'Anna Logan'),
+            ('offer', 'Professional logo design'),
+        ])
+
+
+class PrefixIndexTests(SimpleTestCase):
+    """
+    Test cases for the in-memory prefix index.
+    """
+
+    def test_long_queries_are_checked_against_the_text(self):
+        index = PrefixIndex(10 ** 6)
+        base = 'a' * KEY_LENGTH
+        index.add('offer', 1, base + ' one', 1)
+        index.add('offer', 2, base + ' two', 2)
+        self.assertEqual(
+            [item['id'] for item in index.search(base)], [2, 1])
+        self.assertEqual(
+            [item['id'] for item in index.search(base + ' o')], [1])
+
+    def test_replace_and_evict(self):
+        index = PrefixIndex(10 ** 6)
+        index.add('offer', 1, 'Logo', 1)
+        index.add('offer', 1, 'Video', 1)
+        self.assertEqual(index.search('logo'), [])
+        self.assertEqual(len(index), 1)
+
+        index.memory_budget = index.size * 2
+        self.assertTrue(index.add('offer', 2, 'Audio', 2))
+        self.assertTrue(index.add('offer', 3, 'Photo', 3))
+        self.assertFalse(index.add('offer', 4, 'Radio', 0))
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.search('video'), [])
+        self.assertEqual([item['id'] for item in index.search('photo')], [3])
+        index.remove('offer', 3)
+        self.assertEqual(index.size, index.memory_budget // 2)
+
+    def test_evicts_by_current_popularity(self):
+        index = PrefixIndex(10 ** 6)
+        index.add('offer', 1, 'Logo', 1)
+        index.add('offer', 2, 'Icon', 2)
+        index.add('offer', 1, 'Logo', 5)
+        index.memory_budget = index.size
+        self.assertTrue(index.add('offer', 3, 'Menu', 3))
+        self.assertEqual(index.search('icon'), [])
+        self.assertEqual([item['id'] for item in index.search('logo')], [1])
+        self.assertFalse(index.add('offer', 4, 'Font', 2))
+        self.assertEqual(len(index), 2)
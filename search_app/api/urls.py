@@ -0,0 +1,7 @@
+from django.urls import path
+
+from search_app.api import views
+
+urlpatterns = [
+    path('autocomplete/', views.AutocompleteView.as_view(), name='autocomplete'),
+]
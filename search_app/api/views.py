@@ -0,0 +1,27 @@
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from search_app.autocomplete import KINDS, autocomplete
+
+
+class AutocompleteView(APIView):
+    """
+    View to suggest offers and businesses while typing, e.g. ?q=log&limit=5.
+
+    Suggestions come from an in-memory prefix index and can be limited to one
+    kind with ?type=offer or ?type=business.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, format=None):
+        try:
+            limit = max(int(request.query_params.get('limit', 10)), 1)
+        except ValueError:
+            raise ValidationError({'limit': ["A valid integer is required."]})
+        kind = request.query_params.get('type') or None
+        if kind is not None and kind not in KINDS:
+            raise ValidationError(
+                {'type': [f"Choose one of: {', '.join(KINDS)}."]})
+        return Response(autocomplete(request.query_params.get('q', ''), limit, kind))
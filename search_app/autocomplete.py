@@ -0,0 +1,192 @@
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db.models import Max, Value
+from django.db.models.functions import Coalesce
+
+from events_app.models import OutboxEvent
+from events_app.tailing import OutboxPosition
+from offers_app.models import Offer
+from search_app.index import PrefixIndex
+from users_app.models import Profile
+
+logger = logging.getLogger(__name__)
+
+MAX_RESULTS = 20
+TAIL_BATCH_SIZE = 1000
+KINDS = ['offer', 'business']
+AGGREGATES = ['offer', 'profile']
+
+_lock = threading.Lock()
+_state = {'index': None, 'position': None, 'built_at': 0.0, 'refreshed_at': 0.0}
+
+
+def load_offers(ids=None):
+    """
+    Get (id, title, rank) of the given offers, or of all offers.
+    """
+    offers = Offer.objects.all()
+    if ids is not None:
+        offers = offers.filter(pk__in=ids)
+    return offers.values_list('id', 'title', 'rank')
+
+
+def load_businesses(user_ids=None):
+    """
+    Get (user_id, name, username, popularity) of the given business users, or of all.
+
+    The name is the full name of the profile. The popularity of a business is
+    the rank of its best offer.
+    """
+    profiles = Profile.objects.filter(user__type='business')
+    if user_ids is not None:
+        profiles = profiles.filter(user_id__in=user_ids)
+    profiles = profiles.annotate(
+        popularity=Coalesce(Max('user__offers__rank'), Value(0.0)))
+    for user_id, username, first_name, last_name, popularity in profiles.values_list(
+            'user_id', 'user__username', 'first_name', 'last_name', 'popularity'):
+        yield user_id, f'{first_name} {last_name}'.strip(), username, popularity
+
+
+def add_offer(index, offer_id, title, rank):
+    return index.add('offer', offer_id, title, rank)
+
+
+def add_business(index, user_id, name, username, popularity):
+    return index.add('business', user_id, name or username, popularity, aliases=[username])
+
+
+def build_index():
+    """
+    Build a new index over all offer titles and business names.
+
+    Entries are added most popular first, and adding stops at the first one
+    that does not fit into the memory budget, so the least popular ones are
+    left out. The top lists of short prefixes are
+    computed up front. Returns the index and the ID of the
+    last outbox event it includes.
+    """
+    last_event_id = OutboxEvent.objects.aggregate(last=Max('id'))['last'] or 0
+    index = PrefixIndex(settings.AUTOCOMPLETE_MEMORY_BUDGET, MAX_RESULTS)
+    rows = [(rank, add_offer, (offer_id, title, rank))
+            for offer_id, title, rank in load_offers()]
+    rows.extend((row[3], add_business, row) for row in load_businesses())
+    rows.sort(key=lambda row: row[0], reverse=True)
+    with index.bulk():
+        for position, (_, add, args) in enumerate(rows):
+            evicted = index.evicted
+            if not add(index, *args) and index.evicted > evicted:
+                index.evicted += len(rows) - position - 1
+                break
+    index.prime(kinds=KINDS)
+    logger.info("Built autocomplete index with %d entries (%d bytes, %d left out)",
+                len(index), index.size, index.evicted)
+    return index, last_event_id
+
+
+def apply_events(index, events):
+    """
+    Update the index for the given outbox events of offers and profiles.
+
+    The changed offers and businesses are loaded again, so applying an event
+    twice is harmless. Offers and businesses that no longer exist are removed.
+    """
+    offer_ids = set()
+    user_ids = set()
+    for aggregate_type, aggregate_id, payload in events:
+        if aggregate_type == 'offer':
+            offer_ids.add(aggregate_id)
+        if payload.get('user_id') is not None:
+            user_ids.add(payload['user_id'])
+    if offer_ids:
+        found = set()
+        for offer_id, title, rank in load_offers(offer_ids):
+            add_offer(index, offer_id, title, rank)
+            found.add(offer_id)
+        for offer_id in offer_ids - found:
+            index.remove('offer', offer_id)
+    if user_ids:
+        found = set()
+        for row in load_businesses(user_ids):
+            add_business(index, *row)
+            found.add(row[0])
+        for user_id in user_ids - found:
+            index.remove('business', user_id)
+
+
+def tail_outbox(index, position):
+    """
+    Apply the offer and profile events not read yet at the outbox position.
+
+    Events of all aggregates move the position, so their IDs are not taken for
+    events that commit late. Returns False if too many events are pending and
+    the index should be rebuilt instead.
+    """
+    pending = list(OutboxEvent.objects.filter(position.pending()).order_by(
+        'id').values_list('id', 'aggregate_type')[:TAIL_BATCH_SIZE + 1])
+    if len(pending) > TAIL_BATCH_SIZE:
+        return False
+    event_ids = [event_id for event_id, aggregate_type in pending
+                 if aggregate_type in AGGREGATES]
+    if event_ids:
+        apply_events(index, OutboxEvent.objects.filter(id__in=event_ids).order_by(
+            'id').values_list('aggregate_type', 'aggregate_id', 'payload'))
+    position.advance([event_id for event_id, _ in pending])
+    return True
+
+
+def get_autocomplete_index():
+    """
+    Get the autocomplete index of this process, brought up to date first.
+
+    The index is built on first use and rebuilt every
+    AUTOCOMPLETE_REBUILD_INTERVAL seconds, which also picks up rank changes
+    that are written without outbox events. In between, the outbox is tailed
+    at most every AUTOCOMPLETE_REFRESH_INTERVAL seconds. Events that commit
+    out of ID order are applied if they show up within
+    AUTOCOMPLETE_GAP_TIMEOUT seconds, later ones with the next rebuild. Only
+    one thread updates the index at a time; other threads keep using the
+    current one.
+    """
+    now = time.monotonic()
+    index = _state['index']
+    rebuild = index is None or now - \
+        _state['built_at'] >= settings.AUTOCOMPLETE_REBUILD_INTERVAL
+    refresh = now - _state['refreshed_at'] >= settings.AUTOCOMPLETE_REFRESH_INTERVAL
+    if not (rebuild or refresh):
+        return index
+    if not _lock.acquire(blocking=index is None):
+        return index
+    try:
+        index = _state['index']
+        if index is None or rebuild or not tail_outbox(index, _state['position']):
+            index, last_event_id = build_index()
+            _state.update(
+                index=index, built_at=time.monotonic(),
+                position=OutboxPosition(last_event_id, settings.AUTOCOMPLETE_GAP_TIMEOUT))
+        _state.update(refreshed_at=time.monotonic())
+        return index
+    finally:
+        _lock.release()
+
+
+def reset_autocomplete_index():
+    """
+    Drop the index of this process, so the next lookup builds it again.
+    """
+    with _lock:
+        _state.update(index=None, position=None,
+                      built_at=0.0, refreshed_at=0.0)
+
+
+def autocomplete(prefix, limit=10, kind=None):
+    """
+    Get the most popular offers and businesses matching the prefix.
+
+    A prefix matches the start of any word in an offer title, a business
+    name or a business username.
+    """
+    index = get_autocomplete_index()
+    return index.search(prefix, limit, kind)
@@ -0,0 +1,259 @@
+import heapq
+import sys
+import threading
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+
+KEY_LENGTH = 32
+MAX_KEYS_PER_TEXT = 8
+PRIME_LENGTH = 2
+MAX_CACHED_PREFIXES = 10000
+# Estimated bytes of an entry and of a key besides their strings.
+ENTRY_OVERHEAD = 240
+KEY_OVERHEAD = 120
+
+
+def normalize(text):
+    """
+    Lowercase the text and collapse whitespace, e.g. ' Logo  Design' -> 'logo design'.
+    """
+    return ' '.join((text or '').lower().split())
+
+
+def get_keys(normalized):
+    """
+    Get the index keys of a normalized text: the text from each word onwards.
+
+    This lets a query match the start of any word, e.g. 'des' matches
+    'logo design'. Keys are cut to KEY_LENGTH characters and only the first
+    MAX_KEYS_PER_TEXT words start a key.
+    """
+    keys = set()
+    start = 0
+    for _ in range(MAX_KEYS_PER_TEXT):
+        keys.add(normalized[start:start + KEY_LENGTH])
+        start = normalized.find(' ', start) + 1
+        if not start:
+            break
+    return keys
+
+
+def sort_key(entry):
+    return (-entry.popularity, entry.label, entry.kind, entry.id)
+
+
+class Entry:
+    __slots__ = ('kind', 'id', 'label', 'texts', 'popularity', 'keys', 'size')
+
+    def __init__(self, kind, id, label, texts, popularity, keys, size):
+        self.kind = kind
+        self.id = id
+        self.label = label
+        self.texts = texts
+        self.popularity = popularity
+        self.keys = keys
+        self.size = size
+
+    def as_dict(self):
+        return {'type': self.kind, 'id': self.id, 'label': self.label}
+
+
+class PrefixIndex:
+    """
+    In-memory prefix index over short texts, ranked by popularity.
+
+    Keys are kept in a sorted list, so the entries matching a prefix are found
+    with a binary search followed by a scan over the matching range. The best
+    max_results entries of each looked up prefix are kept and updated as entries
+    are added, so popular short prefixes do not scan their whole range again.
+    Prefixes up to PRIME_LENGTH characters are computed up front by prime().
+    The estimated size of the index is kept within memory_budget bytes by
+    leaving out the least popular entries, found with a heap of (popularity,
+    kind, id) whose outdated items are skipped when they reach the top.
+    """
+
+    def __init__(self, memory_budget, max_results=20):
+        self.memory_budget = memory_budget
+        self.max_results = max_results
+        self.size = 0
+        self.evicted = 0
+        self._entries = {}
+        self._keys = []
+        self._tops = {}
+        self._heap = []
+        self._bulk = False
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @contextmanager
+    def bulk(self):
+        """
+        Add many entries at once, sorting the keys only once at the end.
+        """
+        with self._lock:
+            self._bulk = True
+            try:
+                yield self
+            finally:
+                self._bulk = False
+                self._keys.sort()
+                self._tops.clear()
+
+    def add(self, kind, id, label, popularity, aliases=()):
+        """
+        Add or replace an entry, matched by its label and aliases.
+
+        Returns False if the entry does not fit into the memory budget, because
+        all other entries are at least as popular.
+        """
+        texts = []
+        for text in [label, *aliases]:
+            normalized = normalize(text)
+            if normalized and normalized not in texts:
+                texts.append(normalized)
+        with self._lock:
+            self.remove(kind, id)
+            if not texts:
+                return False
+            keys = set().union(*(get_keys(text) for text in texts))
+            size = (ENTRY_OVERHEAD + sys.getsizeof(label)
+                    + sum(sys.getsizeof(text) for text in texts)
+                    + sum(sys.getsizeof(key) + KEY_OVERHEAD for key in keys))
+            if not self._make_room(size, popularity):
+                self.evicted += 1
+                return False
+            entry = Entry(kind, id, label, texts, popularity, keys, size)
+            self._entries[(kind, id)] = entry
+            for key in keys:
+                if self._bulk:
+                    self._keys.append((key, kind, id))
+                else:
+                    insort(self._keys, (key, kind, id))
+            self.size += size
+            heapq.heappush(self._heap, (popularity, kind, id))
+            if len(self._heap) > 2 * len(self._entries) + 64:
+                self._heap = [(item.popularity, item.kind, item.id)
+                              for item in self._entries.values()]
+                heapq.heapify(self._heap)
+            for top_key in self._cached_prefixes(entry):
+                self._add_to_top(top_key, entry)
+            return True
+
+    def remove(self, kind, id):
+        with self._lock:
+            entry = self._entries.pop((kind, id), None)
+            if entry is None:
+                return False
+            for key in entry.keys:
+                position = bisect_left(self._keys, (key, kind, id))
+                del self._keys[position]
+            self.size -= entry.size
+            for top_key in self._cached_prefixes(entry):
+                if any(item is entry for item in self._tops[top_key]):
+                    del self._tops[top_key]
+            return True
+
+    def _make_room(self, size, popularity):
+        """
+        Evict entries less popular than the given one until size bytes fit.
+        """
+        while self.size + size > self.memory_budget:
+            lowest = self._least_popular()
+            if lowest is None or lowest.popularity >= popularity:
+                return False
+            self.remove(lowest.kind, lowest.id)
+            self.evicted += 1
+        return True
+
+    def _least_popular(self):
+        """
+        Get the least popular entry, dropping heap items of removed or replaced entries.
+        """
+        while self._heap:
+            popularity, kind, id = self._heap[0]
+            entry = self._entries.get((kind, id))
+            if entry is not None and entry.popularity == popularity:
+                return entry
+            heapq.heappop(self._heap)
+        return None
+
+    def _cached_prefixes(self, entry):
+        """
+        Get the keys of the kept top lists that the entry belongs to.
+        """
+        if not self._tops:
+            return []
+        found = set()
+        for key in entry.keys:
+            for length in range(1, len(key) + 1):
+                for kind in (None, entry.kind):
+                    top_key = (key[:length], kind)
+                    if top_key in self._tops:
+                        found.add(top_key)
+        return found
+
+    def _add_to_top(self, top_key, entry):
+        top = self._tops[top_key]
+        if len(top) < self.max_results or sort_key(entry) < sort_key(top[-1]):
+            insort(top, entry, key=sort_key)
+            del top[self.max_results:]
+
+    def _scan(self, probe, kind=None):
+        """
+        Get the entries with a key starting with probe.
+        """
+        matches = set()
+        position = bisect_left(self._keys, (probe,))
+        while position < len(self._keys):
+            key, entry_kind, entry_id = self._keys[position]
+            if not key.startswith(probe):
+                break
+            if kind is None or entry_kind == kind:
+                matches.add((entry_kind, entry_id))
+            position += 1
+        return [self._entries[match] for match in matches]
+
+    def _get_top(self, prefix, kind):
+        top_key = (prefix, kind)
+        top = self._tops.get(top_key)
+        if top is None:
+            top = heapq.nsmallest(
+                self.max_results, self._scan(prefix, kind), key=sort_key)
+            if len(self._tops) >= MAX_CACHED_PREFIXES:
+                self._tops.clear()
+            self._tops[top_key] = top
+        return top
+
+    def prime(self, length=PRIME_LENGTH, kinds=()):
+        """
+        Compute the top lists of all prefixes up to length characters.
+        """
+        with self._lock:
+            prefixes = {key[:size] for key, _, _ in self._keys
+                        for size in range(1, length + 1)}
+            for prefix in sorted(prefixes):
+                for kind in (None, *kinds):
+                    self._get_top(prefix, kind)
+
+    def search(self, prefix, limit=10, kind=None):
+        """
+        Get the most popular entries with a word starting with prefix.
+
+        Ties are ordered by label. Returns at most max_results dicts with type,
+        id and label.
+        """
+        query = normalize(prefix)
+        if not query or limit < 1:
+            return []
+        limit = min(limit, self.max_results)
+        with self._lock:
+            if len(query) <= KEY_LENGTH:
+                entries = self._get_top(query, kind)[:limit]
+            else:
+                entries = heapq.nsmallest(limit, [
+                    entry for entry in self._scan(query[:KEY_LENGTH], kind)
+                    if any((' ' + text).find(' ' + query) != -1 for text in entry.texts)
+                ], key=sort_key)
+            return [entry.as_dict() for entry in entries]
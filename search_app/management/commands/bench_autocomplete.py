@@ -0,0 +1,64 @@
+import random
+import statistics
+import string
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from offers_app.models import Offer
+from search_app.autocomplete import build_index
+
+User = get_user_model()
+
+WORDS = ['logo', 'website', 'design', 'video', 'audio', 'brand', 'landing',
+         'page', 'illustration', 'animation', 'podcast', 'editing']
+
+
+class Command(BaseCommand):
+    """
+    Measure building the autocomplete index and the latency of lookups.
+
+    Test data is created inside a transaction that is rolled back afterwards.
+    """
+    help = 'Benchmark the autocomplete index.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--offers', type=int, default=20000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.create_offers(options['offers'])
+            start = time.perf_counter()
+            index, _ = build_index()
+            elapsed = time.perf_counter() - start
+            self.stdout.write(
+                f"Built {len(index)} entries in {elapsed * 1000:.1f} ms, "
+                f"about {index.size / 1024 / 1024:.1f} MB")
+            transaction.set_rollback(True)
+        prefixes = [a + b for a in string.ascii_lowercase for b in 'aeiou']
+        prefixes += [word[:length] for word in WORDS for length in range(3, 6)]
+        prefixes = list(dict.fromkeys(prefixes))
+        for label in ['first lookup', 'repeated lookup']:
+            timings = []
+            for prefix in prefixes:
+                start = time.perf_counter()
+                index.search(prefix, 10)
+                timings.append(time.perf_counter() - start)
+            timings.sort()
+            self.stdout.write(
+                f"{label} of {len(timings)} prefixes: "
+                f"median {statistics.median(timings) * 1000:.3f} ms, "
+                f"p95 {timings[int(len(timings) * 0.95)] * 1000:.3f} ms, "
+                f"max {timings[-1] * 1000:.3f} ms")
+
+    def create_offers(self, count):
+        generator = random.Random(0)
+        user = User.objects.create(
+            username='bench_business', email='bench_business@mail.de', type='business')
+        Offer.objects.bulk_create([
+            Offer(user=user, title=' '.join(generator.sample(WORDS, 3)) + f' {index}',
+                  description='Benchmark', rank=generator.random())
+            for index in range(count)
+        ], batch_size=1000)
@@ -0,0 +1,14 @@
+from django.contrib import admin
+
+from sync_app.models import Tombstone
+
+
+class TombstoneAdmin(admin.ModelAdmin):
+    """
+    Admin interface for the Tombstone model.
+    """
+    list_display = ('id', 'resource', 'object_id', 'deleted_at')
+    list_filter = ('resource',)
+
+
+admin.site.register(Tombstone, TombstoneAdmin)
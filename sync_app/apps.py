@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class SyncAppConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'sync_app'
+
+    def ready(self):
+        """
+        Connect the delete signal that records tombstones.
+        """
+        from sync_app import signals  # noqa: F401
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:42
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resource', models.CharField(max_length=50)),
+                ('object_id', models.BigIntegerField()),
+                ('customer_user_id', models.BigIntegerField(blank=True, null=True)),
+                ('business_user_id', models.BigIntegerField(blank=True, null=True)),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['resource', 'deleted_at', 'id'], name='tombstone_feed_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Tombstone(models.Model):
+    """
+    Model recording the deletion of a synced object for the delta sync feeds.
+
+    Written in the same transaction as the delete, so clients that sync with
+    ?updated_since= learn which objects to drop. The user IDs are kept as plain
+    numbers, so tombstones survive the deletion of the users.
+
+    Fields:
+        - resource: Kind of the deleted object (e.g., offer, order, review).
+        - object_id: Primary key of the deleted object.
+        - customer_user_id: Customer or reviewer of the object, if any.
+        - business_user_id: Business user of the object, if any.
+        - deleted_at: Timestamp when the object was deleted.
+    """
+    resource = models.CharField(max_length=50)
+    object_id = models.BigIntegerField()
+    customer_user_id = models.BigIntegerField(null=True, blank=True)
+    business_user_id = models.BigIntegerField(null=True, blank=True)
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['resource', 'deleted_at', 'id'],
+                         name='tombstone_feed_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.resource} {self.object_id} deleted at {self.deleted_at}"
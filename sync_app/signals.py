@@ -0,0 +1,31 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from sync_app.models import Tombstone
+
+# Resource name and the (customer, business) user fields of each synced model.
+TRACKED_MODELS = {
+    'offers_app.offer': ('offer', None, 'user_id'),
+    'orders_app.order': ('order', 'customer_user_id', 'business_user_id'),
+    'reviews_app.review': ('review', 'reviewer_id', 'business_user_id'),
+}
+
+
+@receiver(post_delete)
+def record_tombstone(sender, instance, using, **kwargs):
+    """
+    Record a tombstone for deleted objects of the synced models.
+
+    Like the outbox events, it is written inside the transaction of the
+    deletion collector, cascades included.
+    """
+    tracked = TRACKED_MODELS.get(sender._meta.label_lower)
+    if tracked is None:
+        return
+    resource, customer_field, business_field = tracked
+    Tombstone.objects.using(using).create(
+        resource=resource,
+        object_id=instance.pk,
+        customer_user_id=getattr(instance, customer_field) if customer_field else None,
+        business_user_id=getattr(instance, business_field) if business_field else None,
+    )
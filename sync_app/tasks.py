@@ -0,0 +1,18 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from sync_app.models import Tombstone
+from tasks_app.registry import task
+
+
+@task(run_every=timedelta(days=1))
+def prune_tombstones():
+    """
+    Delete tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS.
+
+    Feeds reject positions before that window, so no client still needs them.
+    """
+    cutoff = timezone.now() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    Tombstone.objects.filter(deleted_at__lt=cutoff).delete()
@@ -0,0 +1,186 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_app.models import Offer
+from offers_app.testing import create_offer
+from orders_app.models import Order
+from reviews_app.models import Review
+from sync_app.models import Tombstone
+from sync_app.tasks import prune_tombstones
+from sync_app.views import decode_cursor
+
+User = get_user_model()
+
+
+@override_settings(SYNC_SETTLE_SECONDS=0)
+class DeltaSyncTests(APITestCase):
+    """
+    Test cases for the delta sync feeds of offers, orders and reviews.
+    """
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(
+            username='business', email='business@mail.de',
+            password='password123', type='business')
+        self.customer_user = User.objects.create_user(
+            username='customer', email='customer@mail.de',
+            password='password123', type='customer')
+        self.other_customer = User.objects.create_user(
+            username='other', email='other@mail.de',
+            password='password123', type='customer')
+        self.since = (timezone.now() - timedelta(minutes=1)).isoformat()
+        self.offers = [create_offer(self.business_user, f'Offer {index}')
+                       for index in range(3)]
+
+    def create_order(self, customer):
+        return Order.objects.create(
+            customer_user=customer, business_user=self.business_user,
+            offer=self.offers[0].details.get())
+
+    def sync(self, url_name, **params):
+        response = self.client.get(reverse(url_name), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_offer_changes_and_deletions(self):
+        """
+        Test that the offer feed returns changed offers and the IDs of deleted ones.
+        """
+        data = self.sync('offers-list', updated_since=self.since)
+        self.assertEqual([item['id'] for item in data['results']],
+                         [offer.id for offer in self.offers])
+        self.assertEqual(data['results'][0]['min_price'], 50)
+        self.assertEqual(data['deleted'], [])
+        self.assertFalse(data['has_more'])
+
+        data = self.sync('offers-list', cursor=data['cursor'])
+        self.assertEqual((data['results'], data['deleted']), ([], []))
+
+        self.offers[1].title = 'Changed'
+        self.offers[1].save()
+        deleted_id = self.offers[2].id
+        self.offers[2].delete()
+        data = self.sync('offers-list', cursor=data['cursor'])
+        self.assertEqual([item['title'] for item in data['results']], ['Changed'])
+        self.assertEqual(data['deleted'], [deleted_id])
+
+    def test_pages_with_limit_and_equal_timestamps(self):
+        """
+        Test paging with a limit through changes and deletions sharing a timestamp.
+        """
+        Offer.objects.update(updated_at=timezone.now())
+        deleted_ids = [offer.id for offer in self.offers[:2]]
+        for offer in self.offers[:2]:
+            offer.delete()
+        seen, deleted = [], []
+        params = {'updated_since': self.since, 'limit': 1}
+        while True:
+            data = self.sync('offers-list', **params)
+            seen += [item['id'] for item in data['results']]
+            deleted += data['deleted']
+            params = {'cursor': data['cursor'], 'limit': 1}
+            if not data['has_more']:
+                break
+        self.assertEqual(seen, [self.offers[2].id])
+        self.assertEqual(sorted(deleted), deleted_ids)
+
+    def test_order_feed_only_shows_own_orders_and_deletions(self):
+        """
+        Test that the order feed only returns the user's own orders and deletions.
+        """
+        own = self.create_order(self.customer_user)
+        other = self.create_order(self.other_customer)
+        self.client.force_authenticate(user=self.customer_user)
+        data = self.sync('orders-list', updated_since=self.since)
+        self.assertEqual([item['id'] for item in data['results']], [own.id])
+        self.assertEqual(data['results'][0]['price'], 50)
+
+        own_id, other_id = own.id, other.id
+        own.delete()
+        other.delete()
+        data = self.sync('orders-list', cursor=data['cursor'])
+        self.assertEqual(data['deleted'], [own_id])
+        self.client.force_authenticate(user=self.business_user)
+        data = self.sync('orders-list', updated_since=self.since)
+        self.assertEqual(sorted(data['deleted']), sorted([own_id, other_id]))
+
+    def test_review_feed(self):
+        """
+        Test that the review feed returns changed and deleted reviews.
+        """
+        review = Review.objects.create(
+            business_user=self.business_user, reviewer=self.customer_user,
+            rating=4, description='Good')
+        self.client.force_authenticate(user=self.other_customer)
+        data = self.sync('reviews-list', updated_since=self.since)
+        self.assertEqual([item['id'] for item in data['results']], [review.id])
+        review_id, reviewer_id = review.id, self.customer_user.id
+        self.customer_user.delete()
+        data = self.sync('reviews-list', cursor=data['cursor'])
+        self.assertEqual(data['deleted'], [review_id])
+        tombstone = Tombstone.objects.get(resource='review')
+        self.assertEqual(tombstone.customer_user_id, reviewer_id)
+
+    @override_settings(SYNC_SETTLE_SECONDS=3600)
+    def test_cursor_stays_behind_recent_changes(self):
+        """
+        Test that recent changes are held back and the cursor never passes the horizon.
+        """
+        settled = timezone.now() - timedelta(hours=2)
+        Offer.objects.filter(pk__in=[offer.pk for offer in self.offers[:2]]).update(
+            updated_at=settled)
+        self.offers[2].delete()
+        since = (settled - timedelta(minutes=1)).isoformat()
+        seen = []
+        data = self.sync('offers-list', updated_since=since, limit=1)
+        while True:
+            seen.extend(item['id'] for item in data['results'])
+            self.assertEqual(data['deleted'], [])
+            for timestamp, _ in decode_cursor(data['cursor']):
+                self.assertLessEqual(
+                    timestamp, timezone.now() - timedelta(seconds=3600))
+            if not data['has_more']:
+                break
+            data = self.sync('offers-list', cursor=data['cursor'], limit=1)
+        self.assertEqual(seen, [offer.id for offer in self.offers[:2]])
+        data = self.sync('offers-list', cursor=data['cursor'])
+        self.assertEqual((data['results'], data['deleted']), ([], []))
+
+    def test_invalid_positions(self):
+        """
+        Test that invalid cursors and timestamps are rejected with a 400 status code.
+        """
+        response = self.client.get(reverse('offers-list'), {'cursor': 'nope'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(
+            reverse('offers-list'), {'updated_since': 'yesterday'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(reverse('offers-list'), {
+            'updated_since': (timezone.now() - timedelta(days=31)).isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+    def test_plain_list_is_unchanged(self):
+        """
+        Test that the list without sync parameters is paginated as before.
+        """
+        response = self.client.get(reverse('offers-list'), {'page_size': 10})
+        self.assertEqual(response.data['count'], 3)
+
+    def test_prune_tombstones(self):
+        """
+        Test that tombstones older than the retention are pruned.
+        """
+        old_id, recent_id = self.offers[0].id, self.offers[1].id
+        self.offers[0].delete()
+        self.offers[1].delete()
+        Tombstone.objects.filter(object_id=old_id).update(
+            deleted_at=timezone.now() - timedelta(days=31))
+        prune_tombstones()
+        self.assertEqual(
+            list(Tombstone.objects.values_list('object_id', flat=True)), [recent_id])
@@ -0,0 +1,151 @@
+import base64
+import binascii
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.response import Response
+
+from sync_app.models import Tombstone
+
+SYNC_PARAMS = ['updated_since', 'cursor']
+
+
+class SyncWindowExpired(APIException):
+    """
+    Raised when a client syncs from before the oldest kept tombstone.
+    """
+    status_code = status.HTTP_410_GONE
+    default_detail = 'The sync position is too old. Download the full list again.'
+    default_code = 'sync_window_expired'
+
+
+def encode_cursor(changes, deletions):
+    """
+    Encode the keyset positions of both streams into an opaque cursor.
+    """
+    data = {
+        'u': [changes[0].isoformat(), changes[1]],
+        'd': [deletions[0].isoformat(), deletions[1]],
+    }
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor into the (timestamp, id) positions of changes and deletions.
+    """
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return tuple(
+            (parse_timestamp(data[key][0]), int(data[key][1])) for key in ['u', 'd'])
+    except (ValueError, TypeError, KeyError, IndexError, binascii.Error):
+        raise ValidationError({'cursor': ["Invalid cursor."]})
+
+
+def parse_timestamp(value):
+    timestamp = parse_datetime(value)
+    if timestamp is None:
+        raise ValueError(value)
+    if timezone.is_naive(timestamp):
+        timestamp = timezone.make_aware(timestamp)
+    return timestamp
+
+
+def after(field, position):
+    """
+    Filter rows after a (timestamp, id) position in (field, id) order.
+    """
+    timestamp, pk = position
+    return Q(**{f'{field}__gt': timestamp}) | Q(**{field: timestamp, 'pk__gt': pk})
+
+
+class DeltaSyncMixin:
+    """
+    View mixin that turns a list endpoint into a delta sync feed.
+
+    With ?updated_since=<ISO timestamp> or ?cursor=, GET returns only the
+    objects changed after that position, oldest first, and the IDs of the
+    objects deleted since then:
+
+        {"results": [...], "deleted": [3, 7], "cursor": "...", "has_more": false}
+
+    Pass the returned cursor on the next request. Both streams are read with
+    keyset conditions on indexed (updated_at, id) and (deleted_at, id), so a
+    sync costs O(changes). Deletions ignore the list filters. Only rows older
+    than SYNC_SETTLE_SECONDS are returned, so a cursor never passes rows that
+    are committed late. A row changed again is returned again; clients upsert
+    by ID.
+    """
+    sync_resource = None
+    sync_timestamp_field = 'updated_at'
+
+    def get(self, request, *args, **kwargs):
+        if any(param in request.query_params for param in SYNC_PARAMS):
+            return self.sync(request)
+        return super().get(request, *args, **kwargs)
+
+    def get_tombstones(self):
+        """
+        Get the tombstones visible to the current user. Override to restrict them.
+        """
+        return Tombstone.objects.filter(resource=self.sync_resource)
+
+    def serialize_sync_page(self, queryset):
+        return self.get_serializer(queryset, many=True).data
+
+    def get_sync_positions(self, request):
+        cursor = request.query_params.get('cursor')
+        if cursor:
+            return decode_cursor(cursor)
+        try:
+            since = parse_timestamp(request.query_params['updated_since'])
+        except ValueError:
+            raise ValidationError(
+                {'updated_since': ["Provide an ISO 8601 timestamp."]})
+        return (since, 0), (since, 0)
+
+    def get_sync_limit(self, request):
+        try:
+            limit = int(request.query_params.get(
+                'limit', settings.SYNC_PAGE_SIZE))
+        except ValueError:
+            raise ValidationError({'limit': ["A valid integer is required."]})
+        return min(max(limit, 1), settings.SYNC_MAX_PAGE_SIZE)
+
+    def sync(self, request):
+        change_position, deletion_position = self.get_sync_positions(request)
+        now = timezone.now()
+        retention = timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+        if deletion_position[0] < now - retention:
+            raise SyncWindowExpired()
+        horizon = (now - timedelta(seconds=settings.SYNC_SETTLE_SECONDS), 0)
+        limit = self.get_sync_limit(request)
+        field = self.sync_timestamp_field
+
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            after(field, change_position), **{f'{field}__lt': horizon[0]}
+        ).order_by(field, 'pk')
+        changed = list(queryset.values_list(field, 'pk')[:limit + 1])
+        tombstones = list(self.get_tombstones().filter(
+            after('deleted_at', deletion_position), deleted_at__lt=horizon[0]
+        ).order_by('deleted_at', 'pk').values_list('deleted_at', 'pk', 'object_id')[:limit + 1])
+
+        more_changes = len(changed) > limit
+        more_deletions = len(tombstones) > limit
+        changed, tombstones = changed[:limit], tombstones[:limit]
+        page = queryset.filter(pk__in=[pk for _, pk in changed])
+        return Response({
+            'results': self.serialize_sync_page(page),
+            'deleted': [object_id for _, _, object_id in tombstones],
+            'cursor': encode_cursor(
+                changed[-1] if more_changes else max(change_position, horizon),
+                tombstones[-1][:2] if more_deletions else max(deletion_position, horizon),
+            ),
+            'has_more': more_changes or more_deletions,
+        })
@@ -0,0 +1,16 @@
+from django.contrib import admin
+
+from tasks_app.models import Task
+
+
+class TaskAdmin(admin.ModelAdmin):
+    """
+    Admin interface for the Task model.
+    """
+    list_display = ('id', 'name', 'status', 'attempts',
+                    'run_at', 'created_at', 'updated_at')
+    list_filter = ('status',)
+    search_fields = ('name',)
+
+
+admin.site.register(Task, TaskAdmin)
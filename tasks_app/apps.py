@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class TasksAppConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'tasks_app'
+
+    def ready(self):
+        """
+        Import the tasks module of every installed app so its tasks are registered.
+        """
+        autodiscover_modules('tasks')
@@ -0,0 +1,128 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from tasks_app.models import Task
+
+
+class BaseBackend:
+    """
+    Interface of a task queue backend.
+
+    A backend stores enqueued tasks and hands them out to workers. Backends for
+    external brokers implement the same methods and are selected with the
+    TASKS_BACKEND setting.
+    """
+
+    def enqueue(self, task, args, kwargs, run_at):
+        raise NotImplementedError
+
+    def enqueue_periodic(self, task, now):
+        raise NotImplementedError
+
+    def claim(self, limit):
+        raise NotImplementedError
+
+    def mark_succeeded(self, job):
+        raise NotImplementedError
+
+    def mark_retry(self, job, error, run_at):
+        raise NotImplementedError
+
+    def mark_failed(self, job, error):
+        raise NotImplementedError
+
+
+class ImmediateBackend(BaseBackend):
+    """
+    Backend that runs every task inline when it is enqueued.
+
+    Useful for development and tests; scheduling and retries are ignored.
+    """
+
+    def enqueue(self, task, args, kwargs, run_at):
+        task(*args, **kwargs)
+
+    def enqueue_periodic(self, task, now):
+        pass
+
+    def claim(self, limit):
+        return []
+
+
+class DatabaseBackend(BaseBackend):
+    """
+    Backend storing tasks in the Task table.
+
+    Runs without outside services. Tasks are claimed with a conditional UPDATE on
+    their status, so several workers can share one queue. Tasks left running by a
+    crashed worker are released again after lock_timeout.
+    """
+    lock_timeout = timedelta(minutes=10)
+
+    def enqueue(self, task, args, kwargs, run_at):
+        return Task.objects.create(
+            name=task.name,
+            args=args,
+            kwargs=kwargs,
+            run_at=run_at,
+            max_retries=task.max_retries
+        )
+
+    def enqueue_periodic(self, task, now):
+        """
+        Enqueue a periodic task unless it is pending or ran within its interval.
+        """
+        pending = Task.objects.filter(
+            name=task.name, status__in=['queued', 'running']).exists()
+        recent = Task.objects.filter(
+            name=task.name, updated_at__gt=now - task.run_every).exclude(status='queued').exists()
+        if pending or recent:
+            return None
+        return self.enqueue(task, [], {}, now)
+
+    def claim(self, limit):
+        """
+        Claim up to limit due tasks for the calling worker.
+        """
+        now = timezone.now()
+        Task.objects.filter(
+            status='running', locked_at__lt=now - self.lock_timeout
+        ).update(status='queued', locked_at=None)
+        candidate_ids = Task.objects.filter(
+            status='queued', run_at__lte=now
+        ).order_by('run_at', 'id').values_list('id', flat=True)[:limit]
+        claimed_ids = []
+        for task_id in candidate_ids:
+            claimed = Task.objects.filter(pk=task_id, status='queued').update(
+                status='running',
+                locked_at=now,
+                attempts=F('attempts') + 1,
+                updated_at=now
+            )
+            if claimed:
+                claimed_ids.append(task_id)
+        return list(Task.objects.filter(pk__in=claimed_ids).order_by('run_at', 'id'))
+
+    def mark_succeeded(self, job):
+        self._finish(job, status='succeeded', last_error='')
+
+    def mark_retry(self, job, error, run_at):
+        self._finish(job, status='queued', last_error=error, run_at=run_at)
+
+    def mark_failed(self, job, error):
+        self._finish(job, status='failed', last_error=error)
+
+    def _finish(self, job, **fields):
+        Task.objects.filter(pk=job.pk).update(
+            locked_at=None, updated_at=timezone.now(), **fields)
+
+
+def get_backend():
+    """
+    Return an instance of the backend configured in TASKS_BACKEND.
+    """
+    return import_string(settings.TASKS_BACKEND)()
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from tasks_app.worker import run_worker
+
+
+class Command(BaseCommand):
+    """
+    Run a background task worker.
+    """
+    help = 'Process queued background tasks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=100,
+            help='Maximum number of tasks claimed at once.')
+        parser.add_argument(
+            '--interval', type=float, default=1.0,
+            help='Seconds to wait when the queue is empty.')
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Process one batch and exit.')
+
+    def handle(self, *args, **options):
+        try:
+            processed = run_worker(
+                batch_size=options['batch_size'],
+                interval=options['interval'],
+                once=options['once'])
+        except KeyboardInterrupt:
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f'Processed {processed} tasks.'))
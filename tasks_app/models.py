@@ -0,0 +1,47 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Task(models.Model):
+    """
+    Model representing a queued background task of the database backend.
+
+    Fields:
+        - name: Registered name of the task function.
+        - args: Positional arguments passed to the task.
+        - kwargs: Keyword arguments passed to the task.
+        - status: Current status of the task (queued, running, succeeded, failed).
+        - attempts: Number of times the task has been started.
+        - max_retries: Number of retries allowed after a failed attempt.
+        - run_at: Earliest time the task may run.
+        - locked_at: Timestamp when a worker claimed the task.
+        - last_error: Traceback of the last failed attempt.
+        - created_at: Timestamp when the task was enqueued.
+        - updated_at: Timestamp when the task was last updated.
+    """
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('succeeded', 'Succeeded'),
+        ('failed', 'Failed'),
+    ]
+    name = models.CharField(max_length=255)
+    args = models.JSONField(blank=True, default=list)
+    kwargs = models.JSONField(blank=True, default=dict)
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default='queued')
+    attempts = models.PositiveIntegerField(default=0)
+    max_retries = models.PositiveIntegerField(default=0)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'run_at']),
+        ]
+
+    def __str__(self):
+        return f"Task {self.id}: {self.name} ({self.status})"
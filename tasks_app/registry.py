@@ -0,0 +1,92 @@
+import functools
+import importlib
+from datetime import timedelta
+
+from django.utils import timezone
+
+from tasks_app.backends import get_backend
+
+_registry = {}
+
+
+class TaskFunction:
+    """
+    Wrapper around a function registered as a background task.
+
+    Calling the wrapper runs the function inline; delay() and apply_async()
+    enqueue it on the configured backend instead.
+    """
+
+    def __init__(self, func, name=None, max_retries=0, retry_delay=60, run_every=None):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.name = name or f'{func.__module__}.{func.__name__}'
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.run_every = run_every
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def delay(self, *args, **kwargs):
+        """
+        Enqueue the task to run as soon as a worker is free.
+        """
+        return self.apply_async(args=args, kwargs=kwargs)
+
+    def apply_async(self, args=(), kwargs=None, countdown=None, eta=None):
+        """
+        Enqueue the task, optionally delayed by countdown seconds or until eta.
+        """
+        run_at = eta or timezone.now()
+        if countdown:
+            run_at += timedelta(seconds=countdown)
+        return get_backend().enqueue(self, list(args), kwargs or {}, run_at)
+
+    def get_retry_at(self, attempts):
+        """
+        Get the time of the next attempt, backing off exponentially.
+        """
+        delay = self.retry_delay * 2 ** max(attempts - 1, 0)
+        return timezone.now() + timedelta(seconds=delay)
+
+
+def task(func=None, *, name=None, max_retries=0, retry_delay=60, run_every=None):
+    """
+    Register a function as a background task.
+
+    Arguments must be JSON serializable. Use run_every (a timedelta) to let the
+    worker enqueue the task periodically.
+    """
+    def decorator(func):
+        task_function = TaskFunction(
+            func, name=name, max_retries=max_retries,
+            retry_delay=retry_delay, run_every=run_every)
+        _registry[task_function.name] = task_function
+        return task_function
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+def get_task(name):
+    """
+    Get a registered task by name, importing its module if necessary.
+    """
+    if name not in _registry:
+        module_name = name.rpartition('.')[0]
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+    if name not in _registry:
+        raise KeyError(f"Unknown task: {name}")
+    return _registry[name]
+
+
+def get_periodic_tasks():
+    """
+    Get all registered tasks that have a run_every interval.
+    """
+    return [task for task in _registry.values() if task.run_every]
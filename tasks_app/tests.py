@@ -0,0 +1,112 @@
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from tasks_app.models import Task
+from tasks_app.registry import task
+from tasks_app.worker import enqueue_periodic_tasks, run_pending
+
+calls = []
+
+
+@task
+def record_call(value):
+    calls.append(value)
+
+
+@task(max_retries=1, retry_delay=0)
+def always_fail():
+    raise RuntimeError("Task failed")
+
+
+@task(run_every=timedelta(minutes=5))
+def periodic_task():
+    calls.append('periodic')
+
+
+class TaskQueueTests(TestCase):
+    """
+    Test cases for the database task queue and the worker.
+    """
+
+    def setUp(self):
+        calls.clear()
+
+    def test_delay_enqueues_task(self):
+        """
+        Test that delay stores the task instead of running it inline.
+        """
+        record_call.delay(1)
+        job = Task.objects.get()
+        self.assertEqual(job.name, 'tasks_app.tests.record_call')
+        self.assertEqual(job.args, [1])
+        self.assertEqual(job.status, 'queued')
+        self.assertEqual(calls, [])
+
+    def test_run_pending_runs_task(self):
+        """
+        Test that the worker runs a queued task and marks it as succeeded.
+        """
+        record_call.delay(1)
+        self.assertEqual(run_pending(), 1)
+        self.assertEqual(calls, [1])
+        job = Task.objects.get()
+        self.assertEqual(job.status, 'succeeded')
+        self.assertEqual(job.attempts, 1)
+
+    def test_failed_task_is_retried_then_failed(self):
+        """
+        Test that a failing task is retried until max_retries is used up.
+        """
+        always_fail.delay()
+        run_pending()
+        job = Task.objects.get()
+        self.assertEqual(job.status, 'queued')
+        self.assertIn('Task failed', job.last_error)
+        run_pending()
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'failed')
+        self.assertEqual(job.attempts, 2)
+
+    def test_scheduled_task_waits_until_due(self):
+        """
+        Test that a task with a countdown is not run before it is due.
+        """
+        record_call.apply_async(args=[1], countdown=60)
+        self.assertEqual(run_pending(), 0)
+        Task.objects.update(run_at=timezone.now())
+        self.assertEqual(run_pending(), 1)
+        self.assertEqual(calls, [1])
+
+    def test_stale_running_task_is_released(self):
+        """
+        Test that a task locked by a crashed worker is picked up again.
+        """
+        record_call.delay(1)
+        Task.objects.update(
+            status='running', locked_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(run_pending(), 1)
+        self.assertEqual(calls, [1])
+
+    def test_periodic_task_is_enqueued_once(self):
+        """
+        Test that a periodic task is only enqueued when it is due.
+        """
+        enqueue_periodic_tasks()
+        enqueue_periodic_tasks()
+        self.assertEqual(Task.objects.filter(
+            name='tasks_app.tests.periodic_task').count(), 1)
+        run_pending()
+        enqueue_periodic_tasks()
+        self.assertEqual(Task.objects.filter(
+            name='tasks_app.tests.periodic_task').count(), 1)
+
+    @override_settings(TASKS_BACKEND='tasks_app.backends.ImmediateBackend')
+    def test_immediate_backend_runs_inline(self):
+        """
+        Test that the immediate backend runs tasks when they are enqueued.
+        """
+        record_call.delay(1)
+        self.assertEqual(calls, [1])
+        self.assertFalse(Task.objects.exists())
@@ -0,0 +1,72 @@
+import logging
+import time
+import traceback
+
+from django.db import close_old_connections
+from django.utils import timezone
+
+from tasks_app.backends import get_backend
+from tasks_app.registry import get_periodic_tasks, get_task
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_periodic_tasks(backend=None):
+    """
+    Enqueue every periodic task that is due.
+    """
+    backend = backend or get_backend()
+    now = timezone.now()
+    for task in get_periodic_tasks():
+        backend.enqueue_periodic(task, now)
+
+
+def run_job(job, backend):
+    """
+    Run one claimed job and record its outcome on the backend.
+
+    Failed jobs are retried with exponential backoff until max_retries is used up.
+    """
+    try:
+        task = get_task(job.name)
+    except KeyError as exception:
+        backend.mark_failed(job, str(exception))
+        return False
+    try:
+        task(*job.args, **job.kwargs)
+    except Exception:
+        error = traceback.format_exc()
+        logger.warning("Task %s (%s) failed", job.pk, job.name)
+        if job.attempts <= job.max_retries:
+            backend.mark_retry(job, error, task.get_retry_at(job.attempts))
+        else:
+            backend.mark_failed(job, error)
+        return False
+    backend.mark_succeeded(job)
+    return True
+
+
+def run_pending(limit=100, backend=None):
+    """
+    Claim and run up to limit due jobs. Returns the number of jobs run.
+    """
+    backend = backend or get_backend()
+    jobs = backend.claim(limit)
+    for job in jobs:
+        run_job(job, backend)
+    return len(jobs)
+
+
+def run_worker(batch_size=100, interval=1.0, once=False):
+    """
+    Run jobs until interrupted, sleeping for interval seconds when the queue is empty.
+    """
+    backend = get_backend()
+    while True:
+        close_old_connections()
+        enqueue_periodic_tasks(backend)
+        processed = run_pending(batch_size, backend)
+        if once:
+            return processed
+        if not processed:
+            time.sleep(interval)
@@ -3,6 +3,8 @@ from django.contrib.auth import get_user_model
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 
+from core.profiling import ProfiledSerializerMixin
+from core.serializers import SparseFieldsetMixin
 from ..models import Profile
 
 User = get_user_model()
@@ -57,7 +59,7 @@ class UserSerializer(serializers.ModelSerializer):
         return user
 
 
-class ProfileSerializer(serializers.ModelSerializer):
+class ProfileSerializer(ProfiledSerializerMixin, SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for user profile representation.
     Excludes password and repeated_password fields.
@@ -116,7 +118,7 @@ class ProfileSerializer(serializers.ModelSerializer):
         return instance
 
 
-class BusinessListSerializer(serializers.ModelSerializer):
+class BusinessListSerializer(ProfiledSerializerMixin, SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for listing business profiles.
     Includes only essential fields for business profiles.
@@ -141,7 +143,7 @@ class BusinessListSerializer(serializers.ModelSerializer):
         ]
 
 
-class CustomerListSerializer(serializers.ModelSerializer):
+class CustomerListSerializer(ProfiledSerializerMixin, SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for listing customer profiles.
     Includes only essential fields for customer profiles.
@@ -161,3 +163,28 @@ class CustomerListSerializer(serializers.ModelSerializer):
             "uploaded_at",
             "type"
         ]
+
+
+class UserSummarySerializer(ProfiledSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializer for a compact user summary embedded in other resources.
+    Reads the names and picture from the profile, so querysets should
+    select_related the profile.
+    """
+    user = serializers.IntegerField(source='id', read_only=True)
+    first_name = serializers.CharField(
+        source='profile.first_name', read_only=True)
+    last_name = serializers.CharField(
+        source='profile.last_name', read_only=True)
+    file = serializers.FileField(source='profile.file', read_only=True)
+
+    class Meta:
+        model = User
+        fields = [
+            "user",
+            "username",
+            "first_name",
+            "last_name",
+            "file",
+            "type"
+        ]
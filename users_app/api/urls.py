@@ -6,6 +6,7 @@ urlpatterns = [
     path('registration/', views.RegistrationView.as_view(), name='registration'),
     path('login/', views.CustomAuthToken.as_view(), name='login'),
     path('profile/<int:pk>/', views.ProfileView.as_view(), name='profile'),
+    path('profiles/', views.ProfileMultiGetView.as_view(), name='profiles'),
     path('profiles/business/', views.BusinessProfileListView.as_view(),
          name='business_profiles'),
     path('profiles/customer/', views.CustomerProfileListView.as_view(),
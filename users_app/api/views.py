@@ -7,6 +7,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.serializers import SparseFieldsetViewMixin
+from core.views import MultiGetMixin, SingleFlightMixin
 from .permissions import IsUserOrReadOnly
 from .serializers import UserSerializer, ProfileSerializer, BusinessListSerializer, CustomerListSerializer
 from ..models import Profile
@@ -87,13 +89,15 @@ class CustomAuthToken(ObtainAuthToken):
         return Response(response_data, status=status.HTTP_200_OK)
 
 
-class ProfileView(generics.RetrieveUpdateAPIView):
+class ProfileView(SingleFlightMixin, SparseFieldsetViewMixin, generics.RetrieveUpdateAPIView):
     """
     API view to retrieve and update user profiles.
 
     Allows authenticated users to view and edit their own profile.
-    Other users can only read the profile.
+    Other users can only read the profile. Identical concurrent GETs share
+    one response (see SingleFlightMixin).
     """
+    queryset = Profile.objects.select_related('user')
     serializer_class = ProfileSerializer
     permission_classes = [IsAuthenticated, IsUserOrReadOnly]
     allowed_methods = ['GET', 'PATCH']
@@ -106,7 +110,8 @@ class ProfileView(generics.RetrieveUpdateAPIView):
             Profile instance associated with the user ID.
         """
         user_id = self.kwargs['pk']
-        return get_object_or_404(Profile, user__id=user_id)
+        queryset = self.filter_queryset(self.get_queryset())
+        return get_object_or_404(queryset, user__id=user_id)
 
     def perform_update(self, serializer):
         """
@@ -119,7 +124,22 @@ class ProfileView(generics.RetrieveUpdateAPIView):
         serializer.save()
 
 
-class BusinessProfileListView(generics.ListAPIView):
+class ProfileMultiGetView(SparseFieldsetViewMixin, MultiGetMixin, generics.GenericAPIView):
+    """
+    API view to retrieve several profiles at once.
+
+    Profiles are selected by user ID with ?ids=1,2,3 and returned in that order.
+    """
+    queryset = Profile.objects.select_related('user')
+    serializer_class = ProfileSerializer
+    permission_classes = [IsAuthenticated, IsUserOrReadOnly]
+    multi_get_field = 'user_id'
+
+    def get(self, request, *args, **kwargs):
+        return self.multi_get(request, *args, **kwargs)
+
+
+class BusinessProfileListView(SparseFieldsetViewMixin, generics.ListAPIView):
     """
     API view to list all business profiles.
 
@@ -130,7 +150,7 @@ class BusinessProfileListView(generics.ListAPIView):
     queryset = Profile.objects.filter(user__type='business')
 
 
-class CustomerProfileListView(generics.ListAPIView):
+class CustomerProfileListView(SparseFieldsetViewMixin, generics.ListAPIView):
     """
     API view to list all customer profiles.
 
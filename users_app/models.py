@@ -2,6 +2,8 @@ from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.utils import timezone
 
+from events_app.models import OutboxModel
+
 
 class CustomUser(AbstractUser):
     """
@@ -32,7 +34,7 @@ class CustomUser(AbstractUser):
         return self.username
 
 
-class Profile(models.Model):
+class Profile(OutboxModel):
     """
     User profile model linked to CustomUser.
 
@@ -55,9 +57,14 @@ class Profile(models.Model):
         max_length=50, blank=True, null=False, default='')
     created_at = models.DateTimeField(auto_now_add=True)
 
+    outbox_aggregate = 'profile'
+
     def __str__(self):
         return f"{self.user.username}'s Profile"
 
+    def get_outbox_payload(self):
+        return {'id': self.pk, 'user_id': self.user_id}
+
     def save(self, *args, **kwargs):
         """        
         Override save method to set uploaded_at field when the profile is saved.
@@ -136,6 +136,38 @@ class ProfileGetTests(APITestCase):
         response = self.client.get(invalid_url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_get_profiles_by_ids(self):
+        """
+        Test retrieving several profiles in one query in the requested order.
+        Unknown IDs are left out.
+        """
+        other_user = User.objects.create_user(
+            username="otheruser",
+            email="otheruser@mail.de",
+            password="testpassword"
+        )
+        Profile.objects.create(user=other_user)
+        self.client.force_authenticate(user=self.user)
+        url = reverse('profiles') + f'?ids={other_user.pk},9999,{self.user.pk}'
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([profile['user'] for profile in response.data],
+                         [other_user.pk, self.user.pk])
+
+    def test_get_profiles_by_invalid_ids(self):
+        """
+        Test retrieving profiles with missing or invalid IDs.
+        Should return a 400 status code.
+        """
+        self.client.force_authenticate(user=self.user)
+        too_many = ','.join(str(pk) for pk in range(1, 102))
+        for query in ['', '?ids=', '?ids=1,abc', '?ids=\u00b2', '?ids=\u0663',
+                      f'?ids={too_many}', f'?ids={2 ** 63}', '?ids=' + '9' * 5000]:
+            response = self.client.get(reverse('profiles') + query)
+            self.assertEqual(response.status_code,
+                             status.HTTP_400_BAD_REQUEST)
+
     def test_get_profiles_business(self):
         """
         Test retrieval of profiles with business type.